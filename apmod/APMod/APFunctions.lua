@@ -1,4 +1,4 @@
-include( "SaveUtils" ); MY_MOD_NAME = "APMod";
+include( "SaveUtils" ); MY_MOD_NAME = "APMod"; setCacheState( 2 );
 include( "json" );
 
 AP = {}
@@ -21,6 +21,7 @@ LOWER_MINOR_CIV_ID = 22
 UPPER_MINOR_CIV_ID = 62
 BASE_CULTURE_TECH_YIELD = 1800
 MIN_TURN_SPAWN_BARBARIANS = 30
+MAX_PUSH_RESPONSE_LENGTH = 3000
 
 player = Players[Game.GetActivePlayer()]
 team = Teams[player:GetTeam()]
@@ -30,6 +31,9 @@ optionsTable = {
     settler_sanity_amount=0,
 }
 pushTable = {}
+pushJournal = {sequence=0, entries={}}
+pushEpoch = string.format("%d-%.6f", os.time(), os.clock())
+pushTableEventKeys = {death=true}
 pushTableTableKeys = {
     building=true, national_wonder=true, policy=true, policy_branch=true, promotion=true, settler=true, tech=true,
     unit=true, world_wonder=true,
@@ -38,9 +42,13 @@ textInfoTableNames = {
     building="Buildings", national_wonder="Buildings", policy=nil, policy_branch=nil, promotion="UnitPromotions",
     settler="Units", tech=nil, unit="Units", world_wonder="Buildings",
 }
+cleanTextKeys = {}
+dirtyScriptData = {}
+updateRequested = false
+localeRefreshRequested = false
 freePoliciesToGrant = 0
 barbariansToSpawn = 0
-itemTable = {}
+itemTable = {total=0, counts={}}
 locationTable = {}
 for key, _ in pairs(pushTableTableKeys) do
     locationTable[key] = {}
@@ -418,6 +426,14 @@ function OnTurnStart()
         AP.SpawnBarbarians(barbariansToSpawn)
         ChangeBarbariansToSpawn(-barbariansToSpawn)
     end
+
+    -- Store all script data that changed
+    FlushScriptData()
+end
+
+function OnTurnEnd()
+    -- Store all script data that changed, such that the autosave at the start of the next turn contains it
+    FlushScriptData()
 end
 
 function OnEndGameShow(endGameType, teamId)
@@ -484,39 +500,81 @@ end
 
 -- INTERNAL CALLABLES
 function LoadScriptData(key)
-    -- Retrieve value and return it
+    -- Retrieve value and return it, preferring a value that has not been flushed yet
+    if dirtyScriptData[key] ~= nil then
+        return dirtyScriptData[key]
+    end
     return load(player, key)
 end
 
 function SaveScriptData(key, value)
-    -- Store the value given
-    save(player, key, value)
+    -- Mark the key as dirty with the value given, such that it is only serialized once on the next flush
+    -- Flush on the next UI frame at the latest, such that no changes are lost when the game is saved without a client
+    dirtyScriptData[key] = value
+    RequestUpdate()
 end
 
-function UpdateTextInfos(tableName, locationId)
-    -- If this table plus location ID has linked IDs, update those first
+function FlushScriptData()
+    -- If no key is dirty, there is nothing to store
+    if next(dirtyScriptData) == nil then
+        return
+    end
+
+    -- Store the values of all dirty keys in the cache and mark them as clean, then serialize the script data once
+    for key, value in pairs(dirtyScriptData) do
+        save(player, key, value)
+        dirtyScriptData[key] = nil
+    end
+    sync(player)
+end
+
+function AddTextInfoUpdates(textUpdates, tableName, locationId)
+    -- If this table plus location ID has linked IDs, add their updates first
     if(textInfoLinkedIds[tableName] ~= nil and textInfoLinkedIds[tableName][locationId] ~= nil) then
         for _, linkedId in ipairs(textInfoLinkedIds[tableName][locationId]) do
-            UpdateTextInfos(tableName, linkedId)
+            AddTextInfoUpdates(textUpdates, tableName, linkedId)
         end
     end
 
-    -- Update the description and help text infos keys to their clean versions if possible
-    clean_description_key = GameInfo[tableName][locationId].Description .. "_CLEAN"
-    if Locale.ConvertTextKey(clean_description_key) ~= clean_description_key then
-        ReplaceTextKey(GameInfo[tableName][locationId].Description, Locale.ConvertTextKey(clean_description_key))
-        GameInfo[tableName][locationId].Description = clean_description_key
+    -- Add updates of the description and help text info keys to the texts of their clean versions if they have any
+    textInfo = GameInfo[tableName][locationId]
+    cleanDescriptionKey = cleanTextKeys[textInfo.Description]
+    if cleanDescriptionKey ~= nil then
+        textUpdates[textInfo.Description] = Locale.ConvertTextKey(cleanDescriptionKey)
+        textInfo.Description = cleanDescriptionKey
+    end
+    cleanHelpKey = cleanTextKeys[textInfo.Help]
+    if cleanHelpKey ~= nil then
+        textUpdates[textInfo.Help] = Locale.ConvertTextKey(cleanHelpKey)
+        textInfo.Help = cleanHelpKey
+    end
+end
+
+function ApplyTextInfoUpdates(textUpdates)
+    -- If there are no updates, return immediately
+    if next(textUpdates) == nil then
+        return
     end
-    clean_help_key = GameInfo[tableName][locationId].Help .. "_CLEAN"
-    if Locale.ConvertTextKey(clean_help_key) ~= clean_help_key then
-        ReplaceTextKey(GameInfo[tableName][locationId].Help, Locale.ConvertTextKey(clean_help_key))
-        GameInfo[tableName][locationId].Help = clean_help_key
+
+    -- Replace the texts of all keys in a single query, such that all updates are made in a single transaction
+    -- Escape single quotation marks
+    cases = {}
+    keys = {}
+    for key, value in pairs(textUpdates) do
+        table.insert(cases, table.concat({"WHEN '", key, "' THEN '", (value:gsub("'", "''")), "'"}))
+        table.insert(keys, table.concat({"'", key, "'"}))
     end
+    DB.Query(table.concat({
+        "UPDATE Language_en_US SET Text = CASE Tag ", table.concat(cases, " "), " END WHERE Tag IN (",
+        table.concat(keys, ", "), ")"
+    }))()
 end
 
-function ReplaceTextKey(key, value)
-	-- Replace text for given 'key' with provided value. Escape single quotation marks
-	DB.Query(table.concat({"UPDATE Language_en_US SET Text = '", value:gsub("'", "''"), "' WHERE Tag = '", key, "'"}))()
+function UpdateTextInfos(tableName, locationId)
+    -- Update the text infos of a single location
+    textUpdates = {}
+    AddTextInfoUpdates(textUpdates, tableName, locationId)
+    ApplyTextInfoUpdates(textUpdates)
 end
 
 function RefreshLocale()
@@ -524,19 +582,48 @@ function RefreshLocale()
 	Locale.SetCurrentLanguage(Locale.GetCurrentLanguage().Type)
 end
 
+function RequestLocaleRefresh()
+    -- Refresh the Locale language on the next UI frame, such that all requests made until then share a single refresh
+    localeRefreshRequested = true
+    RequestUpdate()
+end
+
+function RequestUpdate()
+    -- Handle all requests on the next UI frame, as the UI context only has a single update function
+    if not updateRequested then
+        updateRequested = true
+        ContextPtr:SetUpdate(OnUpdate)
+    end
+end
+
+function OnUpdate()
+    -- Stop updating every frame and store all script data that changed since it was last stored
+    ContextPtr:ClearUpdate()
+    updateRequested = false
+    FlushScriptData()
+
+    -- If requested, perform a single refresh of the Locale language
+    if localeRefreshRequested then
+        localeRefreshRequested = false
+        RefreshLocale()
+    end
+end
+
 function SyncTextInfos()
-    -- Update all text infos according to the values in the location table
+    -- Update all text infos according to the values in the location table at once
+    textUpdates = {}
     for type, tableName in pairs(textInfoTableNames) do
         if tableName ~= nil then
             for locationId, _ in pairs(locationTable[type]) do
-                UpdateTextInfos(tableName, locationId)
+                AddTextInfoUpdates(textUpdates, tableName, locationId)
             end
         end
     end
+    ApplyTextInfoUpdates(textUpdates)
 
     -- If promotion sanity is enabled, refresh the locale such that promotion action buttons are updated
     if optionsTable["promotion_sanity"] then
-        RefreshLocale()
+        RequestLocaleRefresh()
     end
 end
 
@@ -560,7 +647,7 @@ function SendLocation(type, locationId, textInfoId)
 
     -- If promotion sanity is enabled, refresh the locale such that promotion action buttons are updated
     if type == "promotion" and optionsTable["promotion_sanity"] then
-        RefreshLocale()
+        RequestLocaleRefresh()
     end
 end
 
@@ -690,6 +777,78 @@ function RequestSync()
     end
 end
 
+function TakePushEvents()
+    -- Move all events out of the push table and return them, as events are sent once instead of being journaled
+    events = {}
+    for key, _ in pairs(pushTableEventKeys) do
+        events[key] = pushTable[key]
+        pushTable[key] = nil
+    end
+    return events
+end
+
+function AppendPushJournal()
+    -- Move all non-empty values in the push table into a new journal entry with the next sequence number
+    entry = {}
+    isEmpty = true
+    for key, value in pairs(pushTable) do
+        if not pushTableEventKeys[key] and (not pushTableTableKeys[key] or #value > 0) then
+            entry[key] = value
+            isEmpty = false
+        end
+    end
+
+    -- If the push table was empty, there is nothing to append
+    if isEmpty then
+        return
+    end
+
+    -- Append the entry to the journal; save the journal; and reset the push table
+    pushJournal.sequence = pushJournal.sequence + 1
+    entry["sequence"] = pushJournal.sequence
+    table.insert(pushJournal.entries, entry)
+    SaveScriptData("push_journal", pushJournal)
+    InitPushTable()
+end
+
+function AcknowledgePushJournal(sequence)
+    -- Remove all journal entries up to and including the given sequence number
+    entries = {}
+    for _, entry in ipairs(pushJournal.entries) do
+        if entry["sequence"] > sequence then
+            table.insert(entries, entry)
+        end
+    end
+
+    -- If any entries were removed, save the journal
+    if #entries ~= #pushJournal.entries then
+        pushJournal.entries = entries
+        SaveScriptData("push_journal", pushJournal)
+    end
+end
+
+function FormatPushEntry(entry)
+    -- Loop over all pairs in the entry
+    jsonStrings = {}
+    for key, value in pairs(entry) do
+        -- If this key is another table, add as JSON array
+        if(pushTableTableKeys[key]) then
+            table.insert(jsonStrings, table.concat({'"', key, '": [', table.concat(value, ","), "]"}))
+
+            -- If this key is a string, add it as a scalar with surrounding quotations
+        elseif(type(value) == "string") then
+            table.insert(jsonStrings, table.concat({'"', key, '": "', value, '"'}))
+
+            -- Else, add the value as a scalar as is
+        else
+            table.insert(jsonStrings, table.concat({'"', key, '": ', tostring(value)}))
+        end
+    end
+
+    -- Return the entry as a single JSON object
+    return table.concat({"{", table.concat(jsonStrings, ","), "}"})
+end
+
 function InitPushTable()
     -- Empty the table
     for key, _ in pairs(pushTable) do
@@ -718,7 +877,13 @@ function SyncScriptData()
     -- Retrieve the item table from the script data
     value = LoadScriptData("item_table")
     if value ~= nil then
-        itemTable = value
+        LoadItemTable(value)
+    end
+
+    -- Retrieve the push journal from the script data
+    value = LoadScriptData("push_journal")
+    if value ~= nil then
+        pushJournal = value
     end
 
     -- Retrieve the location table from the script data
@@ -736,6 +901,34 @@ function SyncScriptData()
     end
 end
 
+function LoadCleanTextKeys()
+    -- Load all text keys that have a clean version from the SQL database
+    for row in DB.Query("SELECT Tag, CleanTag FROM APCleanTextKeys") do
+        cleanTextKeys[row.Tag] = row.CleanTag
+    end
+end
+
+function AddToItemTable(apItemId)
+    -- Increase the count of this AP item and the total count of the item table
+    itemTable.counts[apItemId] = (itemTable.counts[apItemId] or 0) + 1
+    itemTable.total = itemTable.total + 1
+end
+
+function LoadItemTable(value)
+    -- If this item table is stored as counts already, use it as is
+    if value.total ~= nil then
+        itemTable = value
+        return
+    end
+
+    -- Older saves store every received AP item ID separately, so convert them into counts and save the result
+    itemTable = {total=0, counts={}}
+    for _, apItemId in ipairs(value) do
+        AddToItemTable(apItemId)
+    end
+    SaveScriptData("item_table", itemTable)
+end
+
 function LoadOptionsTable()
     -- Load the options table from the SQL database
     for row in DB.Query("SELECT Key, Value FROM APOptions") do
@@ -999,61 +1192,76 @@ end
 function AP.UpdateItemTable(apItemIds)
     -- Store in item table that these AP items have been received
     for _, apItemId in ipairs(apItemIds) do
-        table.insert(itemTable, apItemId)
+        AddToItemTable(apItemId)
     end
     SaveScriptData("item_table", itemTable)
 end
 
 function AP.UpdateLocationTable(type, locationIds, is_finished)
     -- Mark all locations with given IDs of the provided type as checked
+    textUpdates = {}
     for _, locationId in ipairs(locationIds) do
         if locationTable[type][locationId] == nil then
             locationTable[type][locationId] = true
 
             -- If this location type uses updating text infos, update it. Settlers always update the same ID
             if textInfoTableNames[type] ~= nil then
-                UpdateTextInfos(textInfoTableNames[type], type ~= "settler" and locationId or 0)
+                AddTextInfoUpdates(textUpdates, textInfoTableNames[type], type ~= "settler" and locationId or 0)
             end
         end
     end
+    ApplyTextInfoUpdates(textUpdates)
 
     -- If this was the final update to be performed, save the location table
     if is_finished then
         SaveScriptData("location_table", locationTable)
+        FlushScriptData()
     end
 
     -- If promotion sanity is enabled, refresh the locale such that promotion action buttons are updated
     if optionsTable["promotion_sanity"] then
-        RefreshLocale()
+        RequestLocaleRefresh()
     end
 end
 
-function AP.GetPushTable()
-    -- Loop over all pairs in the push table
-    jsonStrings = {}
-    for key, value in pairs(pushTable) do
-        -- If this key is another table, add as JSON array
-        if(pushTableTableKeys[key]) then
-            table.insert(jsonStrings, table.concat({'"', key, '": [', table.concat(value, ","), "]"}))
-
-            -- If this key is a string, add it as a scalar with surrounding quotations
-        elseif(type(value) == "string") then
-            table.insert(jsonStrings, table.concat({'"', key, '": "', value, '"'}))
+function AP.GetPushTable(epoch, acknowledgedSequence)
+    -- Remove all journal entries the client acknowledged to have processed, and append the push table to the journal
+    -- Acknowledgements made for another epoch refer to the journal before the game was loaded, so ignore them
+    if epoch == pushEpoch and acknowledgedSequence ~= nil then
+        AcknowledgePushJournal(acknowledgedSequence)
+    end
+    events = TakePushEvents()
+    AppendPushJournal()
 
-            -- Else, add the value as a scalar as is
-        else
-            table.insert(jsonStrings, table.concat({'"', key, '": ', tostring(value)}))
+    -- Add the oldest unacknowledged journal entries until the response would become too long for the client
+    entryStrings = {}
+    length = 0
+    for _, entry in ipairs(pushJournal.entries) do
+        entryString = FormatPushEntry(entry)
+        if(#entryStrings > 0 and length + #entryString > MAX_PUSH_RESPONSE_LENGTH) then
+            break
         end
+        table.insert(entryStrings, entryString)
+        length = length + #entryString
     end
 
-    -- Print the response as a single JSON object and reset the push table
-    PrintResponse(table.concat({"{", table.concat(jsonStrings, ","), "}"}))
-    InitPushTable()
+    -- Print the response as a single JSON object. Entries are kept until the client acknowledges them, events are not
+    PrintResponse(table.concat({
+        '{"epoch": "', pushEpoch, '", "entries": [', table.concat(entryStrings, ","), '], "events": ',
+        FormatPushEntry(events), "}"
+    }))
+
+    -- Store all script data that changed since the client last polled
+    FlushScriptData()
 end
 
 function AP.GetItemTable()
-    -- Print the item table contents as a single JSON array in a JSON object
-    PrintResponse(table.concat({'{"items": [', table.concat(itemTable, ","), "]}"}))
+    -- Print the counts of the item table as a single JSON object of the count of every AP item ID
+    counts = {}
+    for apItemId, count in pairs(itemTable.counts) do
+        table.insert(counts, table.concat({'"', apItemId, '": ', count}))
+    end
+    PrintResponse(table.concat({'{"total": ', itemTable.total, ', "counts": {', table.concat(counts, ","), "}}"}))
 end
 
 function AP.SendDeathLink(deathLinkEffect, deathLinkEffectAmount, message)
@@ -1173,6 +1381,7 @@ end
 function Init()
     -- Register event functions
     Events.ActivePlayerTurnStart.Add(OnTurnStart)
+    Events.ActivePlayerTurnEnd.Add(OnTurnEnd)
     Events.TechAcquired.Add(OnTechAcquired)
     Events.EndGameShow.Add(OnEndGameShow)
     Events.NotificationAdded.Add(OnNotificationAdded)
@@ -1197,6 +1406,9 @@ function Init()
     -- Load options table
     LoadOptionsTable()
 
+    -- Load clean text keys
+    LoadCleanTextKeys()
+
     -- Set correct death link trigger
     SetDeathLinkTrigger()
 
@@ -1,10 +1,10 @@
 # %% IMPORTS
-from .helpers import run_client
+from .helpers import prune_mods, run_client
 from .world import CivVWorld
 
 
 # %% COMPONENT DEFINITIONS
-# Register the run_client function as a client component
+# Register the run_client function as a client component and the prune_mods function as a CLI tool
 from worlds.LauncherComponents import Component, SuffixIdentifier, Type, components, icon_paths
 from .constants import CONTAINER_EXTENSION, GAME_NAME
 components.append(
@@ -17,4 +17,13 @@ components.append(
         description=f"A client for connecting to {GAME_NAME}",
     )
 )
+components.append(
+    Component(
+        display_name="Civ V Prune Mods",
+        func=prune_mods,
+        component_type=Type.TOOL,
+        cli=True,
+        description=f"Removes the least recently used {GAME_NAME} AP mods from the mods folder",
+    )
+)
 icon_paths[GAME_NAME] = "ap:worlds.civv/assets/civv.png"
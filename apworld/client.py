@@ -81,7 +81,7 @@ class CivVClient:
         # If the mod is ready and was not ready before, store and send this to the client's console
         if _id == self.ctx.slot_data.output_file_id:
             if not self.mod_is_ready:
-                self.ctx.received_item_ids = await self.tuner.get_item_table()
+                self.ctx.received_item_counts = await self.tuner.get_item_table()
                 self._mod_is_ready = True
                 logger.info("Civ V AP Mod is connected and ready")
                 await self.tuner.send_notification(
@@ -329,19 +329,47 @@ class CivVClient:
 
         """
 
-        # Retrieve the push table and process its contents
-        push_table = await self.tuner.get_push_table()
+        # Retrieve all push table entries that have not been acknowledged yet, acknowledging all processed entries
+        epoch, push_entries, push_events = await self.tuner.get_push_table(self.ctx.push_epoch, self.ctx.push_sequence)
+
+        # If the game was loaded since the last call, its journal may be of an earlier point in time
+        # Process all of its entries again, which only ever contain requests that can safely be repeated
+        if epoch != self.ctx.push_epoch:
+            self.ctx.push_epoch = epoch
+            self.ctx.push_sequence = 0
+
+        # Process all entries that have not been processed yet
+        for push_table in push_entries:
+            # If this entry was processed already, but the acknowledgement did not reach the game yet, skip it
+            sequence = push_table.pop("sequence")
+            if sequence <= self.ctx.push_sequence:
+                continue
+
+            # Process the contents of this entry
+            await self._process_push_entry(push_table)
+            self.ctx.push_sequence = sequence
+
+        # Process all events, which are only ever retrieved once
+        await self._process_push_entry(push_events)
+
+    async def _process_push_entry(self, push_table: dict[str, Any]) -> None:
+        """
+        Processes a single entry of the push table and acts upon its requests.
+
+        """
+
         for key, value in push_table.items():
             match key:
                 # If a full game sync was requested, perform it
                 case "sync":
                     await self._perform_sync(push_table)
 
-                # If victory was achieved
+                # If victory was achieved and was not sent yet, as it is journaled and may be repeated
                 case "victory":
                     # Send message that player has goaled their game
-                    await self.ctx.send_msgs([{"cmd": "StatusUpdate", "status": ClientStatus.CLIENT_GOAL}])
-                    self.ctx.has_achieved_victory = True
+                    if not self.ctx.has_achieved_victory:
+                        await self.ctx.send_msgs([{"cmd": "StatusUpdate", "status": ClientStatus.CLIENT_GOAL}])
+                        self.ctx.has_achieved_victory = True
 
                 # If a death link was triggered
                 case "death":
@@ -372,7 +400,7 @@ class CivVClient:
         for location_id_to_mark in self.ctx.checked_locations:
             # Retrieve the corresponding location and store the ID if it is not already in the location_table
             location = LOCATIONS_DATA_BY_ID[location_id_to_mark]
-            if location.game_id not in location_table[location.type]:
+            if location.game_id not in location_table.get(location.type, ()):
                 locations_to_mark[location.type].append(location.game_id)
 
         # Mark everything at once, as it is far more efficient
@@ -398,7 +426,7 @@ class CivVClient:
             await self.tuner.update_location_table(*items[-1], is_finished=True)
 
         # Set received_items to the item table in the game
-        self.ctx.received_item_ids = await self.tuner.get_item_table()
+        self.ctx.received_item_counts = await self.tuner.get_item_table()
 
     @update_func
     async def process_sent_items(self) -> None:
@@ -422,7 +450,7 @@ class CivVClient:
 
         # Process all queued death links
         while self.ctx.queued_death_links:
-            effect = self.ctx.death_link_effect_list[random.randint(0, self.ctx.n_death_links_effects-1)]
+            effect = self.ctx.death_link_effect_sampler.sample(random)
             await self.tuner.send_death_link(effect.type, effect.amount, self.ctx.queued_death_links.pop(0))
 
     @update_func
@@ -438,7 +466,7 @@ class CivVClient:
         promotions_to_send = []
         techs_to_send = []
         settlers_to_send = 0
-        items_to_receive = self.ctx.items_received[len(self.ctx.received_item_ids):]
+        items_to_receive = self.ctx.items_received[self.ctx.received_item_counts.total():]
         messages = []
         item_ids = []
         for network_item in items_to_receive:
@@ -450,19 +478,19 @@ class CivVClient:
             # Retrieve the ID to send to the player according to its item type
             match item.type:
                 case CivVItemType.era | CivVItemType.tech:
-                    techs_to_send.append(item.game_ids[self.ctx.received_item_ids.count(network_item.item)])
+                    techs_to_send.append(item.get_game_id(self.ctx.received_item_counts[network_item.item]))
                 case CivVItemType.policy:
-                    policies_to_send.append(item.game_ids[self.ctx.received_item_ids.count(network_item.item)])
+                    policies_to_send.append(item.get_game_id(self.ctx.received_item_counts[network_item.item]))
                 case CivVItemType.promotion:
-                    promotions_to_send.append(item.game_ids[self.ctx.received_item_ids.count(network_item.item)])
+                    promotions_to_send.append(item.get_game_id(self.ctx.received_item_counts[network_item.item]))
                 case CivVItemType.settler:
                     settlers_to_send += 1
                 case CivVItemType.bonus | CivVItemType.trap:
                     for name, value in item.action.items():
                         filler_to_send[name] += value
 
-            # Add ID to list of received IDs to account for multiple progressive items being sent at once
-            self.ctx.received_item_ids.append(network_item.item)
+            # Count this ID as received to account for multiple progressive items being sent at once
+            self.ctx.received_item_counts[network_item.item] += 1
 
         # Grant all policies; promotions; and techs at once, as it is far more efficient
         if policies_to_send:
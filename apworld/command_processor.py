@@ -11,3 +11,23 @@ class CivVCommandProcessor(ClientCommandProcessor):
     Command processor for Civ V.
 
     """
+
+    def _cmd_prune_mods(self, max_count: str = "", max_size: str = "") -> bool:
+        """Remove the least recently used Civ V AP mods until at most the given number of mods with the given total size
+        in MB are installed. Without limits, the limits given in the host.yaml are used."""
+        from .container import CivVContainer
+
+        # Parse the limits
+        try:
+            limits = [int(x) if x else None for x in (max_count, max_size)]
+        except ValueError:
+            self.output("Limits must be whole numbers")
+            return False
+
+        # Prune all installed mods, except for the ones of the active slot
+        removed = CivVContainer.prune_mods([x for x in (self.ctx.auth, self.ctx.username) if x], *limits)
+        if removed:
+            self.output(f"Removed {len(removed)} Civ V AP mod(s): {', '.join(x.name for x in removed)}")
+        else:
+            self.output("No Civ V AP mods had to be removed")
+        return True
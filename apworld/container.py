@@ -1,27 +1,29 @@
 # %% IMPORTS
 import functools
+import hashlib
+import io
 import itertools
 import json
 import pkgutil
 import platform
 import shutil
-import tempfile
+import time
 import zipfile
+from collections.abc import Collection
 from pathlib import Path
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, BinaryIO
 from xml.etree import ElementTree
 
-from BaseClasses import Item, ItemClassification
+from BaseClasses import Item
 from worlds.Files import APPlayerContainer
 
 from .constants import CONTAINER_EXTENSION, GAME_NAME
-from .enums import (
-    CivVLocationType,
-    CivVItemClassificationColors,
-    CivVItemClassificationFlags,
-    CivVItemClassificationNames,
-)
+from .database import compile_sql, parse_xml
+from .dataclasses import CivVModInstall
+from .enums import CivVLocationType
+from .exceptions import TemplateException
 from .locations import LOCATIONS_DATA
+from .mods import CivVModIndex
 from .regions import (
     ANCIENT_ERA,
     ATOMIC_ERA,
@@ -33,6 +35,7 @@ from .regions import (
     RENAISSANCE_ERA,
     CivVRegionData,
 )
+from .rendering import CivVItemFormatter, CivVTemplate, clean_text
 if TYPE_CHECKING:
     from .world import CivVWorld
 
@@ -46,7 +49,8 @@ class CivVContainer(APPlayerContainer):
     patch_file_ending = CONTAINER_EXTENSION
 
     # Additional class attributes
-    AP_MOD_TEMPLATE_FILES: list[str] = [
+    AP_MOD_TEMPLATE_FILES: tuple[str, ...] = (
+        "templates/apmod/APCleanTextKeys.xml",
         "templates/apmod/APFunctions.lua",
         "templates/apmod/APOptions.xml",
         "templates/apmod/Buildings.xml",
@@ -84,20 +88,47 @@ class CivVContainer(APPlayerContainer):
         "templates/apmod/Icons/AP_Tech_128.dds",
         "templates/apmod/Icons/AP_Tech_214.dds",
         "templates/apmod/Icons/AP_Tech_256.dds",
-    ]
+    )
     "List of paths of all Civ V AP Mod template files"
     AP_MOD_NAME: str = "apmod"
     "Name of the Civ V AP Mod"
-    XML_CHARS_SUBSTITUTIONS: dict[str, str] = {
-        '"': "'",
-        "&": "&amp;",
-        "<": "&lt;",
-        ">": "&gt;",
-        "{": "",
-        "}": "",
+    MOD_HASH_FILE_NAME: str = ".apcivv_hash"
+    "Name of the file in an installed Civ V AP Mod that stores the hash of its mod files"
+    DATABASE_SQL_FILE_NAME: str = "APDatabase.sql"
+    "Name of the SQL file in the Civ V AP Mod that holds all database changes, if they are not written as XML files"
+    LOGIC_FILE_NAME: str = "logic.json"
+    "Name of the file that stores the compiled logic of the slot, for use by trackers and external solvers"
+    ZIP_DATE_TIME: tuple[int, int, int, int, int, int] = (1980, 1, 1, 0, 0, 0)
+    "Modification time used for all files written to the container, such that the same seed yields identical files"
+    STATIC_COMPRESS_LEVEL: int = 9
+    "Deflate level of files that are the same for every slot, which are only compressed once per process"
+    RENDERED_COMPRESS_LEVEL: int = 6
+    "Deflate level of files that are rendered for every slot"
+    OPTION_SUBSTITUTION_KEYS: tuple[str, ...] = (
+        "policy_cost_modifier",
+        "option_death_link",
+        "option_death_link_trigger",
+        "option_promotion_sanity",
+        "option_satellites_meets_all",
+        "option_settler_sanity",
+        "option_settler_sanity_amount",
+        "policy_collective_rule_free_settler",
+        "handicap_settler_goodies_free_settler",
+    )
+    "Keys of all substitutions that are determined by the options of a slot"
+    LOCATION_SUBSTITUTION_SUFFIXES: dict[CivVLocationType, tuple[str, ...]] = {
+        CivVLocationType.building: ("location", "flag"),
+        CivVLocationType.national_wonder: ("location", "flag"),
+        CivVLocationType.world_wonder: ("location", "flag"),
+        CivVLocationType.policy_branch: ("item",),
+        CivVLocationType.policy: ("item", "flag"),
+        CivVLocationType.promotion: ("location", "flag"),
+        CivVLocationType.settler: ("location", "flag"),
+        CivVLocationType.tech: ("item", "flag", "cost"),
+        CivVLocationType.unit: ("location", "flag"),
     }
-    "Substitution dict for invalid XML characters"
-    SETTLER_SANITY_ERAS: list[CivVRegionData] = [
+    "Suffixes of the keys of all substitutions that are made for each location, separated by location type"
+    SETTLER_SANITY_ERAS: tuple[CivVRegionData, ...] = (
         ANCIENT_ERA,
         CLASSICAL_ERA,
         CLASSICAL_ERA,
@@ -118,7 +149,7 @@ class CivVContainer(APPlayerContainer):
         INFORMATION_ERA,
         INFORMATION_ERA,
         INFORMATION_ERA,
-    ]
+    )
     "Eras for each settler to train in settler sanity"
 
     def __init__(self, path: Path, world: "CivVWorld | None", **kwargs):
@@ -130,14 +161,28 @@ class CivVContainer(APPlayerContainer):
         self.world: "CivVWorld | None" = world
         "The instance of the Civ V AP world to use for this container"
 
-    @classmethod
-    def clean_text(cls, text: str) -> str:
+    @functools.cached_property
+    def item_formatter(self) -> CivVItemFormatter:
+        """
+        Item formatter of this container, compiled from the options of its world.
+
+        """
+
+        return CivVItemFormatter(
+            player=self.world.player,
+            player_names=self.world.multiworld.player_name,
+            disguise_traps=bool(self.world.options.disguise_traps),
+            item_hints=self.world.options.item_hints.current_key,
+        )
+
+    @staticmethod
+    def clean_text(text: str) -> str:
         """
         Clean the given `text` into a version that is safe for XML.
 
         """
 
-        return functools.reduce(lambda x, y: x.replace(y[0], y[1]), cls.XML_CHARS_SUBSTITUTIONS.items(), text)
+        return clean_text(text)
 
     def _get_formatted_item(self, item: Item) -> str:
         """
@@ -145,26 +190,7 @@ class CivVContainer(APPlayerContainer):
 
         """
 
-        # If traps are to be disguised, use progression instead of trap
-        classification = item.classification
-        if classification == ItemClassification.trap and self.world.options.disguise_traps:
-            classification = ItemClassification.progression
-
-        # Format the item into a string depending on the hint mode
-        color = CivVItemClassificationColors.get_color(classification)
-        match self.world.options.item_hints:
-            case "full":
-                player_name = (
-                    f"{self.clean_text(self.world.multiworld.player_name[item.player])}'s"
-                    if item.player != self.world.player else "Your"
-                )
-                return f"{player_name} [{color}]{self.clean_text(item.name)}[ENDCOLOR]"
-            case "classification":
-                return f"A [{color}]{CivVItemClassificationNames.get_name(classification)} item[ENDCOLOR]"
-            case "none":
-                return f"An [{CivVItemClassificationColors.default}]item[ENDCOLOR]"
-            case _:
-                raise NotImplementedError
+        return self.item_formatter.format_item(item)
 
     def _get_formatted_item_flag(self, item: Item) -> str:
         """
@@ -172,19 +198,7 @@ class CivVContainer(APPlayerContainer):
 
         """
 
-        # If traps are to be disguised, use progression instead of trap
-        classification = item.classification
-        if classification == ItemClassification.trap and self.world.options.disguise_traps:
-            classification = ItemClassification.progression
-
-        # Format the item flag into a string depending on the hint mode
-        match self.world.options.item_hints:
-            case "full" | "classification":
-                return f"[{CivVItemClassificationFlags.get_flag(classification)}] "
-            case "none":
-                return f"[{CivVItemClassificationFlags.default}] "
-            case _:
-                raise NotImplementedError
+        return self.item_formatter.format_flag(item)
 
     def _get_location_description_building(self, item: Item) -> str:
         """
@@ -253,11 +267,9 @@ class CivVContainer(APPlayerContainer):
         # If settler sanity is enabled, free settlers cannot be obtained from policy Collective Rule or Goody Huts
         if self.world.options.settler_sanity:
             policy_collective_rule = '<Delete PolicyType="POLICY_COLLECTIVE_RULE" UnitClassType="UNITCLASS_SETTLER"/>'
-            goody_hut = '<Delete Type="GOODY_SETTLER"/>'
             handicap_settler_goodies = '<Delete HandicapType="HANDICAP_SETTLER" GoodyType="GOODY_SETTLER"/>'
         else:
             policy_collective_rule = ""
-            goody_hut = ""
             handicap_settler_goodies = ""
 
         # Create dict holding all substitutions
@@ -270,7 +282,6 @@ class CivVContainer(APPlayerContainer):
             "option_settler_sanity": json.dumps(bool(self.world.options.settler_sanity)),
             "option_settler_sanity_amount": json.dumps(int(self.world.options.settler_sanity_amount)),
             "policy_collective_rule_free_settler": policy_collective_rule,
-            "goody_hut_free_settler": goody_hut,
             "handicap_settler_goodies_free_settler": handicap_settler_goodies,
         }
         settler_locations: dict[int, tuple[str, str]] = {}
@@ -360,50 +371,371 @@ class CivVContainer(APPlayerContainer):
         # Return the substitution dict
         return dct
 
-    def write_contents(self, opened_zipfile: zipfile.ZipFile) -> None:
-        # Obtain the substitution dict
-        substitution_dict = self._get_substitution_dict()
+    @classmethod
+    def get_substitution_keys(cls) -> frozenset[str]:
+        """
+        Returns the keys of all substitutions that are made in the XML template files.
 
-        # Copy over the entire contents of the APMod directory
-        for filepath in self.AP_MOD_TEMPLATE_FILES:
-            # Act according to the extension of this file
+        """
+
+        return frozenset(itertools.chain(cls.OPTION_SUBSTITUTION_KEYS, (
+            f"{location.database_key_prefix}_{suffix}"
+            for location in LOCATIONS_DATA
+            for suffix in cls.LOCATION_SUBSTITUTION_SUFFIXES.get(location.type, ())
+        )))
+
+    @classmethod
+    @functools.cache
+    def get_template_files(cls) -> tuple[tuple[str, str, bytes | str | CivVTemplate], ...]:
+        """
+        Returns the path in the container; extension; and contents of all Civ V AP Mod template files.
+
+        The template files are only read and parsed once per process, after which they are shared by all containers.
+        Lua files are decoded and XML files are parsed into a :class:`CivVTemplate`. All other files are kept as is.
+
+        Raises:
+            TemplateException: If the XML template files use a substitution key that is never made, or do not use a
+                substitution key that is made.
+
+        """
+
+        # Read and parse all template files
+        template_files: list[tuple[str, str, bytes | str | CivVTemplate]] = []
+        for filepath in cls.AP_MOD_TEMPLATE_FILES:
             contents = pkgutil.get_data(__name__, filepath)
             zip_path = filepath.replace("templates/", "")
-            match filepath.rsplit(".", 1)[1]:
-                # For Lua files, we want to insert the output file ID into the file
+            extension = filepath.rsplit(".", 1)[1]
+            match extension:
                 case "lua":
-                    new_contents = contents.decode().replace("<insert_output_file_id>", self.world.output_file_id)
-                    opened_zipfile.writestr(zip_path, new_contents)
+                    template_files.append((zip_path, extension, contents.decode()))
+                case "xml":
+                    template_files.append((zip_path, extension, CivVTemplate(contents.decode(), zip_path)))
+                case _:
+                    template_files.append((zip_path, extension, contents))
+
+        # Check that the XML template files use exactly all substitution keys
+        used_keys = frozenset().union(*(x[2].field_names for x in template_files if x[1] == "xml"))
+        substitution_keys = cls.get_substitution_keys()
+        if missing_keys := used_keys - substitution_keys:
+            raise TemplateException(f"Template files use unknown substitution keys: {sorted(missing_keys)}")
+        if unused_keys := substitution_keys - used_keys:
+            raise TemplateException(f"Template files do not use substitution keys: {sorted(unused_keys)}")
+
+        # Return all template files
+        return tuple(template_files)
+
+    @classmethod
+    @functools.cache
+    def get_database_files(cls) -> tuple[str, ...]:
+        """
+        Returns the paths in the container of all XML files that update the Civ V database, in the order in which they
+        are loaded by the modinfo file.
+
+        """
+
+        modinfo = next(x[2] for x in cls.get_template_files() if x[1] == "modinfo")
+        return tuple(
+            f"{cls.AP_MOD_NAME}/{x.text}" for x in ElementTree.fromstring(modinfo).iterfind("Actions/*/UpdateDatabase")
+        )
+
+    @classmethod
+    @functools.cache
+    def get_static_files(cls, sql_database_updates: bool = False) -> tuple[tuple[str, bytes], ...]:
+        """
+        Returns the paths in the container and contents of all template files that are the same for every slot.
+
+        These are all Lua files without the output file ID; all XML files without substitutions; and all other files.
+        If `sql_database_updates` is True, all database XML files and the modinfo file are rendered for every slot
+        instead.
+
+        """
 
-                # For XML files, we want to use the file as a template and substitute all appropriate data
+        static_files: list[tuple[str, bytes]] = []
+        for zip_path, extension, contents in cls.get_template_files():
+            match extension:
+                case "lua":
+                    if "<insert_output_file_id>" not in contents:
+                        static_files.append((zip_path, contents.encode()))
                 case "xml":
-                    new_contents = contents.decode().format(**substitution_dict)
-                    opened_zipfile.writestr(zip_path, new_contents)
+                    if not contents.field_names and not (
+                            sql_database_updates and zip_path in cls.get_database_files()
+                    ):
+                        static_files.append((zip_path, contents.render({}).encode()))
+                case "modinfo":
+                    if not sql_database_updates:
+                        static_files.append((zip_path, contents))
+                case _:
+                    static_files.append((zip_path, contents))
+        return tuple(static_files)
+
+    @classmethod
+    @functools.cache
+    def get_static_archive(cls, sql_database_updates: bool = False) -> bytes:
+        """
+        Returns a zip archive containing all static files, compressed with :attr:`STATIC_COMPRESS_LEVEL`.
+
+        The archive is only created once per process and copied byte for byte into every container, such that static
+        files are not compressed again for every slot.
+
+        """
+
+        with io.BytesIO() as archive:
+            with zipfile.ZipFile(archive, "w", cls.compression_method, True, cls.STATIC_COMPRESS_LEVEL) as zf:
+                for zip_path, contents in cls.get_static_files(sql_database_updates):
+                    cls._write_file(zf, zip_path, contents, cls.STATIC_COMPRESS_LEVEL)
+            return archive.getvalue()
+
+    @property
+    def sql_database_updates(self) -> bool:
+        """
+        Whether the database changes of this container are written as a single SQL file instead of XML files.
+
+        """
+
+        return bool(self.world.settings.sql_database_updates)
+
+    def render_files(self) -> list[tuple[str, bytes]]:
+        """
+        Renders all files of this container that are specific to its slot and returns their paths in the container and
+        contents, in order.
+
+        Rendering only reads from the world of this container and the shared template files, such that the containers
+        of multiple slots can be rendered concurrently.
+
+        """
 
-                # For everything else, simply copy over the full file without modifications
+        # Obtain the substitution dict
+        substitution_dict = self._get_substitution_dict()
+        sql_database_updates = self.sql_database_updates
+        database_files = self.get_database_files()
+
+        # Render all slot specific files of the APMod directory
+        files: list[tuple[str, bytes]] = []
+        database_xml: dict[str, str] = {}
+        for zip_path, extension, contents in self.get_template_files():
+            # Act according to the extension of this file
+            match extension:
+                # For Lua files, we want to insert the output file ID into the file
+                case "lua" if "<insert_output_file_id>" in contents:
+                    new_contents = contents.replace("<insert_output_file_id>", self.world.output_file_id)
+                    files.append((zip_path, new_contents.encode()))
+
+                # For database XML files written as SQL, we want to render the template to convert it later
+                case "xml" if sql_database_updates and zip_path in database_files:
+                    database_xml[zip_path] = contents.render(substitution_dict)
+
+                # For XML files, we want to render the template with all appropriate data
+                case "xml" if contents.field_names:
+                    files.append((zip_path, contents.render(substitution_dict).encode()))
+
+                # Everything else is a static file, which is not rendered
                 case _:
-                    opened_zipfile.writestr(zip_path, contents)
+                    pass
+
+        # Convert all database XML files into a single SQL file and load that in the modinfo file instead
+        if sql_database_updates:
+            sql = compile_sql(itertools.chain.from_iterable(parse_xml(database_xml[x]) for x in database_files))
+            files.append((f"{self.AP_MOD_NAME}/{self.DATABASE_SQL_FILE_NAME}", sql.encode()))
+            files.append(self._render_sql_modinfo(sql.encode()))
+
+        # Render the compiled logic of this slot
+        logic = json.dumps(self.world.get_compiled_logic(), separators=(",", ":"), sort_keys=True)
+        files.append((self.LOGIC_FILE_NAME, logic.encode()))
+
+        # Return all rendered files
+        return files
+
+    def _render_sql_modinfo(self, sql: bytes) -> tuple[str, bytes]:
+        """
+        Renders the modinfo file that loads the given `sql` file instead of the database XML files, and returns its
+        path in the container and contents.
+
+        """
+
+        # Parse the modinfo template
+        zip_path, _, contents = next(x for x in self.get_template_files() if x[1] == "modinfo")
+        root = ElementTree.fromstring(contents)
+        database_files = {x.removeprefix(f"{self.AP_MOD_NAME}/") for x in self.get_database_files()}
+
+        # Replace all database XML files by the SQL file
+        files = root.find("Files")
+        for file in [x for x in files if x.text in database_files]:
+            files.remove(file)
+        sql_file = ElementTree.SubElement(files, "File", {"md5": hashlib.md5(sql).hexdigest().upper(), "import": "0"})
+        sql_file.text = self.DATABASE_SQL_FILE_NAME
+
+        # Replace all database updates by a single update with the SQL file
+        for actions in root.find("Actions"):
+            updates = [x for x in actions if x.tag == "UpdateDatabase" and x.text in database_files]
+            if updates:
+                updates[0].text = self.DATABASE_SQL_FILE_NAME
+                for update in updates[1:]:
+                    actions.remove(update)
+
+        # Return the rendered modinfo file
+        return zip_path, ElementTree.tostring(root, encoding="utf-8", xml_declaration=True)
+
+    @classmethod
+    def _write_file(cls, opened_zipfile: zipfile.ZipFile, zip_path: str, contents: bytes, compresslevel: int) -> None:
+        """
+        Writes a file with the given `zip_path` and `contents` to the provided `opened_zipfile`, using a fixed
+        modification time and the given `compresslevel`.
+
+        """
+
+        zip_info = zipfile.ZipInfo(zip_path, date_time=cls.ZIP_DATE_TIME)
+        zip_info.external_attr = 0o600 << 16
+        opened_zipfile.writestr(
+            zip_info, contents, compress_type=opened_zipfile.compression, compresslevel=compresslevel
+        )
+
+    def write(self, file: str | BinaryIO | None = None) -> None:
+        # Determine where to write the container to
+        zip_file = file if file else self.path
+        if not zip_file:
+            raise FileNotFoundError(f"Cannot write {self.__class__.__name__} due to no path provided.")
+
+        # Start the container with a copy of the static archive and append all other files to it
+        if isinstance(zip_file, (str, Path)):
+            Path(zip_file).write_bytes(self.get_static_archive(self.sql_database_updates))
+        else:
+            zip_file.write(self.get_static_archive(self.sql_database_updates))
+        with zipfile.ZipFile(zip_file, "a", self.compression_method, True, self.compression_level) as zf:
+            if file:
+                self.path = zf.filename
+            self.write_contents(zf)
+
+    def write_contents(self, opened_zipfile: zipfile.ZipFile) -> None:
+        # Write all static files that were not copied from the static archive
+        written_files = set(opened_zipfile.namelist())
+        for zip_path, contents in self.get_static_files(self.sql_database_updates):
+            if zip_path not in written_files:
+                self._write_file(opened_zipfile, zip_path, contents, self.STATIC_COMPRESS_LEVEL)
+
+        # Write all rendered files
+        for zip_path, contents in self.render_files():
+            self._write_file(opened_zipfile, zip_path, contents, self.RENDERED_COMPRESS_LEVEL)
 
         # Call super method
         super().write_contents(opened_zipfile)
 
     def read_contents(self, opened_zipfile: zipfile.ZipFile) -> dict[str, Any]:
-        # Get path to mods folder
+        # Call super method
+        manifest = super().read_contents(opened_zipfile)
+
+        # Get path to mods folder and its index of installed mods
         from .world import CivVWorld
         mods_folder_path = Path(CivVWorld.settings.mods_folder_path)
+        mod_index = CivVModIndex.load(mods_folder_path, self.AP_MOD_NAME, self.MOD_HASH_FILE_NAME)
+
+        # Install the mod if needed, and remove the least recently used other mods if there are too many installed
+        mod_install = self.install_mod(opened_zipfile, mod_index)
+        self._prune_mods(mod_index, {mod_install.name})
+
+        # Return the manifest
+        return manifest
+
+    def install_mod(self, opened_zipfile: zipfile.ZipFile, mod_index: CivVModIndex) -> CivVModInstall:
+        """
+        Installs the mod in the given `opened_zipfile` to the mods folder of the provided `mod_index`, unless it is
+        installed already, and returns its install.
+
+        The install is marked as used and the index is saved afterward.
+
+        """
 
         # Determine the name the mod should have. On Linux, make sure it is lowercase
+        mods_folder_path = mod_index.mods_folder_path
         zip_name = self.path.name.rsplit('.', 1)[0]
         mod_name = f"{self.AP_MOD_NAME} - {zip_name}"
         if platform.system() == "Linux":
             mod_name = mod_name.lower()
         mod_path = mods_folder_path / mod_name
 
-        # If the mod does not exist yet, we need to create it from the output file
-        if not mod_path.exists():
-            # Extract all mod files to a temporary directory
-            tempdir = Path(tempfile.mkdtemp())
+        # Mods installed by older clients have no hash file, but were installed from this same output file
+        # Keep these installs as they are and only store their hash, such that saves using them keep loading
+        mod_hash = self._get_mod_hash(opened_zipfile)
+        mod_install = mod_index.get(mod_name)
+        hash_path = mod_path / self.MOD_HASH_FILE_NAME
+        if mod_install is not None and not mod_install.hash and mod_path.exists() and not hash_path.exists():
+            _ = hash_path.write_text(mod_hash)
+            mod_install.hash = mod_hash
+            mod_install.player = self.player
+            mod_install.player_name = self.player_name
+
+        # If the mod is not installed yet or its install is stale, install it from the output file
+        # Civ V saves refer to the version of the mod, so a mod that replaces an install or a pruned install keeps its
+        # version
+        if mod_install is None or mod_install.hash != mod_hash or not hash_path.exists():
+            version = mod_index.get_version(mod_name)
+            self._install_mod(opened_zipfile, mod_index, mod_path, zip_name, mod_hash, version)
+            mod_install = CivVModInstall(
+                name=mod_name,
+                version=version,
+                hash=mod_hash,
+                player=self.player,
+                player_name=self.player_name,
+                installed=time.time(),
+                size=sum(x.file_size for x in opened_zipfile.infolist() if x.filename.startswith(self.AP_MOD_NAME)),
+            )
+            mod_index.add(mod_install)
+
+        # Mark the mod as used and return its install
+        mod_install.last_used = time.time()
+        mod_index.save()
+        return mod_install
+
+    def _get_mod_hash(self, opened_zipfile: zipfile.ZipFile) -> str:
+        """
+        Returns the hash of the contents of all mod files in the given `opened_zipfile`.
+
+        The hash is determined from the names; sizes; and CRCs of all mod files, such that no file has to be read.
+
+        """
+
+        mod_hash = hashlib.sha256()
+        for zip_info in sorted(opened_zipfile.infolist(), key=lambda x: x.filename):
+            if zip_info.filename.startswith(self.AP_MOD_NAME):
+                mod_hash.update(f"{zip_info.filename}:{zip_info.file_size}:{zip_info.CRC}\n".encode())
+        return mod_hash.hexdigest()
+
+    def _install_mod(
+            self,
+            opened_zipfile: zipfile.ZipFile,
+            mod_index: CivVModIndex,
+            mod_path: Path,
+            zip_name: str,
+            mod_hash: str,
+            version: int,
+    ) -> None:
+        """
+        Installs the mod in the given `opened_zipfile` to the provided `mod_path`, replacing any existing install.
+
+        All mod files are first written with their final names to a staging directory in the temporary folder of the
+        `mod_index`, which is then renamed into place, such that a half-written mod is never installed.
+        If that fails, any existing install is restored.
+
+        Args:
+            opened_zipfile: The output file to install the mod from.
+            mod_index: The index of the mods folder to install the mod to.
+            mod_path: The path to install the mod to.
+            zip_name: The name of the output file, without extension.
+            mod_hash: The hash of the mod files, which is stored with the install to detect stale installs.
+            version: The version to give the installed mod, which should not be in use by any other installed mod.
+
+        """
+
+        # Write all mod files to a staging directory. On Linux, make sure all their names are lowercase
+        staging_path = mod_index.create_temp_path(mod_path.name)
+        stale_path = None
+        try:
             for file in [x for x in opened_zipfile.namelist() if x.startswith(self.AP_MOD_NAME)]:
+                filepath = file.removeprefix(f"{self.AP_MOD_NAME}/")
+                if platform.system() == "Linux":
+                    filepath = filepath.lower()
+                filepath = staging_path / filepath
+                filepath.parent.mkdir(parents=True, exist_ok=True)
+
                 # Act according to the extension of this file
                 match file.rsplit(".", 1)[1]:
                     # For modinfo files, we want to update its teaser to match the name of the zipfile
@@ -414,43 +746,95 @@ class CivVContainer(APPlayerContainer):
                         xml_root = xml_tree.getroot()
 
                         # Update the version and teaser fields
-                        xml_root.set("version", str(self._get_mod_version(mods_folder_path)))
+                        xml_root.set("version", str(version))
                         xml_root.find("Properties/Teaser").text = zip_name
 
                         # Store the modinfo file
-                        xml_tree.write(tempdir / file)
+                        xml_tree.write(filepath)
 
-                    # For every other file, extract file as is
+                    # For every other file, stream the file as is
                     case _:
-                        opened_zipfile.extract(file, tempdir)
-
-            # If we are running on Linux, rename all mod files to become lowercase
-            tempdir_mod = tempdir / self.AP_MOD_NAME
-            if platform.system() == "Linux":
-                for filepath in tempdir_mod.rglob("*"):
-                    _ = Path(tempdir / filepath).rename(tempdir / str(filepath).lower())
+                        with opened_zipfile.open(file) as src, open(filepath, "wb") as dst:
+                            shutil.copyfileobj(src, dst)
+
+            # Store the hash of the mod files last, such that only complete installs are ever reused
+            _ = (staging_path / self.MOD_HASH_FILE_NAME).write_text(mod_hash)
+
+            # Move any stale install out of the mods folder and rename the staging directory into place
+            # If the staging directory cannot be renamed, move the stale install back such that it can still be used
+            if mod_path.exists():
+                stale_path = mod_index.create_temp_path(mod_path.name)
+                _ = mod_path.rename(stale_path)
+            try:
+                _ = staging_path.rename(mod_path)
+            except OSError:
+                if stale_path is not None:
+                    _ = stale_path.rename(mod_path)
+                    stale_path = None
+                raise
+
+        # Remove the staging directory if the install failed, and the stale install
+        finally:
+            for path in (staging_path, stale_path):
+                if path is not None and path.exists():
+                    mod_index.remove_folder(path)
+
+    @staticmethod
+    def _prune_mods(
+            mod_index: CivVModIndex,
+            protected: Collection[str],
+            max_count: int | None = None,
+            max_size: int | None = None,
+    ) -> list[CivVModInstall]:
+        """
+        Removes the least recently used mods in the given `mod_index` that are not `protected`, until the installed
+        mods are within the given limits. Returns the removed installs.
 
-            # Copy the apmod folder inside this temporary directory to the mods folder
-            _ = shutil.copytree(tempdir / self.AP_MOD_NAME, mod_path)
+        Args:
+            mod_index: The index of the mods folder to prune.
+            protected: The folder names of all mods that must not be removed.
+            max_count: The maximum number of installed mods. If None, the limit given in the settings is used.
+            max_size: The maximum total size of all installed mods in MB. If None, the limit given in the settings is
+                used.
 
-            # Remove the temporary directory
-            shutil.rmtree(tempdir)
+        """
 
-        # Call super method and return its result
-        return super().read_contents(opened_zipfile)
+        from .world import CivVWorld
+        if max_count is None:
+            max_count = int(CivVWorld.settings.max_installed_mods)
+        if max_size is None:
+            max_size = int(CivVWorld.settings.max_installed_mods_size)
+        return mod_index.prune(max_count=max_count, max_size=max_size * 2**20, protected=protected)
 
-    def _get_mod_version(self, mods_folder_path) -> int:
+    @classmethod
+    def prune_mods(
+            cls,
+            protected_player_names: Collection[str] = (),
+            max_count: int | None = None,
+            max_size: int | None = None,
+    ) -> list[CivVModInstall]:
         """
-        Returns the version to use for an APMod, given the current mods already installed.
+        Removes the least recently used installed mods until they are within the given limits, and returns the removed
+        installs.
+
+        The most recently used mod and all mods installed for any of the `protected_player_names` are never removed.
+        Player names are compared case-insensitively, as the names of mods installed on Linux are lowercase.
+        See :meth:`_prune_mods` for the limits.
 
         """
 
-        # Get the versions of all installed APMod versions
-        modinfo_files = mods_folder_path.glob(f"{self.AP_MOD_NAME}*/*.modinfo")
-        versions = {int(ElementTree.parse(x).getroot().get("version")) for x in modinfo_files}
+        # Get the index of installed mods in the mods folder
+        from .world import CivVWorld
+        mod_index = CivVModIndex.load(
+            Path(CivVWorld.settings.mods_folder_path), cls.AP_MOD_NAME, cls.MOD_HASH_FILE_NAME
+        )
 
-        # Return the lowest value not currently in use
-        return next(itertools.filterfalse(versions.__contains__, itertools.count(1)))
+        # Determine which mods are protected and prune all others
+        player_names = {x.casefold() for x in protected_player_names}
+        protected = {x.name for x in mod_index.installs.values() if x.player_name.casefold() in player_names}
+        if mod_index.installs:
+            protected.add(max(mod_index.installs.values(), key=lambda x: x.last_used).name)
+        return cls._prune_mods(mod_index, protected, max_count, max_size)
 
     @classmethod
     def create_output_file(cls, output_directory: str, world: "CivVWorld") -> None:
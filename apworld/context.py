@@ -1,7 +1,7 @@
 # %% IMPORTS
 import asyncio
-import itertools
 import typing
+from collections import Counter
 
 from CommonClient import CommonContext
 from NetUtils import NetworkItem
@@ -11,6 +11,7 @@ from .constants import GAME_NAME, ID_OFFSET
 from .dataclasses import CivVSlotData
 from .death_link import DEATH_LINK_EFFECTS_BY_NAME, CivVDeathLinkEffect
 from .enums import CivVLocationType
+from .sampling import CivVWeightedSampler
 
 # All declaration
 __all__ = ["CivVContext"]
@@ -35,16 +36,18 @@ class CivVContext(CommonContext):
     "Item offset to use for conversion from internal IDs to multiworld IDs"
     sent_locations: dict[CivVLocationType, set[int]] = {location_type: set() for location_type in CivVLocationType}
     "Dict of locations originating from this game that have been sent to the multiworld already, split by location type"
-    received_item_ids: list[int] = []
-    "IDs of items originating from the multiworld that have been received by this game already"
+    received_item_counts: Counter[int] = Counter()
+    "Counts of the IDs of items originating from the multiworld that have been received by this game already"
+    push_epoch: str | None = None
+    "Epoch of the push journal of the game, which changes whenever a game is loaded"
+    push_sequence: int = 0
+    "Sequence number of the last push table entry of the current epoch of the game that has been processed"
     queued_sent_items: list[tuple[NetworkItem, int]] = []
     "List of queued items and their receiver that this game sent to them"
     queued_death_links: list[str] = []
     "List of queued death links"
-    death_link_effect_list: list[CivVDeathLinkEffect] = []
-    "List of possible death link effects"
-    n_death_links_effects: int = 0
-    "Number of death link effects"
+    death_link_effect_sampler: CivVWeightedSampler[CivVDeathLinkEffect]
+    "Sampler of the possible death link effects, according to their weights"
     has_achieved_victory: bool = False
     "Whether the player has achieved victory yet"
     slot_data: CivVSlotData
@@ -70,11 +73,10 @@ class CivVContext(CommonContext):
             # Retrieve the slot data from this slot
             self.slot_data = CivVSlotData(**args["slot_data"])
 
-            # Pre-calculate the weighted death link effects list
-            self.death_link_effect_list = list(itertools.chain.from_iterable(
-                [[DEATH_LINK_EFFECTS_BY_NAME[x]]*y for x, y in self.slot_data.death_link_effect_weights.items()]
-            ))
-            self.n_death_links_effects = len(self.death_link_effect_list)
+            # Pre-calculate the weighted death link effects sampler
+            self.death_link_effect_sampler = CivVWeightedSampler(
+                (DEATH_LINK_EFFECTS_BY_NAME[x], y) for x, y in self.slot_data.death_link_effect_weights.items()
+            )
 
     def on_print_json(self, args: dict):
         # If an item was sent by this slot, queue the details regarding that item
@@ -0,0 +1,303 @@
+# %% IMPORTS
+import itertools
+from collections.abc import Iterable
+from dataclasses import dataclass
+from xml.etree import ElementTree
+
+from .enums import CivVDatabaseChangeType
+
+# All declaration
+__all__ = [
+    "CivVDatabaseChange",
+    "compile_sql",
+    "parse_xml",
+]
+
+# %% GLOBALS
+BATCH_SIZE: int = 100
+"Maximum number of rows or keys that are combined into a single SQL statement"
+
+
+# %% DATABASE_CHANGE CLASS DEFINITION
+@dataclass(frozen=True, slots=True)
+class CivVDatabaseChange:
+    """
+    Dataclass used for specifying a single change made to the Civ V database.
+
+    """
+
+    type: CivVDatabaseChangeType
+    "Type of this change"
+    table: str
+    "Name of the table this change is made to"
+    values: tuple[tuple[str, str | int], ...] = ()
+    "Columns and values that are inserted or set by this change. For tables, the columns and their definitions"
+    where: tuple[tuple[str, str | int], ...] = ()
+    "Columns and values that the rows affected by this change must have"
+
+
+# %% FUNCTION DEFINITIONS
+def _get_value(text: str | None) -> str | int:
+    """
+    Returns the database value of the given XML `text`.
+
+    Like the XML parser of Civ V, the strings "true" and "false" are converted to 1 and 0, respectively.
+
+    """
+
+    match text:
+        case "true":
+            return 1
+        case "false":
+            return 0
+        case _:
+            return text if text is not None else ""
+
+
+def _get_values(element: ElementTree.Element) -> tuple[tuple[str, str | int], ...]:
+    """
+    Returns the columns and values given by the attributes and child elements of the provided `element`.
+
+    """
+
+    return (
+        *((name, _get_value(value)) for name, value in element.attrib.items()),
+        *((child.tag, _get_value(child.text)) for child in element),
+    )
+
+
+def _get_column_definition(column: ElementTree.Element) -> str:
+    """
+    Returns the SQL definition of the given XML table `column`, without its name.
+
+    """
+
+    definition = [column.attrib.get("type", "text")]
+    if column.attrib.get("primarykey") == "true":
+        definition.append("PRIMARY KEY")
+    if column.attrib.get("autoincrement") == "true":
+        definition.append("AUTOINCREMENT")
+    if column.attrib.get("unique") == "true":
+        definition.append("UNIQUE")
+    if column.attrib.get("notnull") == "true":
+        definition.append("NOT NULL")
+    if "default" in column.attrib:
+        default = column.attrib["default"]
+        definition.append(f"DEFAULT {'NULL' if default == 'null' else _quote_value(_get_value(default))}")
+    return " ".join(definition)
+
+
+def parse_xml(text: str) -> list[CivVDatabaseChange]:
+    """
+    Parses the given Civ V database XML `text` into the changes it makes to the database, in order.
+
+    """
+
+    changes: list[CivVDatabaseChange] = []
+    for table in ElementTree.fromstring(text):
+        # Table definitions are given by their columns
+        if table.tag == "Table":
+            changes.append(CivVDatabaseChange(
+                type=CivVDatabaseChangeType.create,
+                table=table.attrib["name"],
+                values=tuple((x.attrib["name"], _get_column_definition(x)) for x in table if x.tag == "Column"),
+            ))
+            continue
+
+        # All other elements change the rows of the table
+        for element in table:
+            match element.tag:
+                case "Row" | "Replace":
+                    changes.append(CivVDatabaseChange(
+                        type=(
+                            CivVDatabaseChangeType.insert if element.tag == "Row" else CivVDatabaseChangeType.replace
+                        ),
+                        table=table.tag,
+                        values=_get_values(element),
+                    ))
+                case "Update":
+                    set_element = element.find("Set")
+                    where_element = element.find("Where")
+                    changes.append(CivVDatabaseChange(
+                        type=CivVDatabaseChangeType.update,
+                        table=table.tag,
+                        values=_get_values(set_element) if set_element is not None else (),
+                        where=_get_values(where_element) if where_element is not None else (),
+                    ))
+                case "Delete":
+                    changes.append(CivVDatabaseChange(
+                        type=CivVDatabaseChangeType.delete,
+                        table=table.tag,
+                        where=_get_values(element),
+                    ))
+                case _:
+                    raise NotImplementedError(f"Unsupported database element {element.tag!r} in table {table.tag!r}")
+
+    # Return all changes
+    return changes
+
+
+def _quote_identifier(name: str) -> str:
+    """
+    Quotes the given identifier `name` for use in SQL.
+
+    """
+
+    return '"' + name.replace('"', '""') + '"'
+
+
+def _quote_value(value: str | int) -> str:
+    """
+    Quotes the given `value` for use in SQL.
+
+    """
+
+    return str(value) if isinstance(value, int) else "'" + value.replace("'", "''") + "'"
+
+
+def _get_where_clause(where: tuple[tuple[str, str | int], ...]) -> str:
+    """
+    Returns the SQL WHERE clause for the given `where` columns and values, including a leading space.
+
+    """
+
+    if not where:
+        return ""
+    return " WHERE " + " AND ".join(f"{_quote_identifier(x)} = {_quote_value(y)}" for x, y in where)
+
+
+def _compile_inserts(changes: list[CivVDatabaseChange]) -> list[str]:
+    """
+    Compiles the given insert or replace `changes` into multi-row INSERT statements.
+
+    All changes must be made to the same table and columns.
+
+    """
+
+    # Determine the statement that all rows share
+    verb = "INSERT OR REPLACE" if changes[0].type == CivVDatabaseChangeType.replace else "INSERT"
+    columns = ", ".join(_quote_identifier(x) for x, _ in changes[0].values)
+    prefix = f"{verb} INTO {_quote_identifier(changes[0].table)} ({columns})"
+
+    # Insert all rows in batches with a compound SELECT, which is supported by all SQLite versions
+    statements = []
+    for i in range(0, len(changes), BATCH_SIZE):
+        rows = [f"SELECT {', '.join(_quote_value(y) for _, y in x.values)}" for x in changes[i:i+BATCH_SIZE]]
+        statements.append(f"{prefix}\n" + "\nUNION ALL ".join(rows) + ";")
+    return statements
+
+
+def _compile_updates(changes: list[CivVDatabaseChange]) -> list[str]:
+    """
+    Compiles the given update `changes` into batched UPDATE statements using CASE expressions.
+
+    All changes must be made to the same table, select rows by the same single column and not set that column.
+
+    """
+
+    # Determine the final value of every column set for every key, in order
+    table = _quote_identifier(changes[0].table)
+    key = _quote_identifier(changes[0].where[0][0])
+    values: dict[str | int, dict[str, str | int]] = {}
+    for change in changes:
+        values.setdefault(change.where[0][1], {}).update(change.values)
+
+    # Update all keys in batches, setting every column that is set for any key in the batch
+    statements = []
+    items = list(values.items())
+    for i in range(0, len(items), BATCH_SIZE):
+        batch = items[i:i+BATCH_SIZE]
+        columns = list(dict.fromkeys(itertools.chain.from_iterable(x for _, x in batch)))
+        assignments = []
+        for column in columns:
+            cases = " ".join(
+                f"WHEN {_quote_value(x)} THEN {_quote_value(y[column])}" for x, y in batch if column in y
+            )
+            assignments.append(
+                f"{_quote_identifier(column)} = CASE {key} {cases} ELSE {_quote_identifier(column)} END"
+            )
+        keys = ", ".join(_quote_value(x) for x, _ in batch)
+        statements.append(f"UPDATE {table} SET\n" + ",\n".join(assignments) + f"\nWHERE {key} IN ({keys});")
+    return statements
+
+
+def _compile_deletes(changes: list[CivVDatabaseChange]) -> list[str]:
+    """
+    Compiles the given delete `changes` into batched DELETE statements.
+
+    All changes must be made to the same table and select rows by the same single column.
+
+    """
+
+    table = _quote_identifier(changes[0].table)
+    key = _quote_identifier(changes[0].where[0][0])
+    statements = []
+    for i in range(0, len(changes), BATCH_SIZE):
+        keys = ", ".join(_quote_value(x.where[0][1]) for x in changes[i:i+BATCH_SIZE])
+        statements.append(f"DELETE FROM {table} WHERE {key} IN ({keys});")
+    return statements
+
+
+def _compile_change(change: CivVDatabaseChange) -> str:
+    """
+    Compiles a single `change` into an SQL statement.
+
+    """
+
+    table = _quote_identifier(change.table)
+    match change.type:
+        case CivVDatabaseChangeType.create:
+            columns = ", ".join(f"{_quote_identifier(x)} {y}" for x, y in change.values)
+            return f"CREATE TABLE {table} ({columns});"
+        case CivVDatabaseChangeType.insert | CivVDatabaseChangeType.replace:
+            return _compile_inserts([change])[0]
+        case CivVDatabaseChangeType.update:
+            assignments = ", ".join(f"{_quote_identifier(x)} = {_quote_value(y)}" for x, y in change.values)
+            return f"UPDATE {table} SET {assignments}{_get_where_clause(change.where)};"
+        case CivVDatabaseChangeType.delete:
+            return f"DELETE FROM {table}{_get_where_clause(change.where)};"
+        case _:
+            raise ValueError(f"Unexpected database change type {change.type!r} in table {change.table!r}")
+
+
+def _get_batch_key(change: CivVDatabaseChange) -> tuple | None:
+    """
+    Returns the key that determines which consecutive `change` instances can be combined into a single statement, or
+    None if this change must be compiled on its own.
+
+    """
+
+    match change.type:
+        case CivVDatabaseChangeType.insert | CivVDatabaseChangeType.replace:
+            return change.type, change.table, tuple(x for x, _ in change.values)
+        case CivVDatabaseChangeType.update if (
+                len(change.where) == 1 and change.values and change.where[0][0] not in dict(change.values)
+        ):
+            return change.type, change.table, change.where[0][0]
+        case CivVDatabaseChangeType.delete if len(change.where) == 1:
+            return change.type, change.table, change.where[0][0]
+        case _:
+            return None
+
+
+def compile_sql(changes: Iterable[CivVDatabaseChange]) -> str:
+    """
+    Compiles the given database `changes` into SQL and returns it.
+
+    Consecutive changes of the same type to the same table are combined into batched statements, which have the same
+    effect as making all changes one at a time in order.
+
+    """
+
+    statements: list[str] = []
+    for batch_key, group in itertools.groupby(changes, key=_get_batch_key):
+        group = list(group)
+        if batch_key is None:
+            statements.extend(_compile_change(x) for x in group)
+        elif batch_key[0] == CivVDatabaseChangeType.update:
+            statements.extend(_compile_updates(group))
+        elif batch_key[0] == CivVDatabaseChangeType.delete:
+            statements.extend(_compile_deletes(group))
+        else:
+            statements.extend(_compile_inserts(group))
+    return "\n".join(statements) + "\n"
@@ -2,13 +2,59 @@
 from dataclasses import dataclass, field, asdict
 from typing import Any
 
+from .enums import CivVLogicIssueType
+
 # All declaration
 __all__ = [
+    "CivVLogicIssue",
+    "CivVModInstall",
     "CivVSlotData",
 ]
 
 
 # %% DATACLASS DEFINITIONS
+@dataclass
+class CivVLogicIssue:
+    type: CivVLogicIssueType
+    "Type of this issue"
+    location_name: str
+    "Name of the location whose requirements have this issue"
+    item_name: str
+    "Name of the required item that causes this issue"
+    count: int
+    "Required count of this item"
+    available_count: int
+    "Count of this item that is implied by the region (redundant) or exists in the pool (contradictory)"
+
+
+@dataclass
+class CivVModInstall:
+    name: str
+    "Name of the folder in the mods folder that the mod is installed in"
+    version: int
+    "Version of the mod in its modinfo file"
+    hash: str
+    "Hash of the mod files in the output file that the mod was installed from"
+    player: int = 0
+    "Slot number of the player that the mod was installed for"
+    player_name: str = ""
+    "Name of the player that the mod was installed for"
+    installed: float = 0.0
+    "Time at which the mod was installed, as a POSIX timestamp"
+    last_used: float = 0.0
+    "Time at which the mod was last used by the client, as a POSIX timestamp"
+    size: int = 0
+    "Total size of all mod files in bytes"
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        Converts this instance to a dict and returns it.
+
+        """
+
+        return asdict(self)
+
+
 @dataclass
 class CivVSlotData:
     output_file_id: str
@@ -5,6 +5,7 @@ from BaseClasses import ItemClassification
 
 # All declaration
 __all__ = [
+    "CivVDatabaseChangeType",
     "CivVDeathLinkEffectType",
     "CivVFillerType",
     "CivVItemClassificationColors",
@@ -13,11 +14,25 @@ __all__ = [
     "CivVItemGroup",
     "CivVItemType",
     "CivVLocationType",
+    "CivVLogicIssueType",
     "CivVNotificationTypes",
 ]
 
 
 # %% ENUM DEFINITIONS
+class CivVDatabaseChangeType(StrEnum):
+    """
+    Enum defining the various types of changes that can be made to the Civ V database.
+
+    """
+
+    create = "create"
+    insert = "insert"
+    replace = "replace"
+    update = "update"
+    delete = "delete"
+
+
 class CivVDeathLinkEffectType(StrEnum):
     """
     Enum defining the various death link effect types for Civ V.
@@ -187,6 +202,16 @@ class CivVLocationType(StrEnum):
     world_wonder = "world_wonder"
 
 
+class CivVLogicIssueType(StrEnum):
+    """
+    Enum defining the various types of issues that can be found in the logic of Civ V.
+
+    """
+
+    redundant = "redundant"
+    contradictory = "contradictory"
+
+
 class CivVNotificationTypes(IntEnum):
     """
     Enum defining the different notification types for Civ V.
@@ -1,6 +1,7 @@
 # %% IMPORTS
 # All declaration
 __all__ = [
+    "TemplateException",
     "TunerConnectionException",
     "TunerErrorException",
     "TunerException",
@@ -53,3 +54,10 @@ class TunerTimeoutException(TunerException):
     not connected to the tuner's port or the Civ V AP mod is not loaded currently.
 
     """
+
+
+class TemplateException(Exception):
+    """
+    Exception raised when a Civ V AP Mod template file is invalid or does not match the substitutions made for it.
+
+    """
@@ -1,12 +1,20 @@
 # %% IMPORTS
+import argparse
+import functools
+import itertools
+import json
+from pathlib import Path
+
 from worlds.LauncherComponents import launch_subprocess
 
 from .constants import GAME_NAME
 
 # All declaration
 __all__ = [
+    "prune_mods",
     "run_client",
     "to_title",
+    "write_registry",
 ]
 
 
@@ -22,6 +30,33 @@ def run_client(*args, **kwargs):
     launch_subprocess(CivVClient.run_client, name=f"{GAME_NAME} Client")
 
 
+def prune_mods(*args: str) -> None:
+    """
+    Removes the least recently used Civilization V AP mods from the mods folder, using the given command-line `args`.
+
+    """
+
+    # Parse the command-line arguments
+    parser = argparse.ArgumentParser(
+        prog="Civ V Prune Mods",
+        description=f"Removes the least recently used {GAME_NAME} AP mods from the mods folder.",
+    )
+    parser.add_argument("--max-count", type=int, default=None,
+                        help="Maximum number of installed mods. Defaults to the limit in the host.yaml")
+    parser.add_argument("--max-size", type=int, default=None,
+                        help="Maximum total size of all installed mods in MB. Defaults to the limit in the host.yaml")
+    parser.add_argument("--keep", action="append", default=[], metavar="PLAYER_NAME",
+                        help="Name of a player whose mods must be kept. Can be given multiple times")
+    parsed_args = parser.parse_args(args)
+
+    # Prune the installed mods and report which ones were removed
+    from .container import CivVContainer
+    removed = CivVContainer.prune_mods(parsed_args.keep, parsed_args.max_count, parsed_args.max_size)
+    for install in removed:
+        print(f"Removed {install.name} (version {install.version})")
+    print(f"Removed {len(removed)} {GAME_NAME} AP mod(s)")
+
+
 def to_title(text: str) -> str:
     """
     Converts the given `text` to a title, converting underscores to spaces and capitalizing the first letter in each
@@ -30,3 +65,79 @@ def to_title(text: str) -> str:
     """
 
     return " ".join((x.capitalize() for x in text.split("_")))
+
+
+def write_registry(path: Path | None = None) -> None:
+    """
+    Generates the static registry module from all defined items and locations and writes it to the given `path`.
+
+    This function must be called whenever any item or location is added; removed; or renamed.
+    If `path` is None, the `registry.py` module of this APWorld is overwritten.
+
+    """
+
+    # Import the item and location definitions
+    from .items import FILLER_ITEMS, ITEMS_DATA, ITEM_GROUPS, TRAP_ITEMS
+    from .locations import LOCATIONS_DATA
+
+    # Determine the values of all globals in the registry
+    item_names = tuple(x.name for x in ITEMS_DATA)
+    location_names = tuple(x.name for x in LOCATIONS_DATA)
+    item_groups = {key: tuple(value) for key, value in sorted(ITEM_GROUPS.items())}
+    filler_item_weights = {x.name: x.weight for x in FILLER_ITEMS}
+    trap_item_weights = {x.name: x.weight for x in TRAP_ITEMS}
+
+    # Render the registry module
+    quote = functools.partial(json.dumps, ensure_ascii=False)
+    lines = [
+        "# %% IMPORTS",
+        "# This module is generated by `helpers.write_registry`. Do not edit it manually.",
+        "from .constants import ID_OFFSET",
+        "",
+        "# All declaration",
+        "__all__ = [",
+        '    "FILLER_ITEM_WEIGHTS",',
+        '    "ITEM_GROUPS",',
+        '    "ITEM_NAMES",',
+        '    "ITEM_NAME_TO_ID",',
+        '    "LOCATION_NAMES",',
+        '    "LOCATION_NAME_TO_ID",',
+        '    "TRAP_ITEM_WEIGHTS",',
+        "]",
+        "",
+        "",
+        "# %% GLOBALS",
+        "ITEM_NAMES: tuple[str, ...] = (",
+        *(f"    {quote(x)}," for x in item_names),
+        ")",
+        '"Names of all defined items, in order of their AP ID"',
+        "LOCATION_NAMES: tuple[str, ...] = (",
+        *(f"    {quote(x)}," for x in location_names),
+        ")",
+        '"Names of all defined locations, in order of their AP ID"',
+        "ITEM_GROUPS: dict[str, tuple[str, ...]] = {",
+        *itertools.chain.from_iterable(
+            (f"    {quote(key)}: (", *(f"        {quote(x)}," for x in value), "    ),")
+            for key, value in item_groups.items()
+        ),
+        "}",
+        '"Dict of all item groups and the names of the items in them"',
+        "FILLER_ITEM_WEIGHTS: dict[str, int] = {",
+        *(f"    {quote(key)}: {value!r}," for key, value in filler_item_weights.items()),
+        "}",
+        '"Dict of the default weights of all filler items"',
+        "TRAP_ITEM_WEIGHTS: dict[str, int] = {",
+        *(f"    {quote(key)}: {value!r}," for key, value in trap_item_weights.items()),
+        "}",
+        '"Dict of the default weights of all trap items"',
+        "ITEM_NAME_TO_ID: dict[str, int] = {name: ap_id for ap_id, name in enumerate(ITEM_NAMES, ID_OFFSET)}",
+        '"Dict of the AP IDs of all defined items, separated by name"',
+        "LOCATION_NAME_TO_ID: dict[str, int] = {name: ap_id for ap_id, name in enumerate(LOCATION_NAMES, ID_OFFSET)}",
+        '"Dict of the AP IDs of all defined locations, separated by name"',
+        "",
+    ]
+
+    # Write the registry module
+    if path is None:
+        path = Path(__file__).parent / "registry.py"
+    path.write_text("\n".join(lines), encoding="utf-8")
@@ -0,0 +1,226 @@
+# %% IMPORTS
+import functools
+import itertools
+import json
+import threading
+import time
+import tracemalloc
+import weakref
+from collections.abc import Callable
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, ClassVar, TypeVar
+
+from BaseClasses import Entrance, Location, MultiWorld
+
+from .constants import GAME_NAME
+if TYPE_CHECKING:
+    from .world import CivVWorld
+
+# All declaration
+__all__ = [
+    "CivVGenerationReport",
+    "instrumented",
+]
+
+# Type variable for the return value of instrumented methods
+T = TypeVar("T")
+
+
+# %% GENERATION_REPORT CLASS DEFINITION
+class CivVGenerationReport:
+    """
+    Thread-safe aggregator of the timings; memory usage; and object counts of all Civ V generation stages of a
+    multiworld.
+
+    Once every Civ V player has finished both `generate_output` and `fill_slot_data`, the report is written as JSON to
+    the output directory, next to the spoiler.
+    Memory usage is measured with :mod:`tracemalloc`, so stages that run concurrently (like `generate_output`) include
+    each other's allocations.
+    Reports do not keep their multiworld alive, and are dropped once written; once any stage fails; or once their
+    multiworld is deleted without ever writing output.
+
+    """
+
+    # Class attributes
+    _lock: ClassVar[threading.RLock] = threading.RLock()
+    "Lock used for all access to reports, which is reentrant as reports may be finalized by the garbage collector"
+    _reports: ClassVar[weakref.WeakKeyDictionary[MultiWorld, "CivVGenerationReport"]] = weakref.WeakKeyDictionary()
+    "Dict of all active reports by their multiworld, from which they are removed once their multiworld is deleted"
+    _started_tracing: ClassVar[bool] = False
+    "Whether memory tracing was started by a report, and should thus be stopped once no reports are active"
+
+    def __init__(self, multiworld: MultiWorld) -> None:
+        """
+        Initializes the generation report for the given `multiworld`.
+
+        Args:
+            multiworld: The multiworld this report is for.
+
+        """
+
+        self._multiworld = weakref.ref(multiworld)
+        self._item_counts: dict[int, int] = {}
+        self._players: dict[int, dict[str, dict[str, float | int]]] = {}
+        self._finished_stages: dict[int, set[str]] = {}
+        self._output_directory: str | None = None
+
+    @classmethod
+    def get(cls, multiworld: MultiWorld) -> "CivVGenerationReport":
+        """
+        Returns the generation report for the given `multiworld`, creating it if it does not exist yet.
+
+        Creating a report starts tracing memory allocations, if they were not traced already. Tracing is stopped again
+        once the report is dropped, which includes its `multiworld` being deleted before the report was written.
+
+        """
+
+        with cls._lock:
+            if multiworld not in cls._reports:
+                cls._reports[multiworld] = cls(multiworld)
+                weakref.finalize(multiworld, cls._finalize)
+                if not tracemalloc.is_tracing():
+                    tracemalloc.start()
+                    cls._started_tracing = True
+            return cls._reports[multiworld]
+
+    @classmethod
+    def discard(cls, multiworld: MultiWorld) -> None:
+        """
+        Discards the generation report for the given `multiworld` without writing it, if it exists.
+
+        """
+
+        with cls._lock:
+            cls._reports.pop(multiworld, None)
+            cls._stop_tracing()
+
+    @classmethod
+    def _finalize(cls) -> None:
+        with cls._lock:
+            cls._stop_tracing()
+
+    @classmethod
+    def _stop_tracing(cls) -> None:
+        # Stop tracing memory allocations if no reports are active anymore and tracing was started by a report
+        # Reports are checked by iterating, which skips the reports of deleted multiworlds that were not removed yet
+        if next(iter(cls._reports), None) is None and cls._started_tracing:
+            tracemalloc.stop()
+            cls._started_tracing = False
+
+    def get_counts(self, world: "CivVWorld", n_added_items: int) -> dict[str, int]:
+        """
+        Returns the number of regions; locations; rules; and items that currently exist for the player of the given
+        `world`.
+
+        Items are not counted in the item pool, as that would scan the entire pool for every stage of every player.
+        Instead, the `n_added_items` that a stage of this player added to the item pool are summed up.
+
+        """
+
+        regions = list(world.multiworld.get_regions(world.player))
+        locations = list(itertools.chain.from_iterable(region.locations for region in regions))
+        entrances = list(itertools.chain.from_iterable(region.exits for region in regions))
+        with self._lock:
+            self._item_counts[world.player] = self._item_counts.get(world.player, 0) + n_added_items
+            n_items = self._item_counts[world.player]
+        return {
+            "regions": len(regions),
+            "locations": len(locations),
+            "rules": sum(location.access_rule is not Location.access_rule for location in locations)
+                     + sum(entrance.access_rule is not Entrance.access_rule for entrance in entrances),
+            "items": n_items,
+        }
+
+    def record(self, player: int, stage: str, results: dict[str, float | int], output_directory: str | None) -> None:
+        """
+        Records the `results` of the given generation `stage` for the provided `player`.
+
+        If all Civ V players have finished generating, the report is written to the output directory.
+
+        """
+
+        with self._lock:
+            self._players.setdefault(player, {})[stage] = results
+            self._finished_stages.setdefault(player, set()).add(stage)
+            if output_directory is not None:
+                self._output_directory = output_directory
+
+            # Check if all players have finished generating
+            multiworld = self._multiworld()
+            players = multiworld.get_game_players(GAME_NAME)
+            if self._output_directory is None or not all(
+                    {"generate_output", "fill_slot_data"} <= self._finished_stages.get(x, set()) for x in players
+            ):
+                return
+            self._reports.pop(multiworld, None)
+            self._stop_tracing()
+
+        # Write report
+        self.write(Path(self._output_directory) / f"AP_{multiworld.seed_name}_CivV_Report.json")
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        Converts this report to a dict and returns it.
+
+        """
+
+        # Determine the totals of all stages over all players
+        totals: dict[str, dict[str, float | int]] = {}
+        for stages in self._players.values():
+            for stage, results in stages.items():
+                for key, value in results.items():
+                    totals.setdefault(stage, {})[key] = totals.get(stage, {}).get(key, 0) + value
+
+        multiworld = self._multiworld()
+        return {
+            "seed": multiworld.seed_name,
+            "players": {multiworld.player_name[x]: stages for x, stages in sorted(self._players.items())},
+            "totals": totals,
+        }
+
+    def write(self, path: Path) -> None:
+        """
+        Writes this report as JSON to the given `path`.
+
+        """
+
+        path.write_text(json.dumps(self.to_dict(), indent=4), encoding="utf-8")
+
+
+# %% FUNCTION DEFINITIONS
+def instrumented(func: Callable[..., T]) -> Callable[..., T]:
+    """
+    Decorator that records the wall time; traced memory; and object counts of the decorated :class:`CivVWorld` stage
+    in the :class:`CivVGenerationReport` of its multiworld, if enabled in the settings.
+
+    """
+
+    @functools.wraps(func)
+    def wrapper(self: "CivVWorld", *args, **kwargs) -> T:
+        # If instrumentation is not enabled, simply call the stage
+        if not self.settings.generation_report:
+            return func(self, *args, **kwargs)
+
+        # Call the stage and measure it
+        # If the stage fails, discard the report, as the generation of this multiworld can never finish
+        report = CivVGenerationReport.get(self.multiworld)
+        n_items_start = len(self.multiworld.itempool)
+        memory_start = tracemalloc.get_traced_memory()[0]
+        start = time.perf_counter()
+        try:
+            result = func(self, *args, **kwargs)
+        except BaseException:
+            CivVGenerationReport.discard(self.multiworld)
+            raise
+        results = {
+            "time": time.perf_counter() - start,
+            "memory_delta": tracemalloc.get_traced_memory()[0] - memory_start,
+            **report.get_counts(self, len(self.multiworld.itempool) - n_items_start),
+        }
+
+        # Record the results of this stage
+        output_directory = args[0] if func.__name__ == "generate_output" else None
+        report.record(self.player, func.__name__, results, output_directory)
+        return result
+
+    return wrapper
@@ -13,6 +13,18 @@ from .settlers import *
 from .techs import *
 from .traps import *
 
+# Register all items, in the order of their AP IDs
+core.register_items(
+    eras.PROGRESSIVE_ERA_ITEM,
+    *filler.FILLER_ITEMS,
+    *policies.POLICY_ITEMS.values(),
+    *promotions.PROMOTION_ITEMS.values(),
+    settlers.PROGRESSIVE_SETTLER_ITEM,
+    *techs.PROGRESSIVE_TECH_ITEMS.values(),
+    *techs.TECH_ITEMS.values(),
+    *traps.TRAP_ITEMS,
+)
+
 # All declaration
 __all__ = []
 __all__.extend(core.__all__)
@@ -1,6 +1,7 @@
 # %% IMPORTS
 import functools
 import itertools
+import sys
 from collections import defaultdict
 from collections.abc import Callable
 from dataclasses import dataclass, field
@@ -16,14 +17,12 @@ from ..helpers import to_title
 
 # All declaration
 __all__ = [
-    "FILLER_ITEMS",
     "ITEMS_DATA",
     "ITEMS_DATA_BY_ID",
     "ITEMS_DATA_BY_NAME",
     "ITEM_GROUPS",
     "PROGRESSION_ITEMS",
     "PROGRESSIVE_ITEMS",
-    "TRAP_ITEMS",
     "USEFUL_ITEMS",
     "CivVFillerItemData",
     "CivVItem",
@@ -33,6 +32,7 @@ __all__ = [
     "CivVUsefulItemData",
     "ItemRequirements",
     "ItemRequirementsUnion",
+    "register_items",
 ]
 
 
@@ -51,10 +51,6 @@ PROGRESSION_ITEMS: list["CivVProgressionItemData"] = []
 "List of all defined progression items"
 USEFUL_ITEMS: list["CivVUsefulItemData"] = []
 "List of all defined useful items"
-FILLER_ITEMS: list["CivVFillerItemData"] = []
-"List of all defined filler items"
-TRAP_ITEMS: list["CivVFillerItemData"] = []
-"List of all defined trap items"
 
 
 # %% ITEM CLASS DEFINITION
@@ -127,11 +123,12 @@ class ItemRequirements:
     def _merge_dicts(dct1: dict, dct2: dict) -> dict:
         return {k: max(dct1.get(k, 0), dct2.get(k, 0)) for k in {*dct1.keys(), *dct2.keys()}}
 
-    def create_access_rule(self, player: int, options: PerGameCommonOptions) -> Callable[[CollectionState], bool]:
+    def resolve(self, options: PerGameCommonOptions, implied: dict[str, int] | None = None) -> dict[str, int]:
         """
-        Creates the access rule function for this instance and returns it.
+        Resolves this instance into the names and counts of all items that must be collected, according to the given
+        `options`.
 
-        This function can be used as the access rule when creating :class:`Region` and :class:`Location` instances.
+        If `implied` is provided, all requirements that are already guaranteed by it are left out.
 
         """
 
@@ -160,6 +157,38 @@ class ItemRequirements:
                     {item.progressive_parent.name: item.progressive_parent.game_ids.index(item.game_id)+1},
                 )
 
+        # Remove all requirements that are already implied
+        if implied:
+            requirements = {name: count for name, count in requirements.items() if implied.get(name, 0) < count}
+
+        # Return resolved requirements
+        return requirements
+
+    def to_dnf(self, options: PerGameCommonOptions, implied: dict[str, int] | None = None) -> list[dict[str, int]]:
+        """
+        Resolves this instance into disjunctive normal form and returns it.
+
+        See :meth:`ItemRequirementsUnion.to_dnf` for more information.
+
+        """
+
+        return [self.resolve(options, implied)]
+
+    def create_access_rule(
+            self, player: int, options: PerGameCommonOptions, implied: dict[str, int] | None = None
+    ) -> Callable[[CollectionState], bool]:
+        """
+        Creates the access rule function for this instance and returns it.
+
+        This function can be used as the access rule when creating :class:`Region` and :class:`Location` instances.
+        If `implied` is provided, all requirements that are already guaranteed by it (usually by the parent region) are
+        not checked by the created rule.
+
+        """
+
+        # Determine all the requirements that must be satisfied
+        requirements = self.resolve(options, implied)
+
         # Create rule function that uses the CollectionState to determine if region/location is reachable
         def rule(state: CollectionState) -> bool:
             return all((state.has(name, player, count) for name, count in requirements.items()))
@@ -201,22 +230,58 @@ class ItemRequirementsUnion:
     def __and__(self, other: "ItemRequirements | ItemRequirementsUnion") -> "ItemRequirementsUnion":
         return ItemRequirementsUnion(and_requirements=[self, other])
 
-    def create_access_rule(self, player: int, options: PerGameCommonOptions) -> Callable[[CollectionState], bool]:
+    def to_dnf(self, options: PerGameCommonOptions, implied: dict[str, int] | None = None) -> list[dict[str, int]]:
+        """
+        Resolves this instance into disjunctive normal form and returns it.
+
+        Every entry in the returned list is a single set of item requirements (as given by
+        :meth:`ItemRequirements.resolve`), of which at least one must be satisfied. An empty entry means that this union
+        is always satisfied.
+
+        """
+
+        # If this is an OR union, all alternatives of all requirements are alternatives for this union
+        if self._or_requirements:
+            clauses = list(itertools.chain.from_iterable(x.to_dnf(options, implied) for x in self._or_requirements))
+
+        # Else, combine every alternative of every requirement with each other
+        else:
+            clauses = [{}]
+            for requirement in self._and_requirements:
+                clauses = [ItemRequirements._merge_dicts(x, y)
+                           for x, y in itertools.product(clauses, requirement.to_dnf(options, implied))]
+
+        # If any of the alternatives has no requirements, this union is always satisfied
+        if not all(clauses):
+            return [{}]
+        return clauses
+
+    def create_access_rule(
+            self, player: int, options: PerGameCommonOptions, implied: dict[str, int] | None = None
+    ) -> Callable[[CollectionState], bool]:
         """
         Creates the access rule function for this instance and returns it.
 
         This function can be used as the access rule when creating :class:`Region` and :class:`Location` instances.
+        If `implied` is provided, all requirements that are already guaranteed by it (usually by the parent region) are
+        not checked by the created rule.
 
         """
 
         # Create rule function that uses the CollectionState to determine if region/location is reachable
         if self._or_requirements:
-            rules = [x.create_access_rule(player, options) for x in self._or_requirements]
+            # If any of the alternatives is already implied, this union is always satisfied
+            if not all(self.to_dnf(options, implied)):
+                def rule(state: CollectionState) -> bool:
+                    return True
 
-            def rule(state: CollectionState) -> bool:
-                return any((x(state) for x in rules))
+            else:
+                rules = [x.create_access_rule(player, options, implied) for x in self._or_requirements]
+
+                def rule(state: CollectionState) -> bool:
+                    return any((x(state) for x in rules))
         else:
-            rules = [x.create_access_rule(player, options) for x in self._and_requirements]
+            rules = [x.create_access_rule(player, options, implied) for x in self._and_requirements]
 
             def rule(state: CollectionState) -> bool:
                 return all((x(state) for x in rules))
@@ -226,11 +291,13 @@ class ItemRequirementsUnion:
 
 
 # %% ITEM_DATA CLASS DEFINITIONS
-@dataclass
+@dataclass(frozen=True, slots=True)
 class CivVItemData:
     """
     Dataclass used for specifying an item.
 
+    Instances are immutable and only become part of the item registry once passed to :func:`register_items`.
+
     """
 
     name: str
@@ -239,20 +306,18 @@ class CivVItemData:
     "Type of this item"
     game_id: int | None
     "ID of this item with this item type. If None, this item has no singular ID"
-    game_ids: list[int] | None
-    "IDs of this item with this item type. If None, this item has no defined IDs"
+    game_ids: tuple[int, ...] | None
+    "IDs of this item with this item type. Only used for items with multiple IDs"
     classification: ItemClassification
     "Classification of this item"
-    count: int | None = field(init=False)
-    "Number of times this item exists. If None, this item has no defined count"
     option_count_name: str | None = None
     "If provided, the name of the option that states how many to include of this item. Default is all"
-    groups: set[CivVItemGroup | CivVItemType] = field(default_factory=set)
+    groups: frozenset[CivVItemGroup | CivVItemType] = frozenset()
     "Set of groups this item belongs to. The type of this item is always part of this set"
     prefix: str | None = None
     "Prefix to use for this item's name. By default, the item type is used"
     ap_id: int = field(init=False)
-    "ID of this item within AP"
+    "ID of this item within AP. Set when this item is registered"
 
     def __eq__(self, other: "CivVItemData") -> bool:
         return self.ap_id == other.ap_id
@@ -262,30 +327,39 @@ class CivVItemData:
 
     def __post_init__(self):
         # Add the item type as a prefix to the item name
-        self.name = f"{self.prefix or to_title(self.type)} - {self.name}"
+        object.__setattr__(self, "name", sys.intern(f"{self.prefix or to_title(self.type)} - {self.name}"))
 
-        # If game_id is set, set it as the single entry for game_ids
-        if self.game_id is not None:
-            self.game_ids = [self.game_id]
+        # Store the game IDs as a tuple, if this item has any
+        if self.game_ids is not None:
+            object.__setattr__(self, "game_ids", tuple(self.game_ids))
 
-        # Set count for this item
-        self.count = len(self.game_ids) if self.game_ids is not None else None
+        # Make sure the item type is part of this item's groups set
+        object.__setattr__(self, "groups", frozenset((*self.groups, self.type)))
 
-        # Set AP ID for this item
-        self.ap_id = len(ITEMS_DATA) + ID_OFFSET
+    @property
+    def count(self) -> int | None:
+        """
+        Number of times this item exists. If None, this item has no defined count.
 
-        # Make sure the item type is part of this item's groups set
-        self.groups.add(self.type)
+        """
 
-        # Add self to the dicts
-        ITEMS_DATA.append(self)
-        ITEMS_DATA_BY_ID[self.ap_id] = self
-        ITEMS_DATA_BY_NAME[self.name] = self
-        for group in self.groups:
-            ITEM_GROUPS[str(group)].append(self.name)
+        if self.game_ids is not None:
+            return len(self.game_ids)
+        elif self.game_id is not None:
+            return 1
+        else:
+            return None
 
+    def get_game_id(self, index: int = 0) -> int:
+        """
+        Returns the game ID of the `index`-th copy of this item that is received.
+
+        """
 
-@dataclass(eq=False)
+        return self.game_id if self.game_id is not None else self.game_ids[index]
+
+
+@dataclass(frozen=True, slots=True, eq=False)
 class CivVProgressiveItemData(CivVItemData):
     """
     Dataclass used for specifying a progressive item.
@@ -293,30 +367,13 @@ class CivVProgressiveItemData(CivVItemData):
     """
 
     game_id: None = field(default=None, init=False)
-    game_ids: list[int] = field(default_factory=list)
+    game_ids: tuple[int, ...] = ()
     classification: Literal[ItemClassification.progression] = field(default=ItemClassification.progression, init=False)
-    count: int = field(init=False)
     option_toggle_name: str | None = None
     "If provided, the name of the option that toggles the use of this progressive item. Default is to always use"
 
-    def __post_init__(self):
-        # Call super method
-        super().__post_init__()
-
-        # Add self to dict
-        PROGRESSIVE_ITEMS.append(self)
 
-    def add_game_id(self, game_id) -> None:
-        """
-        Adds the given `game_id` to this item.
-
-        """
-
-        self.game_ids.append(game_id)
-        self.count += 1
-
-
-@dataclass(eq=False)
+@dataclass(frozen=True, slots=True, eq=False)
 class CivVProgressionItemData(CivVItemData):
     """
     Dataclass used for specifying a progression item.
@@ -324,25 +381,13 @@ class CivVProgressionItemData(CivVItemData):
     """
 
     game_id: int
-    game_ids: list[int] = field(default_factory=list, init=False)
+    game_ids: None = field(default=None, init=False)
     classification: Literal[ItemClassification.progression] = field(default=ItemClassification.progression, init=False)
-    count: int = field(init=False)
     progressive_parent: CivVProgressiveItemData | None = None
-    "If provided, the progressive parent item this item belongs to"
+    "If provided, the progressive parent item this item belongs to. Its game ID is added to the parent on registration"
 
-    def __post_init__(self):
-        # Call super method
-        super().__post_init__()
 
-        # Add game_id to its progressive parent, if it has one
-        if self.progressive_parent is not None:
-            self.progressive_parent.add_game_id(self.game_id)
-
-        # Add self to dict
-        PROGRESSION_ITEMS.append(self)
-
-
-@dataclass(eq=False)
+@dataclass(frozen=True, slots=True, eq=False)
 class CivVUsefulItemData(CivVItemData):
     """
     Dataclass used for specifying a useful item.
@@ -350,19 +395,11 @@ class CivVUsefulItemData(CivVItemData):
     """
 
     game_id: int
-    game_ids: list[int] = field(default_factory=list, init=False)
+    game_ids: None = field(default=None, init=False)
     classification: Literal[ItemClassification.useful] = field(default=ItemClassification.useful, init=False)
-    count: int = field(init=False)
 
-    def __post_init__(self):
-        # Call super method
-        super().__post_init__()
 
-        # Add self to dict
-        USEFUL_ITEMS.append(self)
-
-
-@dataclass(eq=False)
+@dataclass(frozen=True, slots=True, eq=False)
 class CivVFillerItemData(CivVItemData):
     """
     Dataclass used for specifying a filler item.
@@ -372,19 +409,42 @@ class CivVFillerItemData(CivVItemData):
     game_id: None = field(default=None, init=False)
     game_ids: None = field(default=None, init=False)
     classification: Literal[ItemClassification.filler, ItemClassification.trap]
-    count: None = field(init=False)
-    option_count_name: None = field(init=False)
+    option_count_name: None = field(default=None, init=False)
     weight: int = 1
     "Default weight of this filler item"
     action: dict[CivVFillerType, int] = field(default_factory=dict)
     "Action to perform when this filler item is granted to the player"
 
-    def __post_init__(self):
-        # Call super method
-        super().__post_init__()
 
-        # Add self to proper filler item dict
-        if self.classification == ItemClassification.filler:
-            FILLER_ITEMS.append(self)
-        else:
-            TRAP_ITEMS.append(self)
+# %% FUNCTION DEFINITIONS
+def register_items(*items_data: CivVItemData) -> None:
+    """
+    Registers all given `items_data` in the item registry, in the given order.
+
+    Every item is assigned the next available AP ID, so the order of the items must never change.
+
+    """
+
+    for item_data in items_data:
+        # Set AP ID for this item
+        object.__setattr__(item_data, "ap_id", len(ITEMS_DATA) + ID_OFFSET)
+
+        # Add game_id to its progressive parent, if it has one
+        if isinstance(item_data, CivVProgressionItemData) and item_data.progressive_parent is not None:
+            parent = item_data.progressive_parent
+            object.__setattr__(parent, "game_ids", (*parent.game_ids, item_data.game_id))
+
+        # Add item to the dicts
+        ITEMS_DATA.append(item_data)
+        ITEMS_DATA_BY_ID[item_data.ap_id] = item_data
+        ITEMS_DATA_BY_NAME[item_data.name] = item_data
+        for group in item_data.groups:
+            ITEM_GROUPS[str(group)].append(item_data.name)
+
+        # Add item to the list of its kind
+        if isinstance(item_data, CivVProgressiveItemData):
+            PROGRESSIVE_ITEMS.append(item_data)
+        elif isinstance(item_data, CivVProgressionItemData):
+            PROGRESSION_ITEMS.append(item_data)
+        elif isinstance(item_data, CivVUsefulItemData):
+            USEFUL_ITEMS.append(item_data)
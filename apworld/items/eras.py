@@ -12,6 +12,6 @@ __all__ = [
 PROGRESSIVE_ERA_ITEM: CivVProgressiveItemData = CivVProgressiveItemData(
     name="Progressive",
     type=CivVItemType.era,
-    game_ids=[169, 170, 171, 172, 173, 174, 175],
+    game_ids=(169, 170, 171, 172, 173, 174, 175),
 )
 "Progressive era item"
@@ -14,6 +14,19 @@ from .techs import *
 from .units import *
 from .world_wonders import *
 
+# Register all locations, in the order of their AP IDs
+core.register_locations(
+    *buildings.BUILDING_LOCATIONS,
+    *national_wonders.NATIONAL_WONDER_LOCATIONS,
+    *policies.POLICY_BRANCH_LOCATIONS,
+    *policies.POLICY_LOCATIONS,
+    *promotions.PROMOTION_LOCATIONS,
+    *settlers.SETTLER_LOCATIONS,
+    *techs.TECH_LOCATIONS,
+    *units.UNIT_LOCATIONS,
+    *world_wonders.WORLD_WONDER_LOCATIONS,
+)
+
 # All declaration
 __all__ = []
 __all__.extend(core.__all__)
@@ -1,4 +1,5 @@
 # %% IMPORTS
+import sys
 from dataclasses import dataclass, field
 
 from BaseClasses import Location
@@ -15,6 +16,7 @@ __all__ = [
     "LOCATIONS_DATA_BY_TYPE_ID",
     "CivVLocation",
     "CivVLocationData",
+    "register_locations",
 ]
 
 
@@ -33,11 +35,13 @@ class CivVLocation(Location):
 
 
 # %% LOCATION_DATA CLASS DEFINITION
-@dataclass
+@dataclass(frozen=True, slots=True)
 class CivVLocationData:
     """
     Dataclass used for specifying a location.
 
+    Instances are immutable and only become part of the location registry once passed to :func:`register_locations`.
+
     """
 
     name: str
@@ -57,17 +61,37 @@ class CivVLocationData:
     prefix: str | None = None
     "Prefix to use for this location's name. By default, the location type is used"
     ap_id: int = field(init=False)
-    "ID of this location within AP"
+    "ID of this location within AP. Set when this location is registered"
+
+    def __eq__(self, other: "CivVLocationData") -> bool:
+        return self.ap_id == other.ap_id
 
+    def __hash__(self) -> int:
+        return self.ap_id
 
     def __post_init__(self):
         # Add the location type as a prefix to the location name
-        self.name = f"{self.prefix or to_title(self.type)} - {self.name}"
+        object.__setattr__(self, "name", sys.intern(f"{self.prefix or to_title(self.type)} - {self.name}"))
+
+        # Intern the database key prefix, as it is used as a key many times
+        if self.database_key_prefix is not None:
+            object.__setattr__(self, "database_key_prefix", sys.intern(self.database_key_prefix))
+
+
+# %% FUNCTION DEFINITIONS
+def register_locations(*locations_data: CivVLocationData) -> None:
+    """
+    Registers all given `locations_data` in the location registry, in the given order.
+
+    Every location is assigned the next available AP ID, so the order of the locations must never change.
+
+    """
 
+    for location_data in locations_data:
         # Set AP ID for this location
-        self.ap_id = len(LOCATIONS_DATA) + ID_OFFSET
+        object.__setattr__(location_data, "ap_id", len(LOCATIONS_DATA) + ID_OFFSET)
 
-        # Add self to the dicts
-        LOCATIONS_DATA.append(self)
-        LOCATIONS_DATA_BY_ID[self.ap_id] = self
-        LOCATIONS_DATA_BY_TYPE_ID[(self.type, self.game_id)] = self
+        # Add location to the dicts
+        LOCATIONS_DATA.append(location_data)
+        LOCATIONS_DATA_BY_ID[location_data.ap_id] = location_data
+        LOCATIONS_DATA_BY_TYPE_ID[(location_data.type, location_data.game_id)] = location_data
@@ -0,0 +1,198 @@
+# %% IMPORTS
+from typing import Any
+
+from Options import PerGameCommonOptions
+
+from .dataclasses import CivVLogicIssue
+from .enums import CivVLogicIssueType
+from .items import PROGRESSION_ITEMS, PROGRESSIVE_ITEMS, ItemRequirements, ItemRequirementsUnion
+from .locations import CivVLocationData
+from .regions import CivVRegionData
+
+# All declaration
+__all__ = ["CivVLogicAnalyzer"]
+
+
+# %% LOGIC ANALYZER CLASS DEFINITION
+class CivVLogicAnalyzer:
+    """
+    Static analyzer of the region and location requirements of Civ V, according to a set of options.
+
+    The analyzer determines which items are guaranteed to have been collected when a region is reachable, such that
+    location rules do not have to check them again.
+    It can also report requirements that are redundant or can never be satisfied, and compile all requirements into a
+    form that can be evaluated without the rule trees.
+
+    """
+
+    def __init__(self, options: PerGameCommonOptions, item_counts: dict[str, int] | None = None) -> None:
+        """
+        Initializes this logic analyzer for the given `options`.
+
+        Args:
+            options: The options to resolve all requirements with.
+            item_counts: Dict of the names and counts of all items in the item pool. If None, no checks for
+                contradictory requirements are performed.
+
+        """
+
+        self._options = options
+        self._item_counts = item_counts
+        self._region_requirements: dict[str, dict[str, int]] = {}
+
+    def get_region_requirements(self, region_data: CivVRegionData | None) -> dict[str, int]:
+        """
+        Returns the names and counts of all items that are guaranteed to have been collected when the provided
+        `region_data` is reachable.
+
+        This includes all requirements of the parent chain of this region.
+        If `region_data` is None, the origin region is assumed, which has no requirements.
+
+        """
+
+        # If this is the origin region, there is nothing guaranteed
+        if region_data is None:
+            return {}
+
+        # If the requirements of this region were already determined, return them
+        if region_data.name in self._region_requirements:
+            return self._region_requirements[region_data.name]
+
+        # Obtain the guaranteed requirements of the parent region
+        implied = dict(self.get_region_requirements(region_data.parent))
+
+        # Only the items required by every alternative of this region's requirements are guaranteed
+        clauses = region_data.requirements.to_dnf(self._options)
+        for name in set.intersection(*(set(x) for x in clauses)):
+            implied[name] = max(implied.get(name, 0), min(x[name] for x in clauses))
+
+        # Store and return guaranteed requirements
+        self._region_requirements[region_data.name] = implied
+        return implied
+
+    def get_region_access_requirements(self, region_data: CivVRegionData | None) -> dict[str, int] | None:
+        """
+        Returns the names and counts of all items that are required to reach the provided `region_data`, if reaching
+        this region requires exactly these items.
+
+        If any region in the parent chain of this region has alternative requirements, None is returned instead.
+
+        """
+
+        # Check that no region in the parent chain has alternative requirements
+        parent = region_data
+        while parent is not None:
+            if len(parent.requirements.to_dnf(self._options)) != 1:
+                return None
+            parent = parent.parent
+
+        # Return the guaranteed requirements, which are then exactly the required items
+        return self.get_region_requirements(region_data)
+
+    def analyze(self, locations_data: list[CivVLocationData]) -> list[CivVLogicIssue]:
+        """
+        Analyzes the requirements of all provided `locations_data` and returns all issues that were found.
+
+        """
+
+        # Check the requirements of all locations
+        issues: list[CivVLogicIssue] = []
+        for location_data in locations_data:
+            implied = self.get_region_requirements(location_data.region)
+            for clause in location_data.requirements.to_dnf(self._options):
+                for name, count in clause.items():
+                    # Check if this requirement is already guaranteed by the region
+                    if implied.get(name, 0) >= count:
+                        issues.append(CivVLogicIssue(
+                            type=CivVLogicIssueType.redundant,
+                            location_name=location_data.name,
+                            item_name=name,
+                            count=count,
+                            available_count=implied[name],
+                        ))
+
+                    # Check if this requirement can be satisfied with the items in the pool
+                    elif self._item_counts is not None and self._item_counts.get(name, 0) < count:
+                        issues.append(CivVLogicIssue(
+                            type=CivVLogicIssueType.contradictory,
+                            location_name=location_data.name,
+                            item_name=name,
+                            count=count,
+                            available_count=self._item_counts.get(name, 0),
+                        ))
+
+        # Return all found issues
+        return issues
+
+    def compile(
+            self,
+            origin_region_name: str,
+            regions_data: list[CivVRegionData],
+            locations_data: list[CivVLocationData],
+            victory_region_data: CivVRegionData,
+            victory_requirements: ItemRequirements | ItemRequirementsUnion,
+    ) -> dict[str, Any]:
+        """
+        Compiles the requirements of all provided regions and locations into a JSON-serializable dict and returns it.
+
+        All requirements are given in disjunctive normal form: a list of alternatives, of which each is a dict of the
+        names and counts of all items that must be collected.
+        Requirements already guaranteed by the region they are checked from are left out, such that a region or
+        location is reachable if its parent region is reachable and any of its alternatives is satisfied.
+        The compiled logic also contains the game IDs that every progressive item in use unlocks, in order.
+
+        Args:
+            origin_region_name: The name of the region that all regions without a parent are connected to.
+            regions_data: The regions to compile the entrances of.
+            locations_data: The locations to compile the requirements of.
+            victory_region_data: The region that contains the victory location.
+            victory_requirements: The requirements of the victory location.
+
+        """
+
+        # Compile the entrances of all regions
+        regions = {origin_region_name: {"parent": None, "requirements": [{}]}}
+        for region_data in regions_data:
+            regions[region_data.name] = {
+                "parent": region_data.parent.name if region_data.parent is not None else origin_region_name,
+                "requirements": region_data.requirements.to_dnf(
+                    self._options, self.get_region_requirements(region_data.parent)
+                ),
+            }
+
+        # Compile the requirements of all locations
+        locations = {
+            location_data.name: {
+                "region": location_data.region.name if location_data.region is not None else origin_region_name,
+                "requirements": location_data.requirements.to_dnf(
+                    self._options, self.get_region_requirements(location_data.region)
+                ),
+            }
+            for location_data in locations_data
+        }
+
+        # Determine the expansions of all progressive items in use
+        progressive_items = {
+            item.name: {
+                "game_ids": list(item.game_ids),
+                "items": [x.name for x in sorted(
+                    (x for x in PROGRESSION_ITEMS if x.progressive_parent is item),
+                    key=lambda x: item.game_ids.index(x.game_id),
+                )],
+            }
+            for item in PROGRESSIVE_ITEMS
+            if item.option_toggle_name is None or getattr(self._options, item.option_toggle_name)
+        }
+
+        # Return the compiled logic
+        return {
+            "regions": regions,
+            "locations": locations,
+            "victory": {
+                "region": victory_region_data.name,
+                "requirements": victory_requirements.to_dnf(
+                    self._options, self.get_region_requirements(victory_region_data)
+                ),
+            },
+            "progressive_items": progressive_items,
+        }
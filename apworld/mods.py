@@ -0,0 +1,333 @@
+# %% IMPORTS
+import itertools
+import json
+import logging
+import os
+import re
+import shutil
+import time
+import uuid
+from collections.abc import Collection
+from pathlib import Path
+from typing import ClassVar
+from xml.etree import ElementTree
+
+from .dataclasses import CivVModInstall
+
+# All declaration
+__all__ = ["CivVModIndex"]
+
+
+# %% MOD_INDEX CLASS DEFINITION
+class CivVModIndex:
+    """
+    Index of all Civ V AP Mods installed in a mods folder.
+
+    The index is stored as JSON in the mods folder and is replaced atomically whenever it is saved.
+    If the index does not exist or cannot be read, it is rebuilt from the installed mods.
+    The versions of pruned mods are kept in the index, such that a mod that is installed again gets its old version back
+    and saves using it keep loading.
+    Mods are staged and deleted in a temporary folder next to the mods folder, as Civ V loads every mod it finds in the
+    mods folder.
+
+    """
+
+    # Class attributes
+    FILE_NAME: ClassVar[str] = "apcivv_index.json"
+    "Name of the file in the mods folder that stores the index"
+    FORMAT_VERSION: ClassVar[int] = 1
+    "Version of the format of the index file"
+    TEMP_FOLDER_NAME: ClassVar[str] = ".apcivv_temp"
+    "Name of the folder next to the mods folder that mods are staged in and moved to before being deleted"
+    TEMP_MAX_AGE: ClassVar[float] = 3600
+    "Age in seconds after which an entry in the temporary folder is left over, instead of in use by another install"
+
+    def __init__(
+            self,
+            mods_folder_path: Path,
+            installs: dict[str, CivVModInstall] | None = None,
+            pruned_versions: dict[str, int] | None = None,
+    ) -> None:
+        """
+        Initializes the mod index of the given `mods_folder_path`.
+
+        Args:
+            mods_folder_path: The path to the mods folder.
+            installs: The installed mods, separated by the name of their folder.
+            pruned_versions: The versions of all pruned mods, separated by the name of their folder.
+
+        """
+
+        self.mods_folder_path: Path = mods_folder_path
+        "Path to the mods folder of this index"
+        self.installs: dict[str, CivVModInstall] = installs if installs is not None else {}
+        "Dict of all installed mods, separated by the name of their folder"
+        self.pruned_versions: dict[str, int] = pruned_versions if pruned_versions is not None else {}
+        "Dict of the versions of all pruned mods, separated by the name of their folder"
+
+    @property
+    def path(self) -> Path:
+        """
+        Path to the index file.
+
+        """
+
+        return self.mods_folder_path / self.FILE_NAME
+
+    @property
+    def temp_folder_path(self) -> Path:
+        """
+        Path to the temporary folder, which is on the same file system as the mods folder such that mods can be renamed
+        between them.
+
+        """
+
+        return self.mods_folder_path.resolve().parent / self.TEMP_FOLDER_NAME
+
+    @classmethod
+    def load(cls, mods_folder_path: Path, mod_name: str, hash_file_name: str) -> "CivVModIndex":
+        """
+        Loads the mod index of the given `mods_folder_path` and returns it.
+
+        If the index file does not exist or cannot be read, the index is rebuilt instead and saved.
+
+        Args:
+            mods_folder_path: The path to the mods folder.
+            mod_name: The name that the folders of all installed mods start with.
+            hash_file_name: The name of the file in an installed mod that stores the hash of its mod files.
+
+        """
+
+        # Try to read the index file
+        index = None
+        try:
+            data = json.loads((mods_folder_path / cls.FILE_NAME).read_text(encoding="utf-8"))
+            if data["format_version"] == cls.FORMAT_VERSION:
+                index = cls(
+                    mods_folder_path,
+                    {name: CivVModInstall(**x) for name, x in data["installs"].items()},
+                    {name: int(x) for name, x in data.get("pruned_versions", {}).items()},
+                )
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+
+        # If it could not be read, rebuild it
+        if index is None:
+            index = cls.rebuild(mods_folder_path, mod_name, hash_file_name)
+            index.save()
+
+        # Remove all mods that were left over by earlier installs or removals that did not finish
+        index.sweep(mod_name)
+        return index
+
+    @classmethod
+    def rebuild(cls, mods_folder_path: Path, mod_name: str, hash_file_name: str) -> "CivVModIndex":
+        """
+        Rebuilds the mod index of the given `mods_folder_path` from all installed mods and returns it.
+
+        See :meth:`load` for the arguments.
+
+        """
+
+        installs: dict[str, CivVModInstall] = {}
+        for modinfo_file in mods_folder_path.glob(f"{mod_name}*/*.modinfo"):
+            mod_path = modinfo_file.parent
+            # Obtain the version of this mod, skipping it if its modinfo file is invalid
+            try:
+                version = int(ElementTree.parse(modinfo_file).getroot().get("version"))
+            except (OSError, ValueError, TypeError, ElementTree.ParseError):
+                continue
+
+            # Obtain the hash of this mod, which does not exist for mods installed by older clients
+            try:
+                mod_hash = (mod_path / hash_file_name).read_text()
+            except OSError:
+                mod_hash = ""
+
+            # Obtain the player this mod was installed for from the name of its output file, if it has the default name
+            match = re.fullmatch(r"ap_[^_]+_p(\d+)_(.+)", mod_path.name.removeprefix(f"{mod_name} - "), re.IGNORECASE)
+            player, player_name = (int(match.group(1)), match.group(2)) if match is not None else (0, "")
+
+            # Add this mod to the index
+            installed = mod_path.stat().st_mtime
+            installs[mod_path.name] = CivVModInstall(
+                name=mod_path.name,
+                version=version,
+                hash=mod_hash,
+                player=player,
+                player_name=player_name,
+                installed=installed,
+                last_used=installed,
+                size=sum(x.stat().st_size for x in mod_path.rglob("*") if x.is_file()),
+            )
+        return cls(mods_folder_path, installs)
+
+    def get(self, name: str) -> CivVModInstall | None:
+        """
+        Returns the install of the mod with the given folder `name`, or None if it is not installed.
+
+        """
+
+        return self.installs.get(name)
+
+    def get_free_version(self) -> int:
+        """
+        Returns the lowest mod version that is not in use by any installed or pruned mod.
+
+        """
+
+        versions = {x.version for x in self.installs.values()} | set(self.pruned_versions.values())
+        return next(itertools.filterfalse(versions.__contains__, itertools.count(1)))
+
+    def get_version(self, name: str) -> int:
+        """
+        Returns the version that the mod with the given folder `name` must be installed with.
+
+        This is the version of its current install or of its pruned install if it has any, and a free version otherwise.
+
+        """
+
+        if name in self.installs:
+            return self.installs[name].version
+        if name in self.pruned_versions:
+            return self.pruned_versions[name]
+        return self.get_free_version()
+
+    def add(self, install: CivVModInstall) -> None:
+        """
+        Adds the given `install` to this index, replacing any install with the same folder name.
+
+        """
+
+        self.installs[install.name] = install
+        self.pruned_versions.pop(install.name, None)
+
+    def create_temp_path(self, name: str) -> Path:
+        """
+        Returns a new unique path in the temporary folder for a mod with the given folder `name`, creating the temporary
+        folder if needed.
+
+        """
+
+        self.temp_folder_path.mkdir(parents=True, exist_ok=True)
+        return self.temp_folder_path / f"{name}.{uuid.uuid4().hex}"
+
+    @staticmethod
+    def remove_folder(path: Path) -> bool:
+        """
+        Deletes the folder at the given `path` with all its contents, and returns whether it was deleted entirely.
+
+        The modinfo files are deleted first, such that Civ V does not load a mod that could only be deleted partially,
+        like when the game has some of its files opened. Failures are logged, not raised.
+
+        """
+
+        try:
+            for modinfo_file in path.rglob("*.modinfo"):
+                modinfo_file.unlink()
+            shutil.rmtree(path)
+        except OSError as e:
+            logging.warning(f"Could not delete the Civ V mod folder {path}: {e}")
+            return False
+        return True
+
+    def sweep(self, mod_name: str) -> None:
+        """
+        Deletes all mods that were left over by installs or removals that did not finish.
+
+        These are all entries of the temporary folder that are older than :attr:`TEMP_MAX_AGE`, and all hidden folders
+        of the given `mod_name` in the mods folder, where older clients staged and removed their mods.
+
+        """
+
+        # Delete leftover folders in the mods folder first, as Civ V loads the mods in them
+        prefix = f".{mod_name}".casefold()
+        for path in self.mods_folder_path.iterdir():
+            if path.is_dir() and path.name.casefold().startswith(prefix):
+                self.remove_folder(path)
+
+        # Delete old entries of the temporary folder. Newer entries may belong to an install that is still in progress
+        if self.temp_folder_path.is_dir():
+            for path in self.temp_folder_path.iterdir():
+                if time.time() - path.stat().st_mtime > self.TEMP_MAX_AGE:
+                    self.remove_folder(path)
+
+    def remove(self, name: str) -> None:
+        """
+        Removes the install of the mod with the given folder `name` from this index, if it exists.
+
+        """
+
+        self.installs.pop(name, None)
+
+    def prune(self, max_count: int, max_size: int, protected: Collection[str] = ()) -> list[CivVModInstall]:
+        """
+        Removes the least recently used mods until at most `max_count` mods with a total size of at most `max_size` are
+        installed, and returns the removed installs.
+
+        Mods are first moved out of the mods folder and only then deleted, such that a partially deleted mod is never
+        left behind in it. Mods that cannot be moved, like when the game has them opened, are kept in the index.
+        The versions of all removed mods are kept, and this index is saved afterward if any mod was removed.
+
+        Args:
+            max_count: The maximum number of installed mods. If 0, the number of installed mods is not limited.
+            max_size: The maximum total size of all installed mods in bytes. If 0, the total size is not limited.
+            protected: The folder names of all mods that must not be removed, like the mod of the active slot.
+
+        """
+
+        # Remove mods until within the limits, starting with the least recently used one
+        count = len(self.installs)
+        size = sum(x.size for x in self.installs.values())
+        removed: list[CivVModInstall] = []
+        for install in sorted(self.installs.values(), key=lambda x: x.last_used):
+            if not ((max_count and count > max_count) or (max_size and size > max_size)):
+                break
+            if install.name in protected:
+                continue
+
+            # Move the mod out of the mods folder, keeping it in the index if that fails
+            mod_path = self.mods_folder_path / install.name
+            if mod_path.exists():
+                trash_path = self.create_temp_path(install.name)
+                try:
+                    _ = mod_path.rename(trash_path)
+                except OSError as e:
+                    logging.warning(f"Could not remove the Civ V mod {install.name}: {e}")
+                    continue
+
+                # Delete the mod. If that fails, it is deleted again once it is swept
+                self.remove_folder(trash_path)
+
+            # Remove the mod from the index, keeping its version
+            count -= 1
+            size -= install.size
+            removed.append(install)
+            self.remove(install.name)
+            self.pruned_versions[install.name] = install.version
+
+        # Save the index if it changed and return the removed installs
+        if removed:
+            self.save()
+        return removed
+
+    def save(self) -> None:
+        """
+        Saves this index to its index file.
+
+        The index is first written to a temporary file, which then replaces the index file, such that the index file is
+        never half-written.
+
+        """
+
+        data = {
+            "format_version": self.FORMAT_VERSION,
+            "installs": {name: x.to_dict() for name, x in sorted(self.installs.items())},
+            "pruned_versions": dict(sorted(self.pruned_versions.items())),
+        }
+        temp_path = self.mods_folder_path / f".{self.FILE_NAME}.{uuid.uuid4().hex}"
+        try:
+            _ = temp_path.write_text(json.dumps(data, indent=4), encoding="utf-8")
+            os.replace(temp_path, self.path)
+        finally:
+            temp_path.unlink(missing_ok=True)
@@ -3,7 +3,7 @@ from dataclasses import dataclass
 
 from Options import Choice, DeathLink, DefaultOnToggle, PerGameCommonOptions, OptionCounter, Range, Toggle
 
-from . import death_link, items
+from . import death_link, registry
 
 # All declaration
 __all__ = ["CivVOptions"]
@@ -261,8 +261,8 @@ class FillerItemWeights(OptionCounter):
     display_name = "Filler Item Weights"
     min = 0
     cull_zeroes = True
-    valid_keys = [x.name for x in items.FILLER_ITEMS]
-    default = {x.name: x.weight for x in items.FILLER_ITEMS}
+    valid_keys = list(registry.FILLER_ITEM_WEIGHTS)
+    default = dict(registry.FILLER_ITEM_WEIGHTS)
 
 
 class EnableTraps(Toggle):
@@ -299,8 +299,8 @@ class TrapItemWeights(OptionCounter):
     display_name = "Trap Item Weights"
     min = 0
     cull_zeroes = True
-    valid_keys = [x.name for x in items.TRAP_ITEMS]
-    default = {x.name: x.weight for x in items.TRAP_ITEMS}
+    valid_keys = list(registry.TRAP_ITEM_WEIGHTS)
+    default = dict(registry.TRAP_ITEM_WEIGHTS)
 
 
 class DeathLinkTrigger(Choice):
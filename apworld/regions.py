@@ -1,10 +1,15 @@
 # %% IMPORTS
 from dataclasses import dataclass, field
+from typing import Any
+
+from BaseClasses import CollectionState, Entrance, MultiWorld, Region
 
 from . import items, requirements
 
 # All declaration
 __all__ = [
+    "CivVReachability",
+    "CivVRegion",
     "CivVRegionData",
     "REGIONS_DATA",
     "ANCIENT_ERA",
@@ -37,13 +42,162 @@ __all__ = [
 ]
 
 
-# %% GLOBALS
-REGIONS_DATA: list["CivVRegionData"] = []
-"List of all defined regions"
+# %% REGION CLASS DEFINITIONS
+class CivVRegion(Region):
+    """
+    Region within Civ V.
+
+    """
+
+    def __init__(
+            self,
+            name: str,
+            player: int,
+            multiworld: MultiWorld,
+            hint: str | None = None,
+            access_requirements: dict[str, int] | None = None,
+    ):
+        """
+        Initializes this region.
+
+        Args:
+            name: Name of this region.
+            player: The player this region belongs to.
+            multiworld: The multiworld this region belongs to.
+            hint: Hint text of this region.
+            access_requirements: The names and counts of all items that are required to reach this region, if known.
+
+        """
+
+        # Call super method
+        super().__init__(name, player, multiworld, hint)
+
+        # Additional instance attributes
+        self.access_requirements = access_requirements
+        "The names and counts of all items that are required to reach this region, if known"
+        self.reachability: CivVReachability | None = None
+        "The reachability helper of all regions of this player. If None, the regular region sweep of AP is used"
+
+    def can_reach(self, state: CollectionState) -> bool:
+        # Update the reachable regions of this player if required
+        # If possible, they are determined in a single step instead of sweeping over all entrances
+        if state.stale[self.player]:
+            if self.reachability is not None and self.reachability.can_update():
+                self.reachability.update_reachable_regions(state)
+            else:
+                state.update_reachable_regions(self.player)
+        return self in state.reachable_regions[self.player]
+
+
+class CivVReachability:
+    """
+    Helper that determines all reachable Civ V regions of a player in a single step.
+
+    All regions in Civ V form simple chains of progressive era counts and single building requirements, so the
+    reachable regions only depend on the counts of a handful of items. The reachable regions; blocked connections; and
+    spoiler paths are therefore cached per combination of these counts, and written directly into the region cache of
+    the :class:`CollectionState`.
+    This is only valid as long as the entrances and their rules are the ones the regions were created with, so the
+    regular region sweep of AP is used once any of them changed.
+
+    """
+
+    def __init__(self, player: int, regions: list[CivVRegion]):
+        """
+        Initializes the reachability helper for the given `regions`.
+
+        Args:
+            player: The player all regions belong to.
+            regions: All regions of this player, which must be connected already. The exact access requirements of
+                every region must be known.
+
+        """
+
+        self._player = player
+        self._regions = regions
+        self._item_names = sorted({name for region in regions for name in region.access_requirements})
+        self._max_counts = [max(region.access_requirements.get(name, 0) for region in regions)
+                            for name in self._item_names]
+        self._entrance_rules = {entrance: entrance.access_rule for region in regions for entrance in region.exits}
+        self._region_paths: dict[Region, tuple[tuple[Region | Entrance, Any], ...]] = {}
+        self._cache: dict[
+            tuple[int, ...], tuple[frozenset[Region], frozenset[Entrance], dict[Region | Entrance, Any]]
+        ] = {}
+
+    def _get_region_paths(self, region: Region) -> tuple[tuple[Region | Entrance, Any], ...]:
+        """
+        Returns the spoiler paths that the regular region sweep of AP stores for the given `region` once it is
+        reached, as pairs of the region or entrance and its path.
+
+        """
+
+        # If the paths of this region were already determined, return them
+        if region in self._region_paths:
+            return self._region_paths[region]
+
+        # The origin region has no path, and every other region is reached through its single entrance
+        paths: tuple[tuple[Region | Entrance, Any], ...] = ()
+        if region.entrances:
+            entrance = region.entrances[0]
+            parent_path = dict(self._get_region_paths(entrance.parent_region)).get(
+                entrance.parent_region, (entrance.parent_region.name, None)
+            )
+            if entrance.hide_path:
+                paths = ((region, (region.name, None)),)
+            else:
+                entrance_path = (entrance.name, parent_path)
+                paths = ((entrance, entrance_path), (region, (region.name, entrance_path)))
+
+        # Store and return the paths
+        self._region_paths[region] = paths
+        return paths
+
+    def can_update(self) -> bool:
+        """
+        Returns whether the reachable regions can be determined by this helper, which is only the case if no entrance
+        was added and no entrance rule was changed since it was created.
+
+        """
+
+        return (sum(len(region.exits) for region in self._regions) == len(self._entrance_rules)
+                and all(entrance.access_rule is rule for entrance, rule in self._entrance_rules.items()))
+
+    def update_reachable_regions(self, state: CollectionState) -> None:
+        """
+        Updates the reachable regions and blocked connections of this player in the given `state`.
+
+        """
+
+        # Obtain the relevant item counts of this player
+        prog_items = state.prog_items[self._player]
+        key = tuple(min(prog_items[name], count) for name, count in zip(self._item_names, self._max_counts))
+
+        # Determine the reachable regions and blocked connections for these counts, if not done before
+        if key not in self._cache:
+            counts = dict(zip(self._item_names, key))
+            reachable = frozenset(
+                region for region in self._regions
+                if all(counts[name] >= count for name, count in region.access_requirements.items())
+            )
+            blocked = frozenset(
+                entrance for region in reachable for entrance in region.exits
+                if entrance.connected_region not in reachable
+            )
+            paths = dict(x for region in reachable for x in self._get_region_paths(region))
+            self._cache[key] = (reachable, blocked, paths)
+        reachable, blocked, paths = self._cache[key]
+
+        # Update the region cache and the spoiler paths of the state
+        state.reachable_regions[self._player].clear()
+        state.reachable_regions[self._player].update(reachable)
+        state.blocked_connections[self._player].clear()
+        state.blocked_connections[self._player].update(blocked)
+        state.path.update(paths)
+        state.stale[self._player] = False
 
 
 # %% REGION_DATA CLASS DEFINITION
-@dataclass
+@dataclass(frozen=True, slots=True)
 class CivVRegionData:
     """
     Dataclass used for specifying a region within Civ V.
@@ -57,10 +211,6 @@ class CivVRegionData:
     requirements: items.ItemRequirements = field(default_factory=items.ItemRequirements)
     "Required items to access this region, in addition to the parent's requirements"
 
-    def __post_init__(self):
-        # Add self to the REGIONS_DATA list
-        REGIONS_DATA.append(self)
-
 
 # %% REGION DECLARATIONS
 ANCIENT_ERA = CivVRegionData(
@@ -216,3 +366,5 @@ ERA_POLICY_REGIONS = [
     INFORMATION_ERA_POLICY,
 ]
 "List with all era regions for policies"
+REGIONS_DATA: list[CivVRegionData] = [*ERA_REGIONS, *ERA_TECH_REGIONS, *ERA_POLICY_REGIONS]
+"List of all defined regions"
@@ -0,0 +1,1197 @@
+# %% IMPORTS
+# This module is generated by `helpers.write_registry`. Do not edit it manually.
+from .constants import ID_OFFSET
+
+# All declaration
+__all__ = [
+    "FILLER_ITEM_WEIGHTS",
+    "ITEM_GROUPS",
+    "ITEM_NAMES",
+    "ITEM_NAME_TO_ID",
+    "LOCATION_NAMES",
+    "LOCATION_NAME_TO_ID",
+    "TRAP_ITEM_WEIGHTS",
+]
+
+
+# %% GLOBALS
+ITEM_NAMES: tuple[str, ...] = (
+    "Era - Progressive",
+    "Bonus - Gold +100",
+    "Bonus - Gold +250",
+    "Bonus - Gold +1000",
+    "Bonus - Culture +100",
+    "Bonus - Culture +250",
+    "Bonus - Culture +1000",
+    "Bonus - Faith +50",
+    "Bonus - Faith +125",
+    "Bonus - Faith +500",
+    "Bonus - Snack from Thes",
+    "Bonus - Free Great Person",
+    "Bonus - Free Policy",
+    "Bonus - Free Tech",
+    "Bonus - Free Unit",
+    "Bonus - Free Worker",
+    "Bonus - All City-State Influence +15",
+    "Bonus - All City-State Influence +30",
+    "Bonus - All City Population +1",
+    "Bonus - All City Population +2",
+    "Bonus - New City Extra Population +1",
+    "Bonus - New City Extra Population +2",
+    "Bonus - Extra Happiness Per City +1",
+    "Bonus - Extra Happiness Per City +2",
+    "Bonus - Culture Per Turn For Free +50",
+    "Bonus - All Unit Experience +15",
+    "Bonus - All Unit Experience +35",
+    "Bonus - All Unit Experience +80",
+    "Bonus - All Unit Free Promotion",
+    "Bonus - Golden Age",
+    "Policy Branch - Liberty",
+    "Policy - Collective Rule",
+    "Policy - Citizenship",
+    "Policy - Republic",
+    "Policy - Representation",
+    "Policy - Meritocracy",
+    "Policy Branch - Tradition",
+    "Policy - Aristocracy",
+    "Policy - Oligarchy",
+    "Policy - Legalism",
+    "Policy - Landed Elite",
+    "Policy - Monarchy",
+    "Policy Branch - Honor",
+    "Policy - Warrior Code",
+    "Policy - Discipline",
+    "Policy - Military Tradition",
+    "Policy - Military Caste",
+    "Policy - Professional Army",
+    "Policy Branch - Piety",
+    "Policy - Organized Religion",
+    "Policy - Mandate of Heaven",
+    "Policy - Theocracy",
+    "Policy - Reformation",
+    "Policy - Religious Tolerance",
+    "Policy Branch - Patronage",
+    "Policy - Philanthropy",
+    "Policy - Consulates",
+    "Policy - Scholasticism",
+    "Policy - Cultural Diplomacy",
+    "Policy - Merchant Confederacy",
+    "Policy Branch - Commerce",
+    "Policy - Mercenary Army",
+    "Policy - Entrepreneurship",
+    "Policy - Mercantilism",
+    "Policy - Wagon Trains",
+    "Policy - Protectionism",
+    "Policy Branch - Rationalism",
+    "Policy - Secularism",
+    "Policy - Humanism",
+    "Policy - Free Thought",
+    "Policy - Sovereignty",
+    "Policy - Scientific Revolution",
+    "Policy Branch - Tradition Finisher",
+    "Policy Branch - Liberty Finisher",
+    "Policy Branch - Honor Finisher",
+    "Policy Branch - Piety Finisher",
+    "Policy Branch - Patronage Finisher",
+    "Policy Branch - Commerce Finisher",
+    "Policy Branch - Rationalism Finisher",
+    "Policy Branch - Aesthetics",
+    "Policy - Cultural Centers",
+    "Policy - Fine Arts",
+    "Policy - Flourishing of the Arts",
+    "Policy - Artistic Genius",
+    "Policy - Cultural Exchange",
+    "Policy Branch - Aesthetics Finisher",
+    "Policy Branch - Exploration",
+    "Policy - Maritime Infrastructure",
+    "Policy - Naval Tradition",
+    "Policy - Merchant Navy",
+    "Policy - Navigation School",
+    "Policy - Treasure Fleets",
+    "Policy Branch - Exploration Finisher",
+    "Promotion - Shock I",
+    "Promotion - Shock II",
+    "Promotion - Shock III",
+    "Promotion - Drill I",
+    "Promotion - Drill II",
+    "Promotion - Drill III",
+    "Promotion - Accuracy I",
+    "Promotion - Accuracy II",
+    "Promotion - Accuracy III",
+    "Promotion - Barrage I",
+    "Promotion - Barrage II",
+    "Promotion - Barrage III",
+    "Promotion - Targeting I",
+    "Promotion - Targeting II",
+    "Promotion - Targeting III",
+    "Promotion - Sentry",
+    "Promotion - Siege",
+    "Promotion - Volley",
+    "Promotion - Medic I",
+    "Promotion - Medic II",
+    "Promotion - Amphibious",
+    "Promotion - Cover I",
+    "Promotion - Cover II",
+    "Promotion - Charge",
+    "Promotion - Formation I",
+    "Promotion - Formation II",
+    "Promotion - Ambush I",
+    "Promotion - Ambush II",
+    "Promotion - Supply",
+    "Promotion - March",
+    "Promotion - Blitz",
+    "Promotion - Woodsman",
+    "Promotion - Logistics",
+    "Promotion - Range",
+    "Promotion - Mobility",
+    "Promotion - Interception I",
+    "Promotion - Interception II",
+    "Promotion - Interception III",
+    "Promotion - Dogfighting I",
+    "Promotion - Dogfighting II",
+    "Promotion - Dogfighting III",
+    "Promotion - Air Siege I",
+    "Promotion - Air Siege II",
+    "Promotion - Air Siege III",
+    "Promotion - Bombardment I",
+    "Promotion - Bombardment II",
+    "Promotion - Bombardment III",
+    "Promotion - Air Targeting I",
+    "Promotion - Air Targeting II",
+    "Promotion - Air Ambush I",
+    "Promotion - Air Ambush II",
+    "Promotion - Air Range",
+    "Promotion - Sortie",
+    "Promotion - Repair",
+    "Promotion - Air Repair",
+    "Promotion - Air Logistics",
+    "Promotion - Evasion",
+    "Promotion - Scouting I",
+    "Promotion - Scouting II",
+    "Promotion - Scouting III",
+    "Promotion - Survivalism I",
+    "Promotion - Survivalism II",
+    "Promotion - Survivalism III",
+    "Promotion - Heli Ambush I",
+    "Promotion - Heli Ambush II",
+    "Promotion - Heli Mobility I",
+    "Promotion - Heli Mobility II",
+    "Promotion - Heli Repair",
+    "Promotion - Coastal Raider I",
+    "Promotion - Coastal Raider II",
+    "Promotion - Coastal Raider III",
+    "Promotion - Boarding Party I",
+    "Promotion - Boarding Party II",
+    "Promotion - Boarding Party III",
+    "Promotion - Wolfpack I",
+    "Promotion - Wolfpack II",
+    "Promotion - Wolfpack III",
+    "Promotion - Flight Deck I",
+    "Promotion - Flight Deck II",
+    "Promotion - Flight Deck III",
+    "Promotion - Armor Plating I",
+    "Promotion - Armor Plating II",
+    "Promotion - Armor Plating III",
+    "Settler - Progressive",
+    "Tech - Progressive Growth",
+    "Tech - Progressive Production",
+    "Tech - Progressive Science",
+    "Tech - Progressive Culture",
+    "Tech - Progressive Gold",
+    "Tech - Progressive Happiness",
+    "Tech - Progressive Navy",
+    "Tech - Progressive Melee Unit",
+    "Tech - Progressive Ranged Unit",
+    "Tech - Progressive Siege Unit",
+    "Tech - Progressive Misc",
+    "Tech - Pottery",
+    "Tech - Animal Husbandry",
+    "Tech - Archery",
+    "Tech - Mining",
+    "Tech - Sailing",
+    "Tech - Calendar",
+    "Tech - Writing",
+    "Tech - Trapping",
+    "Tech - The Wheel",
+    "Tech - Masonry",
+    "Tech - Bronze Working",
+    "Tech - Optics",
+    "Tech - Horseback Riding",
+    "Tech - Mathematics",
+    "Tech - Construction",
+    "Tech - Philosophy",
+    "Tech - Drama and Poetry",
+    "Tech - Currency",
+    "Tech - Engineering",
+    "Tech - Iron Working",
+    "Tech - Theology",
+    "Tech - Civil Service",
+    "Tech - Guilds",
+    "Tech - Metal Casting",
+    "Tech - Compass",
+    "Tech - Education",
+    "Tech - Chivalry",
+    "Tech - Machinery",
+    "Tech - Physics",
+    "Tech - Steel",
+    "Tech - Astronomy",
+    "Tech - Acoustics",
+    "Tech - Banking",
+    "Tech - Printing Press",
+    "Tech - Gunpowder",
+    "Tech - Navigation",
+    "Tech - Architecture",
+    "Tech - Economics",
+    "Tech - Metallurgy",
+    "Tech - Chemistry",
+    "Tech - Archaeology",
+    "Tech - Scientific Theory",
+    "Tech - Industrialization",
+    "Tech - Rifling",
+    "Tech - Military Science",
+    "Tech - Fertilizer",
+    "Tech - Biology",
+    "Tech - Electricity",
+    "Tech - Steam Power",
+    "Tech - Dynamite",
+    "Tech - Refrigeration",
+    "Tech - Radio",
+    "Tech - Replaceable Parts",
+    "Tech - Flight",
+    "Tech - Railroad",
+    "Tech - Plastics",
+    "Tech - Electronics",
+    "Tech - Ballistics",
+    "Tech - Combustion",
+    "Tech - Penicillin",
+    "Tech - Atomic Theory",
+    "Tech - Radar",
+    "Tech - Combined Arms",
+    "Tech - Ecology",
+    "Tech - Nuclear Fission",
+    "Tech - Rocketry",
+    "Tech - Computers",
+    "Tech - Telecommunications",
+    "Tech - Mobile Tactics",
+    "Tech - Advanced Ballistics",
+    "Tech - Satellites",
+    "Tech - Robotics",
+    "Tech - Lasers",
+    "Tech - The Internet",
+    "Tech - Globalization",
+    "Tech - Particle Physics",
+    "Tech - Nuclear Fusion",
+    "Tech - Nanotechnology",
+    "Tech - Stealth",
+    "Trap - Gold -50",
+    "Trap - Gold -100",
+    "Trap - Gold -250",
+    "Trap - Culture -50",
+    "Trap - Culture -100",
+    "Trap - Culture -250",
+    "Trap - Faith -25",
+    "Trap - Faith -50",
+    "Trap - Faith -125",
+    "Trap - All City-State Influence -15",
+    "Trap - All City-State Influence -30",
+    "Trap - All City Population -1",
+    "Trap - All City Population -2",
+    "Trap - Barbarians 1",
+    "Trap - Barbarians 3",
+    "Trap - Barbarians 6",
+    "Trap - Shuffle Units",
+    "Trap - Denounce",
+    "Trap - War",
+)
+"Names of all defined items, in order of their AP ID"
+LOCATION_NAMES: tuple[str, ...] = (
+    "Building - Seaport",
+    "Building - Stable",
+    "Building - Water Mill",
+    "Building - Circus",
+    "Building - Forge",
+    "Building - Windmill",
+    "Building - Hydro Plant",
+    "Building - Solar Plant",
+    "Building - Mint",
+    "Building - Observatory",
+    "Building - Garden",
+    "Building - Lighthouse",
+    "Building - Harbor",
+    "Building - Colosseum",
+    "Building - Zoo",
+    "Building - Stadium",
+    "Building - Monument",
+    "Building - Temple",
+    "Building - Opera House",
+    "Building - Museum",
+    "Building - Broadcast Tower",
+    "Building - Barracks",
+    "Building - Armory",
+    "Building - Military Academy",
+    "Building - Arsenal",
+    "Building - Walls",
+    "Building - Castle",
+    "Building - Military Base",
+    "Building - Granary",
+    "Building - Hospital",
+    "Building - Medical Lab",
+    "Building - Workshop",
+    "Building - Factory",
+    "Building - Nuclear Plant",
+    "Building - Spaceship Factory",
+    "Building - Market",
+    "Building - Bank",
+    "Building - Stock Exchange",
+    "Building - Library",
+    "Building - University",
+    "Building - Public School",
+    "Building - Research Lab",
+    "Building - Aqueduct",
+    "Building - Stone Works",
+    "Building - Amphitheater",
+    "Building - Shrine",
+    "Building - Recycling Center",
+    "Building - Bomb Shelter",
+    "Building - Constabulary",
+    "Building - Police Station",
+    "Building - Hotel",
+    "Building - Caravansary",
+    "Building - Airport",
+    "National Wonder - Heroic Epic",
+    "National Wonder - National College",
+    "National Wonder - National Epic",
+    "National Wonder - Circus Maximus",
+    "National Wonder - East India Company",
+    "National Wonder - Ironworks",
+    "National Wonder - Oxford University",
+    "National Wonder - Hermitage",
+    "National Wonder - National Intelligence Agency",
+    "National Wonder - Grand Temple",
+    "National Wonder - National Visitor Center",
+    "National Wonder - Writers' Guild",
+    "National Wonder - Artists' Guild",
+    "National Wonder - Musicians' Guild",
+    "Policy Branch - Tradition",
+    "Policy Branch - Liberty",
+    "Policy Branch - Honor",
+    "Policy Branch - Piety",
+    "Policy Branch - Patronage",
+    "Policy Branch - Aesthetics",
+    "Policy Branch - Commerce",
+    "Policy Branch - Exploration",
+    "Policy Branch - Rationalism",
+    "Policy Branch - Tradition Finished",
+    "Policy Branch - Liberty Finished",
+    "Policy Branch - Honor Finished",
+    "Policy Branch - Piety Finished",
+    "Policy Branch - Patronage Finished",
+    "Policy Branch - Aesthetics Finished",
+    "Policy Branch - Commerce Finished",
+    "Policy Branch - Exploration Finished",
+    "Policy Branch - Rationalism Finished",
+    "Policy - Tradition AP 1",
+    "Policy - Tradition AP 2",
+    "Policy - Tradition AP 3",
+    "Policy - Tradition AP 4",
+    "Policy - Tradition AP 5",
+    "Policy - Liberty AP 1",
+    "Policy - Liberty AP 2",
+    "Policy - Liberty AP 3",
+    "Policy - Liberty AP 4",
+    "Policy - Liberty AP 5",
+    "Policy - Honor AP 1",
+    "Policy - Honor AP 2",
+    "Policy - Honor AP 3",
+    "Policy - Honor AP 4",
+    "Policy - Honor AP 5",
+    "Policy - Piety AP 1",
+    "Policy - Piety AP 2",
+    "Policy - Piety AP 3",
+    "Policy - Piety AP 4",
+    "Policy - Piety AP 5",
+    "Policy - Patronage AP 1",
+    "Policy - Patronage AP 2",
+    "Policy - Patronage AP 3",
+    "Policy - Patronage AP 4",
+    "Policy - Patronage AP 5",
+    "Policy - Aesthetics AP 1",
+    "Policy - Aesthetics AP 2",
+    "Policy - Aesthetics AP 3",
+    "Policy - Aesthetics AP 4",
+    "Policy - Aesthetics AP 5",
+    "Policy - Commerce AP 1",
+    "Policy - Commerce AP 2",
+    "Policy - Commerce AP 3",
+    "Policy - Commerce AP 4",
+    "Policy - Commerce AP 5",
+    "Policy - Exploration AP 1",
+    "Policy - Exploration AP 2",
+    "Policy - Exploration AP 3",
+    "Policy - Exploration AP 4",
+    "Policy - Exploration AP 5",
+    "Policy - Rationalism AP 1",
+    "Policy - Rationalism AP 2",
+    "Policy - Rationalism AP 3",
+    "Policy - Rationalism AP 4",
+    "Policy - Rationalism AP 5",
+    "Promotion - Archer AP A1",
+    "Promotion - Archer AP A2",
+    "Promotion - Archer AP A3",
+    "Promotion - Archer AP A4",
+    "Promotion - Archer AP B1",
+    "Promotion - Archer AP B2",
+    "Promotion - Archer AP B3",
+    "Promotion - Armor AP A1",
+    "Promotion - Armor AP A2",
+    "Promotion - Armor AP A3",
+    "Promotion - Armor AP A4",
+    "Promotion - Armor AP B1",
+    "Promotion - Armor AP B2",
+    "Promotion - Armor AP B3",
+    "Promotion - Bomber AP A1",
+    "Promotion - Bomber AP A2",
+    "Promotion - Bomber AP A3",
+    "Promotion - Bomber AP A4",
+    "Promotion - Bomber AP B1",
+    "Promotion - Bomber AP B2",
+    "Promotion - Bomber AP B3",
+    "Promotion - Carrier AP A1",
+    "Promotion - Carrier AP A2",
+    "Promotion - Carrier AP A3",
+    "Promotion - Fighter AP A1",
+    "Promotion - Fighter AP A2",
+    "Promotion - Fighter AP A3",
+    "Promotion - Fighter AP A4",
+    "Promotion - Fighter AP B1",
+    "Promotion - Fighter AP B2",
+    "Promotion - Fighter AP B3",
+    "Promotion - Gun AP A1",
+    "Promotion - Gun AP A2",
+    "Promotion - Gun AP A3",
+    "Promotion - Gun AP A4",
+    "Promotion - Gun AP B1",
+    "Promotion - Gun AP B2",
+    "Promotion - Gun AP B3",
+    "Promotion - Helicopter AP A1",
+    "Promotion - Helicopter AP A2",
+    "Promotion - Helicopter AP A3",
+    "Promotion - Melee AP A1",
+    "Promotion - Melee AP A2",
+    "Promotion - Melee AP A3",
+    "Promotion - Melee AP A4",
+    "Promotion - Melee AP B1",
+    "Promotion - Melee AP B2",
+    "Promotion - Melee AP B3",
+    "Promotion - Mounted AP A1",
+    "Promotion - Mounted AP A2",
+    "Promotion - Mounted AP A3",
+    "Promotion - Mounted AP A4",
+    "Promotion - Mounted AP B1",
+    "Promotion - Mounted AP B2",
+    "Promotion - Mounted AP B3",
+    "Promotion - Naval Melee AP A1",
+    "Promotion - Naval Melee AP A2",
+    "Promotion - Naval Melee AP A3",
+    "Promotion - Naval Melee AP A4",
+    "Promotion - Naval Melee AP B1",
+    "Promotion - Naval Melee AP B2",
+    "Promotion - Naval Melee AP B3",
+    "Promotion - Naval_Ranged AP A1",
+    "Promotion - Naval Ranged AP A2",
+    "Promotion - Naval Ranged AP A3",
+    "Promotion - Naval Ranged AP A4",
+    "Promotion - Naval Ranged AP B1",
+    "Promotion - Naval Ranged AP B2",
+    "Promotion - Naval Ranged AP B3",
+    "Promotion - Recon AP A1",
+    "Promotion - Recon AP A2",
+    "Promotion - Recon AP A3",
+    "Promotion - Siege AP A1",
+    "Promotion - Siege AP A2",
+    "Promotion - Siege AP A3",
+    "Promotion - Siege AP A4",
+    "Promotion - Siege AP B1",
+    "Promotion - Siege AP B2",
+    "Promotion - Siege AP B3",
+    "Promotion - Submarine AP A1",
+    "Promotion - Submarine AP A2",
+    "Promotion - Submarine AP A3",
+    "Promotion - Submarine AP A4",
+    "Unit - Settler #1",
+    "Unit - Settler #2",
+    "Unit - Settler #3",
+    "Unit - Settler #4",
+    "Unit - Settler #5",
+    "Unit - Settler #6",
+    "Unit - Settler #7",
+    "Unit - Settler #8",
+    "Unit - Settler #9",
+    "Unit - Settler #10",
+    "Unit - Settler #11",
+    "Unit - Settler #12",
+    "Unit - Settler #13",
+    "Unit - Settler #14",
+    "Unit - Settler #15",
+    "Unit - Settler #16",
+    "Unit - Settler #17",
+    "Unit - Settler #18",
+    "Unit - Settler #19",
+    "Unit - Settler #20",
+    "Tech - Ancient AP 1",
+    "Tech - Ancient AP 2",
+    "Tech - Ancient AP 3",
+    "Tech - Ancient AP 4",
+    "Tech - Ancient AP 5",
+    "Tech - Ancient AP 6",
+    "Tech - Ancient AP 7",
+    "Tech - Ancient AP 8",
+    "Tech - Ancient AP 9",
+    "Tech - Ancient AP 10",
+    "Tech - Ancient AP 11",
+    "Tech - Classical AP 1",
+    "Tech - Classical AP 2",
+    "Tech - Classical AP 3",
+    "Tech - Classical AP 4",
+    "Tech - Classical AP 5",
+    "Tech - Classical AP 6",
+    "Tech - Classical AP 7",
+    "Tech - Classical AP 8",
+    "Tech - Classical AP 9",
+    "Tech - Medieval AP 1",
+    "Tech - Medieval AP 2",
+    "Tech - Medieval AP 3",
+    "Tech - Medieval AP 4",
+    "Tech - Medieval AP 5",
+    "Tech - Medieval AP 6",
+    "Tech - Medieval AP 7",
+    "Tech - Medieval AP 8",
+    "Tech - Medieval AP 9",
+    "Tech - Medieval AP 10",
+    "Tech - Renaissance AP 1",
+    "Tech - Renaissance AP 2",
+    "Tech - Renaissance AP 3",
+    "Tech - Renaissance AP 4",
+    "Tech - Renaissance AP 5",
+    "Tech - Renaissance AP 6",
+    "Tech - Renaissance AP 7",
+    "Tech - Renaissance AP 8",
+    "Tech - Renaissance AP 9",
+    "Tech - Renaissance AP 10",
+    "Tech - Industrial AP 1",
+    "Tech - Industrial AP 2",
+    "Tech - Industrial AP 3",
+    "Tech - Industrial AP 4",
+    "Tech - Industrial AP 5",
+    "Tech - Industrial AP 6",
+    "Tech - Industrial AP 7",
+    "Tech - Industrial AP 8",
+    "Tech - Industrial AP 9",
+    "Tech - Industrial AP 10",
+    "Tech - Modern AP 1",
+    "Tech - Modern AP 2",
+    "Tech - Modern AP 3",
+    "Tech - Modern AP 4",
+    "Tech - Modern AP 5",
+    "Tech - Modern AP 6",
+    "Tech - Modern AP 7",
+    "Tech - Modern AP 8",
+    "Tech - Modern AP 9",
+    "Tech - Atomic AP 1",
+    "Tech - Atomic AP 2",
+    "Tech - Atomic AP 3",
+    "Tech - Atomic AP 4",
+    "Tech - Atomic AP 5",
+    "Tech - Atomic AP 6",
+    "Tech - Atomic AP 7",
+    "Tech - Atomic AP 8",
+    "Tech - Information AP 1",
+    "Tech - Information AP 2",
+    "Tech - Information AP 3",
+    "Tech - Information AP 4",
+    "Tech - Information AP 5",
+    "Tech - Information AP 6",
+    "Tech - Information AP 7",
+    "Tech - Information AP 8",
+    "Tech - Information AP 9",
+    "Tech - Information AP 10",
+    "Tech - Information AP 11",
+    "Tech - Information AP 12",
+    "Tech - Ancient AP 12",
+    "Tech - Classical AP 10",
+    "Tech - Medieval AP 11",
+    "Tech - Renaissance AP 11",
+    "Tech - Industrial AP 11",
+    "Tech - Modern AP 10",
+    "Tech - Atomic AP 9",
+    "Unit - Settler",
+    "Unit - Worker",
+    "Unit - Work Boat",
+    "Unit - Missile Cruiser",
+    "Unit - Nuclear Submarine",
+    "Unit - Carrier",
+    "Unit - Battleship",
+    "Unit - Submarine",
+    "Unit - Destroyer",
+    "Unit - Ironclad",
+    "Unit - Frigate",
+    "Unit - Caravel",
+    "Unit - Trireme",
+    "Unit - Giant Death Robot",
+    "Unit - Nuclear Missile",
+    "Unit - Stealth Bomber",
+    "Unit - Jet Fighter",
+    "Unit - Guided Missile",
+    "Unit - Modern Armor",
+    "Unit - Helicopter Gunship",
+    "Unit - Mobile SAM",
+    "Unit - Rocket Artillery",
+    "Unit - Mechanized Infantry",
+    "Unit - Atomic Bomb",
+    "Unit - Bomber",
+    "Unit - Fighter",
+    "Unit - Paratrooper",
+    "Unit - Tank",
+    "Unit - Artillery",
+    "Unit - Anti-Aircraft Gun",
+    "Unit - Anti-Tank Gun",
+    "Unit - Infantry",
+    "Unit - Cavalry",
+    "Unit - Rifleman",
+    "Unit - Lancer",
+    "Unit - Cannon",
+    "Unit - Musketman",
+    "Unit - Longswordsman",
+    "Unit - Trebuchet",
+    "Unit - Knight",
+    "Unit - Crossbowman",
+    "Unit - Pikeman",
+    "Unit - Landsknecht",
+    "Unit - Catapult",
+    "Unit - Horseman",
+    "Unit - Swordsman",
+    "Unit - Chariot Archer",
+    "Unit - Spearman",
+    "Unit - Archer",
+    "Unit - Scout",
+    "Unit - Warrior",
+    "Unit - Composite Bowman",
+    "Unit - Galleass",
+    "Unit - Great War Infantry",
+    "Unit - Marine",
+    "Unit - Triplane",
+    "Unit - Great War Bomber",
+    "Unit - Landship",
+    "Unit - Machine Gun",
+    "Unit - Privateer",
+    "Unit - Gatling Gun",
+    "Unit - Cargo Ship",
+    "Unit - Caravan",
+    "Unit - Archaeologist",
+    "Unit - Bazooka",
+    "Unit - XCOM Squad",
+    "World Wonder - Great Lighthouse",
+    "World Wonder - Stonehenge",
+    "World Wonder - Great Library",
+    "World Wonder - Pyramids",
+    "World Wonder - Colossus",
+    "World Wonder - Oracle",
+    "World Wonder - Hanging Gardens",
+    "World Wonder - Great Wall",
+    "World Wonder - Angkor Wat",
+    "World Wonder - Hagia Sophia",
+    "World Wonder - Chichen Itza",
+    "World Wonder - Machu Picchu",
+    "World Wonder - Notre Dame",
+    "World Wonder - Porcelain Tower",
+    "World Wonder - Himeji Castle",
+    "World Wonder - Sistine Chapel",
+    "World Wonder - Kremlin",
+    "World Wonder - Forbidden Palace",
+    "World Wonder - Taj Mahal",
+    "World Wonder - Big Ben",
+    "World Wonder - Louvre",
+    "World Wonder - Brandenburg Gate",
+    "World Wonder - Statue of Liberty",
+    "World Wonder - Cristo Redentor",
+    "World Wonder - Eiffel Tower",
+    "World Wonder - Pentagon",
+    "World Wonder - Sydney Opera House",
+    "World Wonder - Statue of Zeus",
+    "World Wonder - Temple of Artemis",
+    "World Wonder - Mausoleum of Halicarnassus",
+    "World Wonder - Alhambra",
+    "World Wonder - CN Tower",
+    "World Wonder - Hubble Space Telescope",
+    "World Wonder - Leaning Tower of Pisa",
+    "World Wonder - Great Mosque of Djenne",
+    "World Wonder - Neuschwanstein",
+    "World Wonder - Petra",
+    "World Wonder - Terracotta Army",
+    "World Wonder - Great Firewall",
+    "World Wonder - Uffizi",
+    "World Wonder - Globe Theatre",
+    "World Wonder - Broadway",
+    "World Wonder - Red Fort",
+    "World Wonder - Prora",
+    "World Wonder - Borobudur",
+    "World Wonder - Parthenon",
+    "World Wonder - International Space Station",
+)
+"Names of all defined locations, in order of their AP ID"
+ITEM_GROUPS: dict[str, tuple[str, ...]] = {
+    "ancient_era": (
+        "Tech - Pottery",
+        "Tech - Animal Husbandry",
+        "Tech - Archery",
+        "Tech - Mining",
+        "Tech - Sailing",
+        "Tech - Calendar",
+        "Tech - Writing",
+        "Tech - Trapping",
+        "Tech - The Wheel",
+        "Tech - Masonry",
+        "Tech - Bronze Working",
+    ),
+    "atomic_era": (
+        "Tech - Penicillin",
+        "Tech - Atomic Theory",
+        "Tech - Radar",
+        "Tech - Combined Arms",
+        "Tech - Ecology",
+        "Tech - Nuclear Fission",
+        "Tech - Rocketry",
+        "Tech - Computers",
+    ),
+    "bonus": (
+        "Bonus - Gold +100",
+        "Bonus - Gold +250",
+        "Bonus - Gold +1000",
+        "Bonus - Culture +100",
+        "Bonus - Culture +250",
+        "Bonus - Culture +1000",
+        "Bonus - Faith +50",
+        "Bonus - Faith +125",
+        "Bonus - Faith +500",
+        "Bonus - Snack from Thes",
+        "Bonus - Free Great Person",
+        "Bonus - Free Policy",
+        "Bonus - Free Tech",
+        "Bonus - Free Unit",
+        "Bonus - Free Worker",
+        "Bonus - All City-State Influence +15",
+        "Bonus - All City-State Influence +30",
+        "Bonus - All City Population +1",
+        "Bonus - All City Population +2",
+        "Bonus - New City Extra Population +1",
+        "Bonus - New City Extra Population +2",
+        "Bonus - Extra Happiness Per City +1",
+        "Bonus - Extra Happiness Per City +2",
+        "Bonus - Culture Per Turn For Free +50",
+        "Bonus - All Unit Experience +15",
+        "Bonus - All Unit Experience +35",
+        "Bonus - All Unit Experience +80",
+        "Bonus - All Unit Free Promotion",
+        "Bonus - Golden Age",
+    ),
+    "classical_era": (
+        "Tech - Optics",
+        "Tech - Horseback Riding",
+        "Tech - Mathematics",
+        "Tech - Construction",
+        "Tech - Philosophy",
+        "Tech - Drama and Poetry",
+        "Tech - Currency",
+        "Tech - Engineering",
+        "Tech - Iron Working",
+    ),
+    "era": (
+        "Era - Progressive",
+    ),
+    "industrial_era": (
+        "Tech - Archaeology",
+        "Tech - Scientific Theory",
+        "Tech - Industrialization",
+        "Tech - Rifling",
+        "Tech - Military Science",
+        "Tech - Fertilizer",
+        "Tech - Biology",
+        "Tech - Electricity",
+        "Tech - Steam Power",
+        "Tech - Dynamite",
+    ),
+    "information_era": (
+        "Tech - Telecommunications",
+        "Tech - Mobile Tactics",
+        "Tech - Advanced Ballistics",
+        "Tech - Satellites",
+        "Tech - Robotics",
+        "Tech - Lasers",
+        "Tech - The Internet",
+        "Tech - Globalization",
+        "Tech - Particle Physics",
+        "Tech - Nuclear Fusion",
+        "Tech - Nanotechnology",
+        "Tech - Stealth",
+    ),
+    "medieval_era": (
+        "Tech - Theology",
+        "Tech - Civil Service",
+        "Tech - Guilds",
+        "Tech - Metal Casting",
+        "Tech - Compass",
+        "Tech - Education",
+        "Tech - Chivalry",
+        "Tech - Machinery",
+        "Tech - Physics",
+        "Tech - Steel",
+    ),
+    "modern_era": (
+        "Tech - Refrigeration",
+        "Tech - Radio",
+        "Tech - Replaceable Parts",
+        "Tech - Flight",
+        "Tech - Railroad",
+        "Tech - Plastics",
+        "Tech - Electronics",
+        "Tech - Ballistics",
+        "Tech - Combustion",
+    ),
+    "policy": (
+        "Policy Branch - Liberty",
+        "Policy - Collective Rule",
+        "Policy - Citizenship",
+        "Policy - Republic",
+        "Policy - Representation",
+        "Policy - Meritocracy",
+        "Policy Branch - Tradition",
+        "Policy - Aristocracy",
+        "Policy - Oligarchy",
+        "Policy - Legalism",
+        "Policy - Landed Elite",
+        "Policy - Monarchy",
+        "Policy Branch - Honor",
+        "Policy - Warrior Code",
+        "Policy - Discipline",
+        "Policy - Military Tradition",
+        "Policy - Military Caste",
+        "Policy - Professional Army",
+        "Policy Branch - Piety",
+        "Policy - Organized Religion",
+        "Policy - Mandate of Heaven",
+        "Policy - Theocracy",
+        "Policy - Reformation",
+        "Policy - Religious Tolerance",
+        "Policy Branch - Patronage",
+        "Policy - Philanthropy",
+        "Policy - Consulates",
+        "Policy - Scholasticism",
+        "Policy - Cultural Diplomacy",
+        "Policy - Merchant Confederacy",
+        "Policy Branch - Commerce",
+        "Policy - Mercenary Army",
+        "Policy - Entrepreneurship",
+        "Policy - Mercantilism",
+        "Policy - Wagon Trains",
+        "Policy - Protectionism",
+        "Policy Branch - Rationalism",
+        "Policy - Secularism",
+        "Policy - Humanism",
+        "Policy - Free Thought",
+        "Policy - Sovereignty",
+        "Policy - Scientific Revolution",
+        "Policy Branch - Tradition Finisher",
+        "Policy Branch - Liberty Finisher",
+        "Policy Branch - Honor Finisher",
+        "Policy Branch - Piety Finisher",
+        "Policy Branch - Patronage Finisher",
+        "Policy Branch - Commerce Finisher",
+        "Policy Branch - Rationalism Finisher",
+        "Policy Branch - Aesthetics",
+        "Policy - Cultural Centers",
+        "Policy - Fine Arts",
+        "Policy - Flourishing of the Arts",
+        "Policy - Artistic Genius",
+        "Policy - Cultural Exchange",
+        "Policy Branch - Aesthetics Finisher",
+        "Policy Branch - Exploration",
+        "Policy - Maritime Infrastructure",
+        "Policy - Naval Tradition",
+        "Policy - Merchant Navy",
+        "Policy - Navigation School",
+        "Policy - Treasure Fleets",
+        "Policy Branch - Exploration Finisher",
+    ),
+    "promotion": (
+        "Promotion - Shock I",
+        "Promotion - Shock II",
+        "Promotion - Shock III",
+        "Promotion - Drill I",
+        "Promotion - Drill II",
+        "Promotion - Drill III",
+        "Promotion - Accuracy I",
+        "Promotion - Accuracy II",
+        "Promotion - Accuracy III",
+        "Promotion - Barrage I",
+        "Promotion - Barrage II",
+        "Promotion - Barrage III",
+        "Promotion - Targeting I",
+        "Promotion - Targeting II",
+        "Promotion - Targeting III",
+        "Promotion - Sentry",
+        "Promotion - Siege",
+        "Promotion - Volley",
+        "Promotion - Medic I",
+        "Promotion - Medic II",
+        "Promotion - Amphibious",
+        "Promotion - Cover I",
+        "Promotion - Cover II",
+        "Promotion - Charge",
+        "Promotion - Formation I",
+        "Promotion - Formation II",
+        "Promotion - Ambush I",
+        "Promotion - Ambush II",
+        "Promotion - Supply",
+        "Promotion - March",
+        "Promotion - Blitz",
+        "Promotion - Woodsman",
+        "Promotion - Logistics",
+        "Promotion - Range",
+        "Promotion - Mobility",
+        "Promotion - Interception I",
+        "Promotion - Interception II",
+        "Promotion - Interception III",
+        "Promotion - Dogfighting I",
+        "Promotion - Dogfighting II",
+        "Promotion - Dogfighting III",
+        "Promotion - Air Siege I",
+        "Promotion - Air Siege II",
+        "Promotion - Air Siege III",
+        "Promotion - Bombardment I",
+        "Promotion - Bombardment II",
+        "Promotion - Bombardment III",
+        "Promotion - Air Targeting I",
+        "Promotion - Air Targeting II",
+        "Promotion - Air Ambush I",
+        "Promotion - Air Ambush II",
+        "Promotion - Air Range",
+        "Promotion - Sortie",
+        "Promotion - Repair",
+        "Promotion - Air Repair",
+        "Promotion - Air Logistics",
+        "Promotion - Evasion",
+        "Promotion - Scouting I",
+        "Promotion - Scouting II",
+        "Promotion - Scouting III",
+        "Promotion - Survivalism I",
+        "Promotion - Survivalism II",
+        "Promotion - Survivalism III",
+        "Promotion - Heli Ambush I",
+        "Promotion - Heli Ambush II",
+        "Promotion - Heli Mobility I",
+        "Promotion - Heli Mobility II",
+        "Promotion - Heli Repair",
+        "Promotion - Coastal Raider I",
+        "Promotion - Coastal Raider II",
+        "Promotion - Coastal Raider III",
+        "Promotion - Boarding Party I",
+        "Promotion - Boarding Party II",
+        "Promotion - Boarding Party III",
+        "Promotion - Wolfpack I",
+        "Promotion - Wolfpack II",
+        "Promotion - Wolfpack III",
+        "Promotion - Flight Deck I",
+        "Promotion - Flight Deck II",
+        "Promotion - Flight Deck III",
+        "Promotion - Armor Plating I",
+        "Promotion - Armor Plating II",
+        "Promotion - Armor Plating III",
+    ),
+    "renaissance_era": (
+        "Tech - Astronomy",
+        "Tech - Acoustics",
+        "Tech - Banking",
+        "Tech - Printing Press",
+        "Tech - Gunpowder",
+        "Tech - Navigation",
+        "Tech - Architecture",
+        "Tech - Economics",
+        "Tech - Metallurgy",
+        "Tech - Chemistry",
+    ),
+    "settler": (
+        "Settler - Progressive",
+    ),
+    "tech": (
+        "Tech - Progressive Growth",
+        "Tech - Progressive Production",
+        "Tech - Progressive Science",
+        "Tech - Progressive Culture",
+        "Tech - Progressive Gold",
+        "Tech - Progressive Happiness",
+        "Tech - Progressive Navy",
+        "Tech - Progressive Melee Unit",
+        "Tech - Progressive Ranged Unit",
+        "Tech - Progressive Siege Unit",
+        "Tech - Progressive Misc",
+        "Tech - Pottery",
+        "Tech - Animal Husbandry",
+        "Tech - Archery",
+        "Tech - Mining",
+        "Tech - Sailing",
+        "Tech - Calendar",
+        "Tech - Writing",
+        "Tech - Trapping",
+        "Tech - The Wheel",
+        "Tech - Masonry",
+        "Tech - Bronze Working",
+        "Tech - Optics",
+        "Tech - Horseback Riding",
+        "Tech - Mathematics",
+        "Tech - Construction",
+        "Tech - Philosophy",
+        "Tech - Drama and Poetry",
+        "Tech - Currency",
+        "Tech - Engineering",
+        "Tech - Iron Working",
+        "Tech - Theology",
+        "Tech - Civil Service",
+        "Tech - Guilds",
+        "Tech - Metal Casting",
+        "Tech - Compass",
+        "Tech - Education",
+        "Tech - Chivalry",
+        "Tech - Machinery",
+        "Tech - Physics",
+        "Tech - Steel",
+        "Tech - Astronomy",
+        "Tech - Acoustics",
+        "Tech - Banking",
+        "Tech - Printing Press",
+        "Tech - Gunpowder",
+        "Tech - Navigation",
+        "Tech - Architecture",
+        "Tech - Economics",
+        "Tech - Metallurgy",
+        "Tech - Chemistry",
+        "Tech - Archaeology",
+        "Tech - Scientific Theory",
+        "Tech - Industrialization",
+        "Tech - Rifling",
+        "Tech - Military Science",
+        "Tech - Fertilizer",
+        "Tech - Biology",
+        "Tech - Electricity",
+        "Tech - Steam Power",
+        "Tech - Dynamite",
+        "Tech - Refrigeration",
+        "Tech - Radio",
+        "Tech - Replaceable Parts",
+        "Tech - Flight",
+        "Tech - Railroad",
+        "Tech - Plastics",
+        "Tech - Electronics",
+        "Tech - Ballistics",
+        "Tech - Combustion",
+        "Tech - Penicillin",
+        "Tech - Atomic Theory",
+        "Tech - Radar",
+        "Tech - Combined Arms",
+        "Tech - Ecology",
+        "Tech - Nuclear Fission",
+        "Tech - Rocketry",
+        "Tech - Computers",
+        "Tech - Telecommunications",
+        "Tech - Mobile Tactics",
+        "Tech - Advanced Ballistics",
+        "Tech - Satellites",
+        "Tech - Robotics",
+        "Tech - Lasers",
+        "Tech - The Internet",
+        "Tech - Globalization",
+        "Tech - Particle Physics",
+        "Tech - Nuclear Fusion",
+        "Tech - Nanotechnology",
+        "Tech - Stealth",
+    ),
+    "trap": (
+        "Trap - Gold -50",
+        "Trap - Gold -100",
+        "Trap - Gold -250",
+        "Trap - Culture -50",
+        "Trap - Culture -100",
+        "Trap - Culture -250",
+        "Trap - Faith -25",
+        "Trap - Faith -50",
+        "Trap - Faith -125",
+        "Trap - All City-State Influence -15",
+        "Trap - All City-State Influence -30",
+        "Trap - All City Population -1",
+        "Trap - All City Population -2",
+        "Trap - Barbarians 1",
+        "Trap - Barbarians 3",
+        "Trap - Barbarians 6",
+        "Trap - Shuffle Units",
+        "Trap - Denounce",
+        "Trap - War",
+    ),
+}
+"Dict of all item groups and the names of the items in them"
+FILLER_ITEM_WEIGHTS: dict[str, int] = {
+    "Bonus - Gold +100": 10,
+    "Bonus - Gold +250": 5,
+    "Bonus - Gold +1000": 2,
+    "Bonus - Culture +100": 11,
+    "Bonus - Culture +250": 6,
+    "Bonus - Culture +1000": 3,
+    "Bonus - Faith +50": 7,
+    "Bonus - Faith +125": 4,
+    "Bonus - Faith +500": 1,
+    "Bonus - Snack from Thes": 9,
+    "Bonus - Free Great Person": 1,
+    "Bonus - Free Policy": 2,
+    "Bonus - Free Tech": 1,
+    "Bonus - Free Unit": 3,
+    "Bonus - Free Worker": 5,
+    "Bonus - All City-State Influence +15": 3,
+    "Bonus - All City-State Influence +30": 1,
+    "Bonus - All City Population +1": 4,
+    "Bonus - All City Population +2": 1,
+    "Bonus - New City Extra Population +1": 3,
+    "Bonus - New City Extra Population +2": 1,
+    "Bonus - Extra Happiness Per City +1": 5,
+    "Bonus - Extra Happiness Per City +2": 2,
+    "Bonus - Culture Per Turn For Free +50": 3,
+    "Bonus - All Unit Experience +15": 8,
+    "Bonus - All Unit Experience +35": 4,
+    "Bonus - All Unit Experience +80": 2,
+    "Bonus - All Unit Free Promotion": 2,
+    "Bonus - Golden Age": 1,
+}
+"Dict of the default weights of all filler items"
+TRAP_ITEM_WEIGHTS: dict[str, int] = {
+    "Trap - Gold -50": 25,
+    "Trap - Gold -100": 15,
+    "Trap - Gold -250": 3,
+    "Trap - Culture -50": 25,
+    "Trap - Culture -100": 15,
+    "Trap - Culture -250": 3,
+    "Trap - Faith -25": 25,
+    "Trap - Faith -50": 15,
+    "Trap - Faith -125": 3,
+    "Trap - All City-State Influence -15": 4,
+    "Trap - All City-State Influence -30": 2,
+    "Trap - All City Population -1": 5,
+    "Trap - All City Population -2": 2,
+    "Trap - Barbarians 1": 6,
+    "Trap - Barbarians 3": 3,
+    "Trap - Barbarians 6": 1,
+    "Trap - Shuffle Units": 4,
+    "Trap - Denounce": 2,
+    "Trap - War": 1,
+}
+"Dict of the default weights of all trap items"
+ITEM_NAME_TO_ID: dict[str, int] = {name: ap_id for ap_id, name in enumerate(ITEM_NAMES, ID_OFFSET)}
+"Dict of the AP IDs of all defined items, separated by name"
+LOCATION_NAME_TO_ID: dict[str, int] = {name: ap_id for ap_id, name in enumerate(LOCATION_NAMES, ID_OFFSET)}
+"Dict of the AP IDs of all defined locations, separated by name"
@@ -0,0 +1,208 @@
+# %% IMPORTS
+import functools
+import string
+from collections.abc import Mapping
+
+from BaseClasses import Item, ItemClassification
+
+from .enums import CivVItemClassificationColors, CivVItemClassificationFlags, CivVItemClassificationNames
+from .exceptions import TemplateException
+
+# All declaration
+__all__ = [
+    "XML_CHARS_SUBSTITUTIONS",
+    "CivVItemFormatter",
+    "CivVTemplate",
+    "clean_text",
+]
+
+
+# %% GLOBALS
+XML_CHARS_SUBSTITUTIONS: dict[str, str] = {
+    '"': "'",
+    "&": "&amp;",
+    "<": "&lt;",
+    ">": "&gt;",
+    "{": "",
+    "}": "",
+}
+"Substitution dict for invalid XML characters"
+XML_CHARS_TRANSLATION: dict[int, str] = str.maketrans(XML_CHARS_SUBSTITUTIONS)
+"Translation table of :obj:`XML_CHARS_SUBSTITUTIONS`, substituting all invalid XML characters in a single pass"
+
+
+# %% TEMPLATE CLASS DEFINITION
+class CivVTemplate:
+    """
+    Template for a Civ V AP Mod file that is parsed once into its literal and placeholder segments.
+
+    Templates use the syntax of :meth:`str.format`, but only support plain names as placeholders.
+    Rendering a template replaces all placeholders by their substitutions and joins all segments at once, producing the
+    same output as :meth:`str.format`.
+
+    """
+
+    def __init__(self, text: str, name: str = "<template>") -> None:
+        """
+        Initializes this template by parsing the provided `text`.
+
+        Args:
+            text: The contents of the template.
+            name: The name of the template, used in error messages.
+
+        Raises:
+            TemplateException: If the template contains a placeholder that is not a plain name.
+
+        """
+
+        self.name: str = name
+        "Name of this template"
+
+        # Split the text into its literal and placeholder segments
+        segments: list[str] = []
+        placeholders: list[tuple[int, str]] = []
+        for literal, field_name, format_spec, conversion in string.Formatter().parse(text):
+            if literal:
+                segments.append(literal)
+            if field_name is None:
+                continue
+            if not field_name.isidentifier() or format_spec or conversion:
+                raise TemplateException(f"Template {name!r} contains unsupported placeholder {field_name!r}.")
+            placeholders.append((len(segments), field_name))
+            segments.append("")
+
+        self._segments: tuple[str, ...] = tuple(segments)
+        self._placeholders: tuple[tuple[int, str], ...] = tuple(placeholders)
+
+    @property
+    def field_names(self) -> frozenset[str]:
+        """
+        Names of all placeholders used in this template.
+
+        """
+
+        return frozenset(name for _, name in self._placeholders)
+
+    def render(self, substitutions: Mapping[str, str]) -> str:
+        """
+        Renders this template with the given `substitutions` and returns it.
+
+        """
+
+        segments = list(self._segments)
+        for index, name in self._placeholders:
+            segments[index] = substitutions[name]
+        return "".join(segments)
+
+
+# %% ITEM_FORMATTER CLASS DEFINITION
+class CivVItemFormatter:
+    """
+    Formatter of item placements into strings usable in the Civ V XML databases, compiled once from the options of a
+    slot.
+
+    Formatted items are memoized, as they only depend on the player; name; and classification of an item.
+
+    """
+
+    def __init__(self, player: int, player_names: Mapping[int, str], disguise_traps: bool, item_hints: str) -> None:
+        """
+        Initializes this item formatter for the provided `player`.
+
+        Args:
+            player: The player whose slot the items are placed in.
+            player_names: The names of all players in the multiworld, separated by player.
+            disguise_traps: Whether traps should be formatted as progression items.
+            item_hints: The hint mode to use for formatting items. Either "full", "classification" or "none".
+
+        """
+
+        if item_hints not in ("full", "classification", "none"):
+            raise NotImplementedError
+
+        self._player = player
+        self._player_names = player_names
+        self._disguise_traps = disguise_traps
+        self._item_hints = item_hints
+        self._owners: dict[int, str] = {}
+        self._items: dict[tuple[int, str, ItemClassification], str] = {}
+        self._flags: dict[ItemClassification, str] = {}
+
+    def _get_classification(self, item: Item) -> ItemClassification:
+        """
+        Returns the classification to display for the given `item`.
+
+        """
+
+        # If traps are to be disguised, use progression instead of trap
+        if item.classification == ItemClassification.trap and self._disguise_traps:
+            return ItemClassification.progression
+        return item.classification
+
+    def _get_owner(self, player: int) -> str:
+        """
+        Returns the possessive form of the name of the given `player`, as seen from the player of this formatter.
+
+        """
+
+        if player not in self._owners:
+            self._owners[player] = f"{clean_text(self._player_names[player])}'s" if player != self._player else "Your"
+        return self._owners[player]
+
+    def format_item(self, item: Item) -> str:
+        """
+        Formats the given `item` placement into a string usable in the Civ V XML databases.
+
+        """
+
+        # If this item was already formatted, return it
+        key = (item.player, item.name, item.classification)
+        if key in self._items:
+            return self._items[key]
+
+        # Format the item into a string depending on the hint mode
+        classification = self._get_classification(item)
+        color = CivVItemClassificationColors.get_color(classification)
+        match self._item_hints:
+            case "full":
+                formatted = f"{self._get_owner(item.player)} [{color}]{clean_text(item.name)}[ENDCOLOR]"
+            case "classification":
+                formatted = f"A [{color}]{CivVItemClassificationNames.get_name(classification)} item[ENDCOLOR]"
+            case _:
+                formatted = f"An [{CivVItemClassificationColors.default}]item[ENDCOLOR]"
+
+        # Store and return the formatted item
+        self._items[key] = formatted
+        return formatted
+
+    def format_flag(self, item: Item) -> str:
+        """
+        Returns the formatted flag icon for the given `item` usable in the Civ V XML databases.
+
+        """
+
+        # If the flag of this classification was already formatted, return it
+        if item.classification in self._flags:
+            return self._flags[item.classification]
+
+        # Format the item flag into a string depending on the hint mode
+        match self._item_hints:
+            case "full" | "classification":
+                formatted = f"[{CivVItemClassificationFlags.get_flag(self._get_classification(item))}] "
+            case _:
+                formatted = f"[{CivVItemClassificationFlags.default}] "
+
+        # Store and return the formatted flag
+        self._flags[item.classification] = formatted
+        return formatted
+
+
+# %% FUNCTION DEFINITIONS
+@functools.lru_cache(maxsize=4096)
+def clean_text(text: str) -> str:
+    """
+    Cleans the given `text` into a version that is safe for XML.
+
+    """
+
+    return text.translate(XML_CHARS_TRANSLATION)
@@ -0,0 +1,83 @@
+# %% IMPORTS
+import bisect
+import functools
+import itertools
+import random
+from collections.abc import Hashable, Iterable
+from typing import Generic, TypeVar
+
+# All declaration
+__all__ = [
+    "CivVWeightedSampler",
+    "get_weighted_sampler",
+]
+
+# Type variable for the values drawn by a sampler
+T = TypeVar("T", bound=Hashable)
+
+
+# %% WEIGHTED_SAMPLER CLASS DEFINITION
+class CivVWeightedSampler(Generic[T]):
+    """
+    Sampler that draws values according to their integer weights.
+
+    The cumulative weights of all values are stored instead of repeating every value by its weight, such that the
+    memory usage does not depend on the size of the weights.
+    Drawing a value consumes exactly one :meth:`random.Random.randint` call, and draws the same value as picking a
+    random index from the list in which every value is repeated by its weight.
+
+    """
+
+    def __init__(self, weights: Iterable[tuple[T, int]]) -> None:
+        """
+        Initializes this sampler with the given `weights`.
+
+        Args:
+            weights: The values and their weights to draw from, in order.
+
+        """
+
+        # Store all values with a non-zero weight together with their cumulative weights
+        weights = [(value, weight) for value, weight in weights if weight > 0]
+        self._values: tuple[T, ...] = tuple(value for value, _ in weights)
+        self._cumulative_weights: tuple[int, ...] = tuple(itertools.accumulate(weight for _, weight in weights))
+
+    @property
+    def total_weight(self) -> int:
+        """
+        Sum of the weights of all values in this sampler.
+
+        """
+
+        return self._cumulative_weights[-1] if self._cumulative_weights else 0
+
+    def sample(self, rng: random.Random) -> T:
+        """
+        Draws a single value using the provided `rng` and returns it.
+
+        """
+
+        return self._values[bisect.bisect_right(self._cumulative_weights, rng.randint(0, self.total_weight-1))]
+
+    def sample_many(self, rng: random.Random, n: int) -> list[T]:
+        """
+        Draws `n` values using the provided `rng` and returns them.
+
+        """
+
+        total_weight = self.total_weight
+        return [self._values[bisect.bisect_right(self._cumulative_weights, rng.randint(0, total_weight-1))]
+                for _ in range(n)]
+
+
+# %% FUNCTION DEFINITIONS
+@functools.lru_cache(maxsize=128)
+def get_weighted_sampler(weights: tuple[tuple[T, int], ...]) -> CivVWeightedSampler[T]:
+    """
+    Returns the :class:`CivVWeightedSampler` for the given `weights`.
+
+    Samplers are cached, such that all players that use the same weights share the same sampler.
+
+    """
+
+    return CivVWeightedSampler(weights)
@@ -1,5 +1,5 @@
 # %% IMPORTS
-from settings import Group, UserFolderPath
+from settings import Bool, Group, UserFolderPath
 
 from .constants import GAME_NAME
 
@@ -17,6 +17,44 @@ class ModsFolderPath(UserFolderPath):
     description = f"{GAME_NAME} mods folder"
 
 
+class MaxInstalledMods(int):
+    """
+    Maximum number of Civ V AP mods that are kept installed in the mods folder. Once exceeded, the least recently used
+    mods are removed whenever a patch file is opened. Use 0 for no limit.
+    Removed mods get their old version back when their patch file is opened again, such that saves using them keep
+    loading.
+
+    """
+
+
+class MaxInstalledModsSize(int):
+    """
+    Maximum total size in MB of all Civ V AP mods that are kept installed in the mods folder. Once exceeded, the least
+    recently used mods are removed. Use 0 for no limit.
+
+    """
+
+
+class SqlDatabaseUpdates(Bool):
+    """
+    Write the database changes of every Civ V slot as a single SQL file with batched statements instead of as XML
+    files, which Civ V loads faster. Both have the same effect.
+
+    """
+
+
+class GenerationReport(Bool):
+    """
+    Write a JSON report with the timings; memory usage; and object counts of every Civ V generation stage next to the
+    spoiler. This slows down generation and is meant for debugging only.
+
+    """
+
+
 # %% CIV V SETTINGS CLASS
 class CivVSettings(Group):
     mods_folder_path: ModsFolderPath = ModsFolderPath(None)
+    max_installed_mods: MaxInstalledMods | int = 0
+    max_installed_mods_size: MaxInstalledModsSize | int = 0
+    sql_database_updates: SqlDatabaseUpdates | bool = False
+    generation_report: GenerationReport | bool = False
@@ -1,5 +1,8 @@
 -- vymdt.08.2011.02.13.0000
 -- Created by: Ryan F. Mercer -Open source
+-- Modified for the Civ V AP Mod: serialize() appends to table.concat buffers
+-- and encodes integer arrays and sets compactly, and deserialize() parses in a
+-- single pass. Data serialized by the original version is still deserialized.
 --===========================================================================
 -- SaveUtils.lua
 --===========================================================================
@@ -493,104 +496,154 @@ function delete( target, key, mod )
 end
 --===========================================================================
 --[[
-Serializes given data and returns result string.  Invalid data types:
-function, userdata, thread.
+Escapes of the characters that are used by the serialized format, which
+primitives can thus not contain.
 ]]
-function serialize( p )
-  
-  local r = ""; local t = type( p );
+SERIALIZE_ESCAPES = { ["{"] = "[LCB]", ["}"] = "[RCB]", ["="] = "[EQL]",
+    [","] = "[COM]" };
+DESERIALIZE_ESCAPES = { LCB = "{", RCB = "}", EQL = "=", COM = "," };
+--===========================================================================
+--[[
+Serializes given primitive of given type and returns result string.
+]]
+local function serializePrimitive( p, t )
+  local r = "";
+  if p == true or p == false or t == "number" then r = tostring( p );
+  elseif t == "string" then
+    local lower = p:lower();
+    if lower == "true" or lower == "false"
+        or tonumber( p ) ~= nil then r = '"'..p..'"';
+    else r = p;
+    end
+  end
+  return (r:gsub( "[{}=,]", SERIALIZE_ESCAPES ));
+end
+--===========================================================================
+--[[
+Returns "array" if given table is a non-empty array of integers, "set" if it
+is a non-empty table of integer keys with value true, or nil otherwise.
+Arrays are serialized as {,1,2,3} and sets as {,,1,2,3}, which can not occur
+in the regular format, as every table entry starts with a key.
+]]
+local function getCompactType( p )
+  local n, isArray, isSet = 0, true, true;
+  for k,v in pairs( p ) do
+    if type( k ) ~= "number" or k % 1 ~= 0 then return nil; end
+    if isArray and not (type( v ) == "number" and v % 1 == 0) then
+      isArray = false;
+    end
+    if isSet and v ~= true then isSet = false; end
+    if not (isArray or isSet) then return nil; end
+    n = n+1;
+  end
+  if n == 0 then return nil; end
+  if isSet then return "set"; end
+  for i = 1, n do
+    if p[i] == nil then return nil; end
+  end
+  return "array";
+end
+--===========================================================================
+--[[
+Appends the serialized given data to given buffer.
+]]
+local function serializeInto( p, buffer )
+  local t = type( p );
   if t == "function" or t == "userdata" or t == "thread" then
     print( "serialize(): Invalid type: "..t ); --error.
-  elseif p ~= nil then
-    if t ~= "table" then
-      if p == nil or p == true or p == false
-        or t == "number" then r = tostring( p );
-      elseif t == "string" then
-        if p:lower() == "true" or p:lower() == "false"
-            or tonumber( p ) ~= nil then r = '"'..p..'"';
-        else r = p;
-        end
-      end
-      r = r:gsub( "{", "\[LCB\]" );
-      r = r:gsub( "}", "\[RCB\]" );
-      r = r:gsub( "=", "\[EQL\]" );
-      r = r:gsub( ",", "\[COM\]" );
+  elseif t ~= "table" then
+    buffer[#buffer+1] = serializePrimitive( p, t );
+  else
+    local compactType = getCompactType( p );
+    if compactType == "array" then
+      buffer[#buffer+1] = "{,"..table.concat( p, "," ).."}";
+    elseif compactType == "set" then
+      local keys = {};
+      for k,_ in pairs( p ) do keys[#keys+1] = k; end
+      buffer[#buffer+1] = "{,,"..table.concat( keys, "," ).."}";
     else
-      r = "{"; local b = false;
+      buffer[#buffer+1] = "{"; local b = false;
       for k,v in pairs( p ) do
-        if b then r = r..","; end
-        r = r..serialize( k ).."="..serialize( v );
+        if b then buffer[#buffer+1] = ","; end
+        serializeInto( k, buffer );
+        buffer[#buffer+1] = "=";
+        serializeInto( v, buffer );
         b = true;
       end
-      r = r.."}"
+      buffer[#buffer+1] = "}";
     end
   end
-  return r;
 end
 --===========================================================================
 --[[
-Deserializes given string and returns result data.
+Serializes given data and returns result string.  Invalid data types:
+function, userdata, thread.
 ]]
-function deserialize( str )
-
-  local findToken = function( str, int )
-    if int == nil then int = 1; end
-    local s, e, c = str:find( "({)" ,int);
-    if s == int then --table.
-      local len = str:len();
-      local i = 1; --open brace.
-      while i > 0 and s ~= nil and e <= len do --find close.
-        s, e, c = str:find( "([{}])" ,e+1);
-        if     c == "{" then i = i+1;
-        elseif c == "}" then i = i-1;
-        end
-      end
-      if i == 0 then c = str:sub(int,e);
-      else print( "deserialize(): Malformed table." ); --error.
+function serialize( p )
+  if p == nil then return ""; end
+  local buffer = {};
+  serializeInto( p, buffer );
+  return table.concat( buffer );
+end
+--===========================================================================
+--[[
+Deserializes given primitive string and returns result data.
+]]
+local function deserializePrimitive( str )
+  local r = tonumber( str );
+  if r ~= nil then return r;
+  elseif str == "true"  then return true;
+  elseif str == "false" then return false;
+  end
+  local s, e, c = str:find( '^"(.*)"$' );
+  if s ~= nil and (c == "true" or c == "false" or tonumber( c ) ~= nil) then
+    str = c;
+  end
+  return (str:gsub( "%[(%u%u%u)%]", DESERIALIZE_ESCAPES ));
+end
+--===========================================================================
+--[[
+Deserializes the data in given string starting at given index and returns
+result data and the index directly after it.
+]]
+local function deserializeAt( str, i )
+  if str:byte( i ) ~= 123 then --primitive.
+    local e = str:find( "[=,}]", i ) or #str+1;
+    return deserializePrimitive( str:sub( i, e-1 ) ), e;
+  end
+  local r = {};
+  if str:byte( i+1 ) == 44 then --compact array or set.
+    local isSet = str:byte( i+2 ) == 44;
+    local s = isSet and i+3 or i+2;
+    local e = str:find( "}", s, true ) or #str+1;
+    for token in str:sub( s, e-1 ):gmatch( "[^,]+" ) do
+      if isSet then r[tonumber( token )] = true;
+      else r[#r+1] = tonumber( token );
       end
-    else s, e, c = str:find( "([^=,]*)" ,int); --primitive.
     end
-    return s, e, c, str:sub( e+1, e+1 );
-  end
-
-  local r = nil; local s, c, d;
-  if str ~= nil then
-    local sT, eT, cT = str:find( "{(.*)}" );
-    if sT == 1 then
-      r = {}; local len = cT:len(); local e = 1;
-      if cT ~= "" then
-        repeat
-          local t1, t2; local more = false;
-          s, e, c, d = findToken( cT, e );
-          if s ~= nil then t1 = deserialize( c ); end
-          if d == "=" then --key.
-            s, e, c, d = findToken( cT, e+2 );
-            if s ~= nil then t2 = deserialize( c ); end
-          end
-          if d == "," then e = e+2; more = true; end --one more.
-          if t2 ~= nil then r[t1] = t2;
-          else table.insert( r, t1 );
-          end
-        until e >= len and not more;
-      end
-    elseif tonumber(str) ~= nil then r = tonumber(str);
-    elseif str == "true"  then r = true;
-    elseif str == "false" then r = false;
-    else
-      s, e, c = str:find( '"(.*)"' );
-      if s == 1 and e == str:len() then
-        if c == "true" or c == "false" or tonumber( c ) ~= nil then
-          str = c;
-        end
-      end
-      r = str;
-      r = r:gsub( "%[LCB%]", "{" );
-      r = r:gsub( "%[RCB%]", "}" );
-      r = r:gsub( "%[EQL%]", "=" );
-      r = r:gsub( "%[COM%]", "," );
+    return r, e+1;
+  end
+  i = i+1;
+  if str:byte( i ) == 125 then return r, i+1; end --empty table.
+  while i <= #str do
+    local k, v;
+    k, i = deserializeAt( str, i );
+    if str:byte( i ) == 61 then v, i = deserializeAt( str, i+1 ); end --key.
+    if v ~= nil then r[k] = v;
+    else table.insert( r, k );
     end
+    i = i+1;
+    if str:byte( i-1 ) ~= 44 then break; end --no more.
   end
-  return r;
+  return r, i;
+end
+--===========================================================================
+--[[
+Deserializes given string and returns result data.
+]]
+function deserialize( str )
+  if str == nil then return nil; end
+  return (deserializeAt( str, 1 ));
 end
 --===========================================================================
 --[[
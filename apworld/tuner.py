@@ -3,6 +3,7 @@ import asyncio
 import json
 import re
 import socket
+from collections import Counter
 from typing import Any
 
 from CommonClient import logger
@@ -488,22 +489,36 @@ class Tuner:
         for args in args_list:
             await self._send_mod_command(f"UpdateLocationTable({args})")
 
-    async def get_push_table(self) -> dict[str, Any]:
+    async def get_push_table(
+            self, epoch: str | None, acknowledged_sequence: int
+    ) -> tuple[str, list[dict[str, Any]], dict[str, Any]]:
         """
-        Returns the push table managed by the APMod containing requests made by the game to the client.
+        Acknowledges all push table entries up to and including `acknowledged_sequence` of the given `epoch`, and
+        returns the current epoch; the oldest entries of the push journal managed by the APMod that have not been
+        acknowledged yet; and all events that occurred since the last call, containing requests made by the game to the
+        client.
+
+        The epoch of the APMod changes whenever a game is loaded, as its journal may then be of an earlier point in
+        time. Acknowledgements of any other epoch are ignored. Events are only ever returned once.
 
         """
 
-        return await self._send_mod_command("GetPushTable()", has_response=True)
+        args = f"{repr(epoch) if epoch is not None else 'nil'}, {acknowledged_sequence}"
+        response = await self._send_mod_command(f"GetPushTable({args})", has_response=True)
+        return response["epoch"], response["entries"], response["events"]
 
-    async def get_item_table(self) -> list[int]:
+    async def get_item_table(self) -> Counter[int]:
         """
-        Returns the item table managed by the APMod containing all item AP IDs already received by the game from the
-        client.
+        Returns the item table managed by the APMod containing the counts of all item AP IDs already received by the
+        game from the client.
 
         """
 
-        return (await self._send_mod_command("GetItemTable()", has_response=True))["items"]
+        response = await self._send_mod_command("GetItemTable()", has_response=True)
+        item_counts = Counter({int(x): y for x, y in response["counts"].items()})
+        if item_counts.total() != response["total"]:
+            raise TunerErrorException(f"Item table holds {item_counts.total()} items instead of {response['total']}")
+        return item_counts
 
     async def send_death_link(self, effect_type: CivVDeathLinkEffectType, amount: int | None, message: str) -> None:
         """
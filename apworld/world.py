@@ -1,51 +1,30 @@
 # %% IMPORTS
-import itertools
+import functools
 import uuid
-from typing import ClassVar, Any
+from collections.abc import Callable
+from typing import TYPE_CHECKING, ClassVar, Any
 
-from BaseClasses import Region, ItemClassification
+from BaseClasses import CollectionState, ItemClassification
 from Options import OptionError
 from worlds.AutoWorld import World
 
 from .constants import GAME_NAME
-from .container import CivVContainer
 from .dataclasses import CivVSlotData
-from .items import (
-    ITEMS_DATA,
-    ITEMS_DATA_BY_ID,
-    ITEMS_DATA_BY_NAME,
-    ITEM_GROUPS,
-    POLICY_ITEMS,
-    PROGRESSIVE_ERA_ITEM,
-    PROGRESSIVE_SETTLER_ITEM,
-    PROGRESSIVE_TECH_ITEMS,
-    PROMOTION_ITEMS,
-    TECH_ITEMS,
-    CivVFillerItemData,
-    CivVItem,
-    CivVProgressionItemData,
-    CivVProgressiveItemData,
-    CivVUsefulItemData,
-    ItemRequirements,
-)
-from .locations import (
-    BUILDING_LOCATIONS,
-    LOCATIONS_DATA,
-    NATIONAL_WONDER_LOCATIONS,
-    POLICY_BRANCH_LOCATIONS,
-    POLICY_LOCATIONS,
-    PROMOTION_LOCATIONS,
-    SETTLER_LOCATIONS,
-    TECH_LOCATIONS,
-    UNIT_LOCATIONS,
-    WORLD_WONDER_LOCATIONS,
-    CivVLocation,
-    CivVLocationData,
-)
+from .instrumentation import instrumented
 from .options import CivVOptions
-from .regions import ERA_REGIONS, REGIONS_DATA
-from .requirements import EMBARKING, VICTORIES
+from .registry import ITEM_GROUPS, ITEM_NAME_TO_ID, LOCATION_NAME_TO_ID
+from .sampling import get_weighted_sampler
 from .settings import CivVSettings
+if TYPE_CHECKING:
+    from .items import (
+        CivVFillerItemData,
+        CivVItem,
+        CivVProgressionItemData,
+        CivVProgressiveItemData,
+        CivVUsefulItemData,
+        ItemRequirements,
+    )
+    from .locations import CivVLocationData
 
 # All declaration
 __all__ = ["CivVWorld"]
@@ -65,18 +44,32 @@ class CivVWorld(World):
     options_dataclass = CivVOptions
     options: CivVOptions
     topology_present = True
-    item_name_to_id = {item_data.name: item_data.ap_id for item_data in ITEMS_DATA}
-    location_name_to_id = {location_data.name: location_data.ap_id for location_data in LOCATIONS_DATA}
+    item_name_to_id = ITEM_NAME_TO_ID
+    location_name_to_id = LOCATION_NAME_TO_ID
     item_name_groups = ITEM_GROUPS
 
+    # Additional class attributes
+    SIGNATURE_OPTION_NAMES: tuple[str, ...] = (
+        "progressive_techs",
+        "building_sanity",
+        "national_wonder_sanity",
+        "world_wonder_sanity",
+        "unit_sanity",
+        "settler_sanity",
+        "settler_sanity_amount",
+        "promotion_sanity",
+    )
+    "Names of all options that determine which items and locations are used for a seed"
+
     def __init__(self, *args, **kwargs):
         # Call super method
         super().__init__(*args, **kwargs)
 
         # Additional instance attributes
-        self.output_file_id: str = str(uuid.uuid4())
-        "Unique ID that identifies the output file generated by this APWorld"
+        self.output_file_id: str = str(uuid.UUID(int=self.random.getrandbits(128), version=4))
+        "Unique ID that identifies the output file generated by this APWorld, derived from the seed of this slot"
 
+    @instrumented
     def generate_early(self) -> None:
         # Check that applicable item/effect weights have at least one non-zero key
         if not list(self.options.filler_item_weights.items()):
@@ -90,7 +83,9 @@ class CivVWorld(World):
                 "Option 'DeathLinkEffectWeights' must have at least one non-zero key when 'DeathLink' is true."
             )
 
-    def create_item(self, name: str) -> CivVItem:
+    def create_item(self, name: str) -> "CivVItem":
+        from .items import ITEMS_DATA_BY_ID, CivVItem
+
         item_data = ITEMS_DATA_BY_ID[self.item_name_to_id[name]]
         return CivVItem(
             name=item_data.name,
@@ -99,85 +94,112 @@ class CivVWorld(World):
             player=self.player,
         )
 
-    def get_useful_items_data(self) -> list[CivVProgressiveItemData | CivVProgressionItemData | CivVUsefulItemData]:
+    def get_options_signature(self) -> tuple[tuple[str, int], ...]:
         """
-        Returns the list of progressive; progression; and useful `CivVItemData` instances to use for this seed,
-        according to the options.
+        Returns the hashable signature of all options that determine which items and locations are used for this seed.
+
+        Players with the same signature use the exact same items and locations.
 
         """
 
+        return tuple((name, getattr(self.options, name).value) for name in self.SIGNATURE_OPTION_NAMES)
+
+    def get_useful_items_data(
+            self
+    ) -> tuple[tuple["CivVProgressiveItemData | CivVProgressionItemData | CivVUsefulItemData", int], ...]:
+        """
+        Returns the progressive; progression; and useful `CivVItemData` instances to use for this seed and how many to
+        include of each, according to the options.
+
+        The returned tuple is cached and shared between all players with the same options signature.
+
+        """
+
+        return self._get_useful_items_data(self.get_options_signature())
+
+    @staticmethod
+    @functools.cache
+    def _get_useful_items_data(
+            signature: tuple[tuple[str, int], ...]
+    ) -> tuple[tuple["CivVProgressiveItemData | CivVProgressionItemData | CivVUsefulItemData", int], ...]:
+        from .items import (
+            POLICY_ITEMS,
+            PROGRESSIVE_ERA_ITEM,
+            PROGRESSIVE_SETTLER_ITEM,
+            PROGRESSIVE_TECH_ITEMS,
+            PROMOTION_ITEMS,
+            TECH_ITEMS,
+        )
+
+        # Obtain the options from the signature
+        options = dict(signature)
+
         # Create list with items
-        items_data: list[CivVProgressiveItemData | CivVProgressionItemData | CivVUsefulItemData] = []
+        items_data: list["CivVProgressiveItemData | CivVProgressionItemData | CivVUsefulItemData"] = []
 
         # Add all progressive items that are always included or whose option toggle is toggled on
         for item in [PROGRESSIVE_ERA_ITEM, PROGRESSIVE_SETTLER_ITEM, *PROGRESSIVE_TECH_ITEMS.values()]:
-            if item.option_toggle_name is None or getattr(self.options, item.option_toggle_name):
+            if item.option_toggle_name is None or options[item.option_toggle_name]:
                 items_data.append(item)
 
         # Add all technology items whose progressive parent is NOT included
+        included = set(items_data)
         for item in TECH_ITEMS.values():
-            if item.progressive_parent is None or item.progressive_parent not in items_data:
+            if item.progressive_parent is None or item.progressive_parent not in included:
                 items_data.append(item)
 
         # Add all policy items
         items_data.extend(POLICY_ITEMS.values())
 
         # Add promotion items if enabled
-        if self.options.promotion_sanity:
+        if options["promotion_sanity"]:
             items_data.extend(PROMOTION_ITEMS.values())
 
-        # Return items data
-        return items_data
+        # Return items data together with how many to include of each
+        return tuple(
+            (item, options[item.option_count_name] if item.option_count_name is not None else item.count)
+            for item in items_data
+        )
 
-    def get_filler_items_data(self, n: int) -> list[CivVFillerItemData]:
+    def get_filler_items_data(self, n: int) -> list["CivVFillerItemData"]:
         """
         Returns a list of `n` `CivVFillerItemData` instances to use for this seed, according to the options.
 
         """
 
-        # Create list of weighted filler and trap items according to the options
-        filler_list = list(itertools.chain.from_iterable(
-            [[ITEMS_DATA_BY_NAME[name]]*weight for name, weight in self.options.filler_item_weights.items()]
-        ))
-        n_filler = len(filler_list)
-        trap_list = list(itertools.chain.from_iterable(
-            [[ITEMS_DATA_BY_NAME[name]]*weight for name, weight in self.options.trap_item_weights.items()]
-        ))
-        n_trap = len(trap_list)
+        from .items import ITEMS_DATA_BY_NAME
 
-        # Create list with filler items
-        items_data = []
+        # Obtain the (cached) samplers for the filler and trap items according to the options
+        filler_sampler = get_weighted_sampler(
+            tuple((ITEMS_DATA_BY_NAME[name], weight) for name, weight in self.options.filler_item_weights.items())
+        )
+        trap_sampler = get_weighted_sampler(
+            tuple((ITEMS_DATA_BY_NAME[name], weight) for name, weight in self.options.trap_item_weights.items())
+        )
 
         # If traps are enabled, create both filler and trap items
         if self.options.enable_traps:
-            # Generate n filler items
+            # Generate n filler items, determining for each if a filler item or trap should be chosen
             trap_chance = self.options.trap_filler_chance / 100
-            for _ in range(n):
-                # Determine if filler item or trap should be chosen
-                if self.random.random() <= trap_chance:
-                    # Pick random trap item
-                    items_data.append(trap_list[self.random.randint(0, n_trap - 1)])
-                else:
-                    # Pick random filler item
-                    items_data.append(filler_list[self.random.randint(0, n_filler - 1)])
+            items_data = [trap_sampler.sample(self.random) if self.random.random() <= trap_chance
+                          else filler_sampler.sample(self.random) for _ in range(n)]
 
         # Else, create n filler items
         else:
-            items_data.extend((filler_list[self.random.randint(0, n_filler - 1)] for _ in range(n)))
+            items_data = filler_sampler.sample_many(self.random, n)
 
         # Return items data
         return items_data
 
+    @instrumented
     def create_items(self) -> None:
         # Create list of all progression and useful items to be added to the multiworld
-        get_count = lambda x: getattr(self.options, x.option_count_name) if x.option_count_name is not None else x.count
-        useful_items = list(itertools.chain.from_iterable(
-            ([self.create_item(item_data.name) for _ in range(get_count(item_data))] for item_data in
-             self.get_useful_items_data())))
+        useful_items = [self.create_item(item_data.name)
+                        for item_data, count in self.get_useful_items_data() for _ in range(count)]
 
         # Calculate number of filler items required
-        # Extra minus 1 here because victory location already has an item placed
-        n_filler = len(list(self.multiworld.get_locations(self.player))) - len(useful_items) - 1
+        # The victory location is not part of the locations data, as it already has an item placed
+        n_filler = len(self.get_locations_data()) - len(useful_items)
 
         # Create list of all filler and trap items to be added to the multiworld
         filler_items = (self.create_item(item_data.name) for item_data in self.get_filler_items_data(n_filler))
@@ -186,83 +208,127 @@ class CivVWorld(World):
         self.multiworld.itempool.extend(useful_items)
         self.multiworld.itempool.extend(filler_items)
 
-    def get_locations_data(self) -> list[CivVLocationData]:
+    def get_locations_data(self) -> tuple["CivVLocationData", ...]:
         """
-        Returns the list of `CivVLocationData` instances to use for this seed, according to the options.
+        Returns the `CivVLocationData` instances to use for this seed, according to the options.
+
+        The returned tuple is cached and shared between all players with the same options signature.
 
         """
 
+        return self._get_locations_data(self.get_options_signature())
+
+    @staticmethod
+    @functools.cache
+    def _get_locations_data(signature: tuple[tuple[str, int], ...]) -> tuple["CivVLocationData", ...]:
+        from .locations import (
+            BUILDING_LOCATIONS,
+            NATIONAL_WONDER_LOCATIONS,
+            POLICY_BRANCH_LOCATIONS,
+            POLICY_LOCATIONS,
+            PROMOTION_LOCATIONS,
+            SETTLER_LOCATIONS,
+            TECH_LOCATIONS,
+            UNIT_LOCATIONS,
+            WORLD_WONDER_LOCATIONS,
+        )
+
+        # Obtain the options from the signature
+        options = dict(signature)
+
         # Create list with locations that are always included
         locations_data = [*POLICY_BRANCH_LOCATIONS, *POLICY_LOCATIONS, *TECH_LOCATIONS]
 
         # Add specific locations if corresponding sanity is enabled
-        if self.options.building_sanity:
+        if options["building_sanity"]:
             locations_data.extend(BUILDING_LOCATIONS)
-        if self.options.national_wonder_sanity:
+        if options["national_wonder_sanity"]:
             locations_data.extend(NATIONAL_WONDER_LOCATIONS)
-        if self.options.promotion_sanity:
+        if options["promotion_sanity"]:
             locations_data.extend(PROMOTION_LOCATIONS)
-        if self.options.settler_sanity:
-            locations_data.extend(SETTLER_LOCATIONS[:self.options.settler_sanity_amount])
-        if self.options.unit_sanity:
+        if options["settler_sanity"]:
+            locations_data.extend(SETTLER_LOCATIONS[:options["settler_sanity_amount"]])
+        if options["unit_sanity"]:
             # If settler sanity is enabled, exclude the settler from the unit locations
             unit_locations = UNIT_LOCATIONS
-            if self.options.settler_sanity:
+            if options["settler_sanity"]:
                 unit_locations = [x for x in UNIT_LOCATIONS if x.database_key_prefix != "unit_settler"]
             locations_data.extend(unit_locations)
-        if self.options.world_wonder_sanity:
+        if options["world_wonder_sanity"]:
             locations_data.extend(WORLD_WONDER_LOCATIONS)
 
         # Return locations data
-        return locations_data
+        return tuple(locations_data)
 
+    @instrumented
     def create_regions(self) -> None:
-        # Add the origin region
-        self.multiworld.regions.append(
-            Region(name=self.origin_region_name, player=self.player, multiworld=self.multiworld)
-        )
+        from .items import CivVItem
+        from .locations import CivVLocation
+        from .logic import CivVLogicAnalyzer
+        from .regions import ERA_REGIONS, REGIONS_DATA, CivVReachability, CivVRegion
 
-        # Create and register all defined regions
-        self.multiworld.regions.extend(
-            [Region(name=region_data.name, player=self.player, multiworld=self.multiworld)
-             for region_data in REGIONS_DATA]
-        )
+        # Create the logic analyzer, used to strip requirements from rules that are already implied by their region
+        analyzer = CivVLogicAnalyzer(self.options)
 
-        # Add connections and rules to all regions
+        # Create all regions in one pass, keeping them in a local map for quick lookups
+        regions = {self.origin_region_name: CivVRegion(
+            name=self.origin_region_name,
+            player=self.player,
+            multiworld=self.multiworld,
+            access_requirements={},
+        )}
         for region_data in REGIONS_DATA:
-            # Retrieve region and parent region
-            region = self.multiworld.get_region(region_name=region_data.name, player=self.player)
-            parent_region = self.multiworld.get_region(
-                region_name=region_data.parent.name if region_data.parent is not None else self.origin_region_name,
-                player=self.player
+            regions[region_data.name] = CivVRegion(
+                name=region_data.name,
+                player=self.player,
+                multiworld=self.multiworld,
+                access_requirements=analyzer.get_region_access_requirements(region_data),
             )
+        self.multiworld.regions.extend(regions.values())
 
-            # Make connection between parent region and this region
-            parent_region.connect(
-                connecting_region=region,
-                rule=region_data.requirements.create_access_rule(self.player, self.options),
+        # Add connections and rules to all regions
+        for region_data in REGIONS_DATA:
+            parent_name = region_data.parent.name if region_data.parent is not None else self.origin_region_name
+            regions[parent_name].connect(
+                connecting_region=regions[region_data.name],
+                rule=region_data.requirements.create_access_rule(
+                    self.player, self.options, analyzer.get_region_requirements(region_data.parent)
+                ),
             )
 
-        # Add all locations to the multiworld
+        # If the exact requirements of all regions are known, determine their reachability in a single step
+        if all(region.access_requirements is not None for region in regions.values()):
+            reachability = CivVReachability(self.player, list(regions.values()))
+            for region in regions.values():
+                region.reachability = reachability
+
+        # Create all locations, grouped per region
+        # Locations in the same region with the same requirements share their access rule
+        locations: dict[str, list[CivVLocation]] = {name: [] for name in regions}
+        rules: dict[tuple[int, str], Callable[[CollectionState], bool]] = {}
         for location_data in self.get_locations_data():
-            # Create location and add it to its region
-            region = self.multiworld.get_region(
-                region_name=location_data.region.name if location_data.region is not None else self.origin_region_name,
-                player=self.player
-            )
+            region_name = location_data.region.name if location_data.region is not None else self.origin_region_name
+            rule_key = (id(location_data.requirements), region_name)
+            if rule_key not in rules:
+                rules[rule_key] = location_data.requirements.create_access_rule(
+                    self.player, self.options, analyzer.get_region_requirements(location_data.region)
+                )
             location = CivVLocation(
                 player=self.player,
                 name=location_data.name,
                 address=location_data.ap_id,
-                parent=region,
+                parent=regions[region_name],
             )
-            region.locations.append(location)
+            location.access_rule = rules[rule_key]
+            locations[region_name].append(location)
 
-            # Add accessibility rule to this location
-            location.access_rule = location_data.requirements.create_access_rule(self.player, self.options)
+        # Add all locations to their regions in bulk
+        for region_name, region_locations in locations.items():
+            regions[region_name].locations.extend(region_locations)
 
         # Add victory to the multiworld
-        victory_region = self.multiworld.get_region(ERA_REGIONS[self.options.era_goal_logic.value].name, self.player)
+        victory_region_data = ERA_REGIONS[self.options.era_goal_logic.value]
+        victory_region = regions[victory_region_data.name]
         victory_location = CivVLocation(
             player=self.player,
             name="Victory",
@@ -272,20 +338,56 @@ class CivVWorld(World):
         victory_region.locations.append(victory_location)
 
         # Create victory location requirement based on player settings
+        victory_location.access_rule = self.get_victory_requirements().create_access_rule(
+            self.player, self.options, analyzer.get_region_requirements(victory_region_data)
+        )
+
+        # Place dummy Victory item at this location and add completion condition to the multiworld
+        victory_location.place_locked_item(CivVItem("Victory", ItemClassification.progression, None, self.player))
+        self.multiworld.completion_condition[self.player] = lambda state: state.has("Victory", self.player)
+
+    def get_victory_requirements(self) -> "ItemRequirements":
+        """
+        Returns the requirements of the victory location, according to the options of this world.
+
+        """
+
+        from .items import ItemRequirements
+        from .requirements import EMBARKING, VICTORIES
+
         requirements = []
         if self.options.victory_goal_logic.value:
             requirements.append(VICTORIES[self.options.victory_goal_logic.current_key.capitalize()])
         if self.options.embarking_goal_logic.value:
             requirements.append(EMBARKING)
-        victory_location.access_rule = ItemRequirements(*requirements).create_access_rule(self.player, self.options)
+        return ItemRequirements(*requirements)
 
-        # Place dummy Victory item at this location and add completion condition to the multiworld
-        victory_location.place_locked_item(CivVItem("Victory", ItemClassification.progression, None, self.player))
-        self.multiworld.completion_condition[self.player] = lambda state: state.has("Victory", self.player)
+    def get_compiled_logic(self) -> dict[str, Any]:
+        """
+        Returns the option-resolved logic of this world, compiled into a JSON-serializable dict.
+
+        See :meth:`CivVLogicAnalyzer.compile` for more information.
 
+        """
+
+        from .logic import CivVLogicAnalyzer
+        from .regions import ERA_REGIONS, REGIONS_DATA
+
+        return CivVLogicAnalyzer(self.options).compile(
+            origin_region_name=self.origin_region_name,
+            regions_data=REGIONS_DATA,
+            locations_data=list(self.get_locations_data()),
+            victory_region_data=ERA_REGIONS[self.options.era_goal_logic.value],
+            victory_requirements=self.get_victory_requirements(),
+        )
+
+    @instrumented
     def generate_output(self, output_directory: str) -> None:
+        from .container import CivVContainer
+
         CivVContainer.create_output_file(output_directory, self)
 
+    @instrumented
     def fill_slot_data(self) -> dict[str, Any]:
         return CivVSlotData(
             output_file_id=self.output_file_id,
@@ -0,0 +1,89 @@
+--[[
+Benchmark of the event handlers of APFunctions.lua, running the APMod headless with the stubs in test/lua.
+
+Run from the root folder of this repository with a stock Lua 5.1 interpreter with
+`lua5.1 test/benchmark/apfunctions.lua [path/to/apmod/]`.
+Every scenario fires the given number of events at a freshly loaded APMod, and prints the average time per event in
+microseconds together with the number of locations sent and the length of the push table response afterwards.
+Pass the path to another version of the APMod folder to compare against it.
+]]
+
+STUBS_PATH = "test/lua/civv_stubs.lua"
+MOD_PATH = arg[1] or "apworld/templates/apmod/"
+SIZES = {1000, 10000, 100000}
+MIN_DURATION = 0.2
+OPTIONS = {settler_sanity = true, settler_sanity_amount = 1000000}
+
+-- Events fired by the game, which all fire the i-th event of the scenario for the human player or an AI player
+SCENARIOS = {
+    {"tech_acquired", function(i)
+        Harness.Fire("Events.TechAcquired", i % 2, math.floor(i / 2) % 170)
+    end},
+    {"city_can_train", function(i)
+        Harness.Fire("GameEvents.CityCanTrain", i % 2, 0, math.floor(i / 2) % 100)
+    end},
+    {"city_trained", function(i)
+        Harness.AddUnit(0, i, i % 100)
+        Harness.Fire("GameEvents.CityTrained", 0, 0, i, 0, 0)
+    end},
+}
+
+
+-- FUNCTION DEFINITIONS
+function LoadMod(files)
+    -- Reset all stubs and load the APMod in its initial state, discarding the sync it requests on load
+    dofile(STUBS_PATH)
+    local ap = Harness.LoadMod(files, OPTIONS)
+    Harness.Capture(ap.GetPushTable)
+    Harness.Capture(ap.GetPushTable, pushEpoch, 1)
+    return ap
+end
+
+function CountLocations()
+    -- Return the number of locations in the location table
+    local count = 0
+    for _, locationIds in pairs(locationTable) do
+        for _, _ in pairs(locationIds) do
+            count = count + 1
+        end
+    end
+    return count
+end
+
+function Measure(files, fire, size)
+    -- Fire the events at a new APMod until the minimum duration has passed, and return the average time per event in
+    -- microseconds together with the results of the final run
+    local runs = 0
+    local duration = 0
+    local ap = nil
+    repeat
+        ap = LoadMod(files)
+        local start = os.clock()
+        for i = 1, size do
+            fire(i)
+        end
+        duration = duration + os.clock() - start
+        runs = runs + 1
+    until duration >= MIN_DURATION
+    local response = Harness.Capture(ap.GetPushTable, pushEpoch, 1)[1]
+    return duration / runs / size * 1000000, CountLocations(), #response
+end
+
+function Main()
+    -- Load the stubs once to read the APMod version to benchmark
+    dofile(STUBS_PATH)
+    local files = Harness.ReadFiles(MOD_PATH)
+    print(string.format("Benchmarking %s with %s", MOD_PATH, _VERSION))
+    print(string.format("%-16s %6s %10s %10s %12s", "scenario", "events", "locations", "response", "per event"))
+
+    -- Run all scenarios for all sizes
+    for _, scenario in ipairs(SCENARIOS) do
+        local name, fire = scenario[1], scenario[2]
+        for _, size in ipairs(SIZES) do
+            local time, locations, length = Measure(files, fire, size)
+            print(string.format("%-16s %6d %10d %10d %9.3f us", name, size, locations, length, time))
+        end
+    end
+end
+
+Main()
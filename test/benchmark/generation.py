@@ -0,0 +1,207 @@
+"""
+Benchmark of the generation of multiworlds consisting of Civ V slots only.
+
+Run from the Archipelago root folder with `python -m test.benchmark.generation`.
+Every scenario generates a multiworld with the given number of slots and option preset, timing every generation step.
+The peak traced memory is recorded by generating the same multiworld again, such that tracing does not slow down the
+timed run.
+All results are compared against the stored baselines and the benchmark fails if any result regressed by more than the
+given tolerance, or if a scenario has no baseline. Use `--update-baselines` to store the results as the new baselines
+instead.
+
+"""
+
+# %% IMPORTS
+import argparse
+import itertools
+import json
+import sys
+import tempfile
+import time
+import tracemalloc
+from argparse import Namespace
+from pathlib import Path
+from typing import Any
+
+from BaseClasses import CollectionState, MultiWorld
+from Fill import distribute_items_restrictive
+from worlds.AutoWorld import call_all
+from worlds.civv import CivVWorld
+
+# %% GLOBALS
+BASELINES_PATH: Path = Path(__file__).parent / "generation_baselines.json"
+"Path to the file that stores the baseline results of all scenarios"
+SEED: int = 1313
+"Seed to use for all generated multiworlds"
+SLOT_COUNTS: tuple[int, ...] = (1, 10, 50, 200)
+"Number of Civ V slots to generate multiworlds with"
+PRESETS: dict[str, dict[str, Any]] = {
+    "default": {},
+    "all_sanities": {
+        "building_sanity": True,
+        "national_wonder_sanity": True,
+        "world_wonder_sanity": True,
+        "unit_sanity": True,
+        "settler_sanity": True,
+        "promotion_sanity": True,
+    },
+    "no_progressive_techs": {
+        "progressive_techs": False,
+    },
+    "traps": {
+        "enable_traps": True,
+        "trap_filler_chance": 50,
+    },
+}
+"Dict of all option presets and the options that differ from their defaults in them"
+GEN_STEPS: tuple[str, ...] = (
+    "generate_early",
+    "create_regions",
+    "create_items",
+    "set_rules",
+    "connect_entrances",
+    "generate_basic",
+    "pre_fill",
+)
+"Generation steps that are called on all worlds before the fill"
+
+
+# %% FUNCTION DEFINITIONS
+def setup_multiworld(n_slots: int, options: dict[str, Any]) -> MultiWorld:
+    """
+    Creates a multiworld with `n_slots` Civ V slots that all use the given `options` and returns it.
+
+    """
+
+    multiworld = MultiWorld(n_slots)
+    multiworld.game = {player: CivVWorld.game for player in multiworld.player_ids}
+    multiworld.player_name = {player: f"Civ{player}" for player in multiworld.player_ids}
+    multiworld.set_seed(SEED)
+
+    # Set the options of all players
+    args = Namespace()
+    for key, option in CivVWorld.options_dataclass.type_hints.items():
+        value = option.from_any(options.get(key, option.default))
+        setattr(args, key, {player: value for player in multiworld.player_ids})
+    multiworld.set_options(args)
+    multiworld.state = CollectionState(multiworld)
+    return multiworld
+
+
+def generate(n_slots: int, options: dict[str, Any]) -> dict[str, float]:
+    """
+    Generates a multiworld with `n_slots` Civ V slots that all use the given `options` and returns the timings of all
+    steps in seconds.
+
+    """
+
+    results: dict[str, float] = {}
+    start = time.perf_counter()
+
+    # Create the multiworld and call all generation steps
+    multiworld = setup_multiworld(n_slots, options)
+    for step in GEN_STEPS:
+        step_start = time.perf_counter()
+        call_all(multiworld, step)
+        results[step] = time.perf_counter() - step_start
+
+    # Fill the multiworld
+    step_start = time.perf_counter()
+    distribute_items_restrictive(multiworld)
+    call_all(multiworld, "post_fill")
+    results["fill"] = time.perf_counter() - step_start
+
+    # Create the spoiler and all outputs
+    with tempfile.TemporaryDirectory() as output_directory:
+        step_start = time.perf_counter()
+        multiworld.spoiler.create_playthrough()
+        multiworld.spoiler.to_file(str(Path(output_directory) / "spoiler.txt"))
+        results["spoiler"] = time.perf_counter() - step_start
+
+        step_start = time.perf_counter()
+        call_all(multiworld, "generate_output", output_directory)
+        results["generate_output"] = time.perf_counter() - step_start
+
+    step_start = time.perf_counter()
+    for player in multiworld.player_ids:
+        multiworld.worlds[player].fill_slot_data()
+    results["fill_slot_data"] = time.perf_counter() - step_start
+
+    # Record the total time
+    results["total"] = time.perf_counter() - start
+    return results
+
+
+def run_scenario(n_slots: int, options: dict[str, Any]) -> dict[str, float]:
+    """
+    Generates a multiworld with `n_slots` Civ V slots that all use the given `options` twice, and returns the timings
+    of all steps in seconds of the first run and the peak traced memory in MiB of the second run.
+
+    """
+
+    # Time all steps without tracing memory, as tracing slows down every allocation
+    results = generate(n_slots, options)
+
+    # Generate the same multiworld again while tracing memory to record its peak
+    tracemalloc.start()
+    generate(n_slots, options)
+    results["peak_memory"] = tracemalloc.get_traced_memory()[1] / 2**20
+    tracemalloc.stop()
+    return results
+
+
+def compare_results(
+        results: dict[str, dict[str, float]], baselines: dict[str, dict[str, float]], tolerance: float
+) -> list[str]:
+    """
+    Compares the given `results` against the `baselines` and returns a message for every result that regressed by more
+    than the given `tolerance`, and for every scenario that has no baseline.
+
+    """
+
+    regressions = []
+    for scenario, values in results.items():
+        if scenario not in baselines:
+            regressions.append(f"{scenario}: no baseline stored")
+            continue
+        for key in ("total", "fill", "spoiler", "generate_output", "peak_memory"):
+            baseline = baselines[scenario].get(key)
+            if baseline is not None and values[key] > baseline * (1 + tolerance):
+                regressions.append(f"{scenario} {key}: {values[key]:.3f} > {baseline:.3f} (+{tolerance:.0%})")
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--slots", type=int, nargs="+", default=SLOT_COUNTS, help="Number of slots per multiworld")
+    parser.add_argument("--presets", nargs="+", choices=PRESETS, default=list(PRESETS), help="Option presets to use")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="Allowed relative regression")
+    parser.add_argument("--update-baselines", action="store_true", help="Store the results as the new baselines")
+    args = parser.parse_args()
+
+    # Without baselines there is nothing to compare against, so fail before running any scenario
+    if not args.update_baselines and not BASELINES_PATH.exists():
+        parser.error(f"No baselines found at {BASELINES_PATH}. Run with --update-baselines to create them.")
+
+    # Run all requested scenarios
+    results: dict[str, dict[str, float]] = {}
+    for n_slots, preset in itertools.product(args.slots, args.presets):
+        scenario = f"{n_slots}_slots/{preset}"
+        results[scenario] = run_scenario(n_slots, PRESETS[preset])
+        print(f"{scenario:<32} " + "; ".join(f"{key} {value:.3f}" for key, value in results[scenario].items()))
+
+    # Either update the baselines or compare against them
+    baselines = json.loads(BASELINES_PATH.read_text()) if BASELINES_PATH.exists() else {}
+    if args.update_baselines:
+        baselines.update(results)
+        BASELINES_PATH.write_text(json.dumps(baselines, indent=4, sort_keys=True) + "\n")
+        print(f"Stored baselines in {BASELINES_PATH}")
+    elif regressions := compare_results(results, baselines, args.tolerance):
+        print("Regressions found:", *regressions, sep="\n  ")
+        sys.exit(1)
+    else:
+        print("No regressions found")
+
+
+if __name__ == "__main__":
+    main()
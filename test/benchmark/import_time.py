@@ -0,0 +1,59 @@
+"""
+Benchmark of the time it takes to import the Civ V APWorld.
+
+Run from the Archipelago root folder with `python -m test.benchmark.import_time`.
+Every measurement is done in a fresh interpreter, such that no module is cached between runs.
+
+"""
+
+# %% IMPORTS
+import argparse
+import statistics
+import subprocess
+import sys
+
+# %% GLOBALS
+SCENARIOS: dict[str, str] = {
+    "launcher": "import worlds.civv",
+    "world": "import worlds.civv; from worlds.civv.world import CivVWorld; CivVWorld.item_name_to_id",
+    "full_data": "import worlds.civv; import worlds.civv.items, worlds.civv.locations, worlds.civv.regions",
+    "container": "import worlds.civv; import worlds.civv.container",
+}
+"Dict of all benchmark scenarios and the code that is timed in them"
+TIMER: str = (
+    "import time, Utils, BaseClasses, Options, worlds.AutoWorld, worlds.LauncherComponents\n"
+    "start = time.perf_counter()\n"
+    "{code}\n"
+    "print(time.perf_counter() - start)\n"
+)
+"Code template used to time a scenario, excluding the import of Archipelago itself"
+
+
+# %% FUNCTION DEFINITIONS
+def time_scenario(code: str, repeat: int) -> list[float]:
+    """
+    Runs the given `code` `repeat` times in a fresh interpreter and returns the timings in seconds.
+
+    """
+
+    return [
+        float(subprocess.run([sys.executable, "-c", TIMER.format(code=code)], capture_output=True, check=True,
+                             text=True).stdout.split()[-1])
+        for _ in range(repeat)
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=10, help="Number of runs per scenario")
+    args = parser.parse_args()
+
+    # Time all scenarios and report their statistics
+    for name, code in SCENARIOS.items():
+        timings = time_scenario(code, args.repeat)
+        print(f"{name:<12} median {statistics.median(timings)*1000:8.2f} ms; "
+              f"min {min(timings)*1000:8.2f} ms; max {max(timings)*1000:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
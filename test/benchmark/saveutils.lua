@@ -0,0 +1,91 @@
+--[[
+Benchmark of the serializer of SaveUtils.lua, which the APMod uses for all of its script data.
+
+Run from the root folder of this repository with a stock Lua 5.1 interpreter with
+`lua5.1 test/benchmark/saveutils.lua [path/to/SaveUtils.lua]`.
+Every scenario serializes and deserializes a table of the given number of entries, and prints the average time of both
+in milliseconds together with the length of the serialized string.
+Pass the path to another version of SaveUtils.lua to compare against it.
+]]
+
+-- SaveUtils registers a callback on an event of the game when it is loaded
+Events = {LoadScreenClose = {Add = function() end}}
+
+SAVE_UTILS_PATH = arg[1] or "apworld/templates/apmod/SaveUtils.lua"
+SIZES = {100, 1000, 10000}
+MIN_DURATION = 0.2
+
+-- Table shapes used by the APMod, which all create a table of the given size
+SCENARIOS = {
+    {"item_array", function(n)
+        local t = {}
+        for i = 1, n do t[i] = 5000 + i % 97 end
+        return t
+    end},
+    {"location_set", function(n)
+        local t = {}
+        for i = 1, n do t[i * 3] = true end
+        return t
+    end},
+    {"string_map", function(n)
+        local t = {}
+        for i = 1, n do t["key" .. i] = {name = "Value, with {escapes}", count = i} end
+        return t
+    end},
+}
+
+
+-- FUNCTION DEFINITIONS
+function Measure(func)
+    -- Call the function until the minimum duration has passed and return the average time per call in milliseconds
+    local calls = 0
+    local start = os.clock()
+    repeat
+        func()
+        calls = calls + 1
+    until os.clock() - start >= MIN_DURATION
+    return (os.clock() - start) / calls * 1000
+end
+
+function IsEqual(a, b)
+    -- Return whether both values are equal, comparing tables by their contents
+    if type(a) ~= "table" or type(b) ~= "table" then
+        return a == b
+    end
+    for k, v in pairs(a) do
+        if not IsEqual(v, b[k]) then
+            return false
+        end
+    end
+    for k, _ in pairs(b) do
+        if a[k] == nil then
+            return false
+        end
+    end
+    return true
+end
+
+function Main()
+    -- Load the SaveUtils version to benchmark
+    dofile(SAVE_UTILS_PATH)
+    print(string.format("Benchmarking %s with %s", SAVE_UTILS_PATH, _VERSION))
+    print(string.format("%-14s %6s %10s %12s %14s", "scenario", "size", "length", "serialize", "deserialize"))
+
+    -- Run all scenarios for all sizes
+    for _, scenario in ipairs(SCENARIOS) do
+        local name, create = scenario[1], scenario[2]
+        for _, size in ipairs(SIZES) do
+            -- Check that the table survives a round trip, then time both directions
+            local data = create(size)
+            local str = serialize(data)
+            assert(IsEqual(deserialize(str), data), "Round trip changed the data of " .. name)
+            local serializeTime = Measure(function() serialize(data) end)
+            local deserializeTime = Measure(function() deserialize(str) end)
+            print(string.format(
+                "%-14s %6d %10d %9.3f ms %11.3f ms", name, size, #str, serializeTime, deserializeTime
+            ))
+        end
+    end
+end
+
+Main()
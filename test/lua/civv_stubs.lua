@@ -0,0 +1,246 @@
+--[[
+Stubs of the Civ V Lua API that are used by the APMod, such that it can run headless under a stock Lua 5.1 runtime.
+
+All stubs record their state in the global `Harness` table, which tests and benchmarks use to set up a game; fire
+events; and inspect the results. Any API function that is not stubbed explicitly is accepted and returns nil.
+]]
+
+Harness = {
+    calls = {},
+    database = {APOptions = {}, APCleanTextKeys = {}},
+    events = {},
+    files = {},
+    queries = {},
+    scriptData = {},
+    texts = {},
+    turn = 0,
+    update = nil,
+}
+
+
+-- GENERIC STUBS
+function Harness.Stub(name, members)
+    -- Create a table that returns a function recording its calls for every member that is not given
+    return setmetatable(members or {}, {
+        __index = function(_, key)
+            return function(...)
+                table.insert(Harness.calls, name .. "." .. key)
+            end
+        end,
+    })
+end
+
+function Harness.Enum(name)
+    -- Create a table that maps every key to its own name
+    return setmetatable({}, {
+        __index = function(_, key)
+            return name .. "." .. key
+        end,
+    })
+end
+
+function Harness.EventSet(name)
+    -- Create a table of events, which can be fired through the harness once handlers are added to them
+    -- Calling an event directly, like the game does for UI events, only records the call
+    return setmetatable({}, {
+        __index = function(events, key)
+            local handlers = {}
+            local event = setmetatable({Add = function(handler) table.insert(handlers, handler) end}, {
+                __call = function(...) table.insert(Harness.calls, name .. "." .. key) end,
+            })
+            Harness.events[name .. "." .. key] = handlers
+            rawset(events, key, event)
+            return event
+        end,
+    })
+end
+
+function Harness.Fire(eventName, ...)
+    -- Call all handlers of the given event with the arguments given and return the result of the final handler
+    local result = nil
+    for _, handler in ipairs(Harness.events[eventName] or {}) do
+        result = handler(...)
+    end
+    return result
+end
+
+function Harness.Capture(func, ...)
+    -- Call the function with the arguments given and return all lines it printed
+    local lines = {}
+    local globalPrint = print
+    print = function(line) table.insert(lines, line) end
+    local ok, result = pcall(func, ...)
+    print = globalPrint
+    assert(ok, result)
+    return lines
+end
+
+function Harness.NextFrame()
+    -- Call the update function of the UI context, if one is set
+    if Harness.update ~= nil then
+        Harness.update(1 / 60)
+    end
+end
+
+
+-- GAME OBJECT STUBS
+function Harness.CreateUnit(unitType)
+    -- Create a unit instance of the given type
+    return Harness.Stub("Unit", {
+        GetUnitType = function(_) return unitType end,
+    })
+end
+
+function Harness.AddUnit(playerId, unitId, unitType)
+    -- Create a unit instance of the given type with the unit ID given for the player, and return it
+    local unit = Harness.CreateUnit(unitType)
+    Players[playerId].units[unitId] = unit
+    return unit
+end
+
+function Harness.CreateTeam(teamId)
+    -- Create a team, which knows the techs and era it has
+    return Harness.Stub("Team", {
+        era = 0,
+        techs = {},
+        GetID = function(self) return teamId end,
+        GetCurrentEra = function(self) return self.era end,
+        SetCurrentEra = function(self, era) self.era = era end,
+        IsHasTech = function(self, techId) return self.techs[techId] == true end,
+        SetHasTech = function(self, techId, hasTech) self.techs[techId] = hasTech end,
+    })
+end
+
+function Harness.CreatePlayer(playerId)
+    -- Create a player, which is on the team with the same ID and stores its own units and script data
+    return Harness.Stub("Player", {
+        units = {},
+        GetID = function(self) return playerId end,
+        GetTeam = function(self) return playerId end,
+        IsAlive = function(self) return true end,
+        IsHuman = function(self) return playerId == 0 end,
+        HasCreatedReligion = function(self) return false end,
+        HasPolicy = function(self, policyId) return false end,
+        GetNumFreePolicies = function(self) return 0 end,
+        GetCivilizationDescription = function(self) return "Civilization " .. playerId end,
+        GetUnitByID = function(self, unitId) return self.units[unitId] end,
+        GetScriptData = function(self) return Harness.scriptData[playerId] end,
+        SetScriptData = function(self, data) Harness.scriptData[playerId] = data end,
+    })
+end
+
+function Harness.CreateGameInfoTable(tableName)
+    -- Create a game info table, which creates a row with text keys for every ID on first access
+    return setmetatable({}, {
+        __index = function(rows, id)
+            local prefix = table.concat({"TXT_KEY_", tableName:upper(), "_", id})
+            local row = {ID = id, Description = prefix .. "_DESC", Help = prefix .. "_HELP"}
+            rawset(rows, id, row)
+            return row
+        end,
+    })
+end
+
+
+-- CIV V API STUBS
+Players = setmetatable({}, {
+    __index = function(players, playerId)
+        local player = Harness.CreatePlayer(playerId)
+        rawset(players, playerId, player)
+        return player
+    end,
+})
+Teams = setmetatable({}, {
+    __index = function(teams, teamId)
+        local team = Harness.CreateTeam(teamId)
+        rawset(teams, teamId, team)
+        return team
+    end,
+})
+GameInfo = setmetatable({}, {
+    __index = function(gameInfo, tableName)
+        local gameInfoTable = Harness.CreateGameInfoTable(tableName)
+        rawset(gameInfo, tableName, gameInfoTable)
+        return gameInfoTable
+    end,
+})
+Game = Harness.Stub("Game", {
+    GetActivePlayer = function() return 0 end,
+    GetGameTurn = function() return Harness.turn end,
+    GetGameSpeedType = function() return 2 end,
+    GetHandicapType = function() return 3 end,
+})
+DB = {
+    Query = function(sql)
+        -- Record the query, and iterate over all rows of the queried table for SELECT queries
+        table.insert(Harness.queries, sql)
+        local tableName = sql:match("^SELECT .- FROM (%w+)")
+        local rows = tableName ~= nil and Harness.database[tableName] or {}
+        local i = 0
+        return function()
+            i = i + 1
+            return rows[i]
+        end
+    end,
+}
+Locale = {
+    ConvertTextKey = function(key) return Harness.texts[key] or key end,
+    GetCurrentLanguage = function() return {Type = "en_US"} end,
+    SetCurrentLanguage = function(language) table.insert(Harness.calls, "Locale.SetCurrentLanguage") end,
+}
+ContextPtr = {
+    SetUpdate = function(_, update) Harness.update = update end,
+    ClearUpdate = function(_) Harness.update = nil end,
+}
+Events = Harness.EventSet("Events")
+GameEvents = Harness.EventSet("GameEvents")
+LuaEvents = Harness.Stub("LuaEvents")
+Map = Harness.Stub("Map")
+UI = Harness.Stub("UI")
+GameDefines = {MAX_CIV_PLAYERS = 64, MAX_MAJOR_CIVS = 22}
+GameOptionTypes = Harness.Enum("GameOptionTypes")
+NotificationTypes = Harness.Enum("NotificationTypes")
+ButtonPopupTypes = Harness.Enum("ButtonPopupTypes")
+
+-- Do not warn about the cache of SaveUtils not being shared, as there is only a single Lua state
+WARN_NOT_SHARED = false
+
+function include(name)
+    -- Run the given Lua file of the APMod
+    local chunk = assert(loadstring(assert(Harness.files[name .. ".lua"], name), name))
+    chunk()
+end
+
+
+-- HARNESS FUNCTIONS
+function Harness.SetOptions(options)
+    -- Store the given options in the APOptions table like the XML template does, as JSON strings
+    Harness.database.APOptions = {}
+    for key, value in pairs(options) do
+        if type(value) == "boolean" then
+            value = table.concat({'"', tostring(value), '"'})
+        elseif type(value) == "string" then
+            value = table.concat({'"', value, '"'})
+        end
+        table.insert(Harness.database.APOptions, {Key = key, Value = tostring(value)})
+    end
+end
+
+function Harness.ReadFiles(modPath)
+    -- Read the Lua files of the APMod in the given folder and return them by file name
+    local files = {}
+    for _, name in ipairs({"APFunctions.lua", "json.lua", "SaveUtils.lua"}) do
+        local file = assert(io.open(modPath .. name, "rb"))
+        files[name] = file:read("*a")
+        file:close()
+    end
+    return files
+end
+
+function Harness.LoadMod(files, options)
+    -- Set the options and run the APMod from the Lua files given by file name, which initializes it
+    Harness.files = files
+    Harness.SetOptions(options or {})
+    include("APFunctions")
+    return Game.AP
+end
@@ -0,0 +1,170 @@
+import json
+import pkgutil
+import unittest
+from pathlib import Path
+from typing import Any
+
+try:
+    import lupa.lua51
+except ImportError:
+    lupa = None
+
+import worlds.civv
+
+STUBS_PATH = Path(__file__).parent / "lua" / "civv_stubs.lua"
+CLIENT_PREFIX = "APSTART:"
+CLIENT_POSTFIX = ":APEND"
+
+
+@unittest.skipIf(lupa is None, "lupa is not installed")
+class TestAPFunctions(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.files = {
+            x: pkgutil.get_data(worlds.civv.__name__, f"templates/apmod/{x}").decode("utf-8")
+            for x in ("APFunctions.lua", "json.lua", "SaveUtils.lua")
+        }
+
+    def load_mod(self, options: dict[str, Any] | None = None, script_data: dict[int, str] | None = None) -> None:
+        """Runs the APMod headless in a new Lua runtime with the given options and script data of the players"""
+        self.lua = lupa.lua51.LuaRuntime()
+        self.lua.execute(STUBS_PATH.read_text(encoding="utf-8"))
+        self.harness = self.lua.globals().Harness
+        for player_id, data in (script_data or {}).items():
+            self.harness.scriptData[player_id] = data
+        self.ap = self.harness.LoadMod(self.lua.table_from(self.files), self.lua.table_from(options or {}))
+
+    def call(self, name: str, *args: Any) -> Any:
+        """Calls a public function of the APMod and returns its parsed response"""
+        lines = list(self.harness.Capture(self.ap[name], *args).values())
+        responses = [x for x in lines if x.startswith(CLIENT_PREFIX) and x.endswith(CLIENT_POSTFIX)]
+        self.assertEqual(len(responses), 1)
+        return json.loads(responses[0].removeprefix(CLIENT_PREFIX).removesuffix(CLIENT_POSTFIX))
+
+    def get_locations(self, location_type: str) -> set[int]:
+        """Returns the IDs of all locations of the given type in the location table of the APMod"""
+        return set(self.lua.globals().locationTable[location_type].keys())
+
+    def test_tech_acquired(self) -> None:
+        """Tests that every AP tech is pushed exactly once and that the AI advances eras with non-AP techs"""
+        self.load_mod()
+        response = self.call("GetPushTable")
+        self.assertEqual(response["entries"][0]["sync"], True)
+        for _ in range(3):
+            for tech_id in range(0, 170):
+                self.harness.Fire("Events.TechAcquired", 0, tech_id)
+                self.harness.Fire("Events.TechAcquired", 1, tech_id)
+        entries = self.call("GetPushTable", response["epoch"], 1)["entries"]
+        self.assertEqual(len(entries), 1)
+        self.assertEqual(sorted(entries[0]["tech"]), list(range(83, 169)))
+        self.assertEqual(self.get_locations("tech"), set(range(83, 169)))
+        self.assertEqual(self.lua.globals().Teams[1].era, 7)
+
+    def test_settler_sanity(self) -> None:
+        """Tests that settlers are sent as locations and can no longer be trained once all have been sent"""
+        self.load_mod({"settler_sanity": True, "settler_sanity_amount": 2})
+        for unit_id in range(2):
+            self.assertTrue(self.harness.Fire("GameEvents.CityCanTrain", 0, 0, 0))
+            self.harness.AddUnit(0, unit_id, 0)
+            self.harness.Fire("GameEvents.CityTrained", 0, 0, unit_id, False, False)
+        self.assertFalse(self.harness.Fire("GameEvents.CityCanTrain", 0, 0, 0))
+        self.assertTrue(self.harness.Fire("GameEvents.CityCanTrain", 1, 0, 0))
+        self.assertEqual(self.get_locations("settler"), {1, 2})
+
+        # The AI may not train units that are made obsolete by a tech they have
+        self.assertTrue(self.harness.Fire("GameEvents.CityCanTrain", 1, 0, 16))
+        self.lua.globals().Teams[1].techs[68] = True
+        self.assertFalse(self.harness.Fire("GameEvents.CityCanTrain", 1, 0, 16))
+
+    def test_push_journal(self) -> None:
+        """Tests that pushed locations are kept until acknowledged in the same epoch and survive reloading the game"""
+        self.load_mod()
+        self.harness.AddUnit(0, 1, 1)
+        self.harness.Fire("GameEvents.CityTrained", 0, 0, 1, False, False)
+        self.harness.Fire("Events.TechAcquired", 0, 83)
+        response = self.call("GetPushTable")
+        self.assertEqual([x["sequence"] for x in response["entries"]], [1])
+        self.assertEqual((response["entries"][0]["unit"], response["entries"][0]["tech"]), ([1], [83]))
+        self.assertEqual([x["sequence"] for x in self.call("GetPushTable", "other", 1)["entries"]], [1])
+
+        # Reload the game, which requests another sync and creates a new epoch, without acknowledging the entries
+        # Acknowledgements of the old epoch must not remove entries of the reloaded journal
+        self.load_mod(script_data={0: self.harness.scriptData[0]})
+        reloaded = self.call("GetPushTable", response["epoch"], 2)
+        self.assertNotEqual(reloaded["epoch"], response["epoch"])
+        self.assertEqual([x["sequence"] for x in reloaded["entries"]], [1, 2])
+        self.assertEqual((reloaded["entries"][1]["unit"], reloaded["entries"][1]["tech"]), ([1], [83]))
+        self.assertEqual([x["sequence"] for x in self.call("GetPushTable", reloaded["epoch"], 1)["entries"]], [2])
+        self.assertEqual(self.call("GetPushTable", reloaded["epoch"], 2)["entries"], [])
+
+    def test_push_events(self) -> None:
+        """Tests that death links are sent once instead of being journaled"""
+        self.load_mod({"death_link": True, "death_link_trigger": "unit_killed"})
+        self.harness.Fire("GameEvents.UnitKilledInCombat", 1, 0, 4)
+        response = self.call("GetPushTable")
+        self.assertEqual(response["events"], {"death": " had its TXT_KEY_UNITS_4_DESC killed!"})
+        self.assertNotIn("death", response["entries"][0])
+        response = self.call("GetPushTable", response["epoch"], 1)
+        self.assertEqual((response["entries"], response["events"]), ([], {}))
+
+    def test_push_victory(self) -> None:
+        """Tests that a victory is journaled, such that it is sent again if a response never reached the client"""
+        self.load_mod()
+        epoch = self.call("GetPushTable")["epoch"]
+        self.harness.Fire("Events.EndGameShow", 0, 0)
+
+        # Drop the response that first carries the victory, which the client then never acknowledges
+        response = self.call("GetPushTable", epoch, 1)
+        self.assertEqual(([x.get("victory") for x in response["entries"]], response["events"]), ([True], {}))
+        response = self.call("GetPushTable", epoch, 1)
+        self.assertEqual([(x["sequence"], x.get("victory")) for x in response["entries"]], [(2, True)])
+        self.assertEqual(self.call("GetPushTable", epoch, 2)["entries"], [])
+
+    def test_item_table(self) -> None:
+        """Tests that received items are stored as counts and survive reloading the script data"""
+        self.load_mod()
+        self.assertEqual(self.call("GetItemTable"), {"total": 0, "counts": {}})
+        self.ap.UpdateItemTable(self.lua.table_from([140320, 140320, 140320, 140400, 140320]))
+        self.harness.Fire("Events.ActivePlayerTurnEnd")
+        self.load_mod(script_data={0: self.harness.scriptData[0]})
+        self.assertEqual(self.call("GetItemTable"), {"total": 5, "counts": {"140320": 4, "140400": 1}})
+
+        # Older saves store every received item separately, which are converted into counts
+        self.lua.globals().LoadItemTable(self.lua.table_from([140320, 140400, 140320]))
+        self.assertEqual(self.call("GetItemTable"), {"total": 3, "counts": {"140320": 2, "140400": 1}})
+
+    def test_script_data_flush(self) -> None:
+        """Tests that script data changed mid-turn is serialized once on the next UI frame, without a client polling"""
+        self.load_mod()
+        self.harness.NextFrame()
+        self.lua.execute("""
+            setScriptDataCalls = 0
+            local setScriptData = Players[0].SetScriptData
+            Players[0].SetScriptData = function(...)
+                setScriptDataCalls = setScriptDataCalls + 1
+                setScriptData(...)
+            end
+        """)
+        self.ap.UpdateItemTable(self.lua.table_from([140320]))
+        self.ap.GrantPromotions(self.lua.table_from([229]))
+        self.assertEqual(self.lua.globals().setScriptDataCalls, 0)
+        self.harness.NextFrame()
+        self.assertEqual(self.lua.globals().setScriptDataCalls, 1)
+
+        # Reload the game from the script data stored on the frame
+        self.load_mod(script_data={0: self.harness.scriptData[0]})
+        self.assertEqual(self.call("GetItemTable"), {"total": 1, "counts": {"140320": 1}})
+        self.assertEqual(list(self.lua.globals().promotionTable.values()), [229])
+
+    def test_locale_refresh(self) -> None:
+        """Tests that all location updates made within a single UI frame share a single locale refresh"""
+        self.load_mod({"promotion_sanity": True})
+        self.harness.NextFrame()
+        self.harness.calls = self.lua.table()
+        for promotion_id in range(229, 312):
+            self.harness.Fire("GameEvents.UnitPromoted", 0, 0, promotion_id)
+            self.ap.UpdateLocationTable("promotion", self.lua.table_from([promotion_id]), False)
+        self.harness.NextFrame()
+        self.harness.NextFrame()
+        self.assertEqual(list(self.harness.calls.values()).count("Locale.SetCurrentLanguage"), 1)
+        self.assertEqual(self.get_locations("promotion"), set(range(229, 312)))
@@ -0,0 +1,73 @@
+import io
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+from test.bases import WorldTestBase
+from worlds.civv.constants import GAME_NAME
+from worlds.civv.container import CivVContainer
+from worlds.civv.world import CivVWorld
+
+N_WRITES = 4
+
+
+class TestContainer(WorldTestBase):
+    game = GAME_NAME
+    options = {
+        "settler_sanity": True,
+        "promotion_sanity": True,
+    }
+
+    def fill(self) -> None:
+        """Places the item pool of this player randomly into all of its empty locations"""
+        items = [x for x in self.multiworld.itempool if x.player == self.player]
+        self.world.random.shuffle(items)
+        locations = [x for x in self.multiworld.get_locations(self.player) if x.item is None]
+        for location, item in zip(locations, items):
+            location.place_locked_item(item)
+
+    @staticmethod
+    def write(world: CivVWorld) -> list[tuple[str, bytes]]:
+        """Writes a new container of the given `world` to memory and returns the paths and contents of all members"""
+        container = CivVContainer(path=None, world=world, player=world.player, player_name="Player")
+        with io.BytesIO() as file:
+            container.write(file)
+            with zipfile.ZipFile(file) as zf:
+                return [(x, zf.read(x)) for x in zf.namelist()]
+
+    def test_write(self) -> None:
+        """Tests that a written container holds every static and rendered file exactly once with its contents"""
+        self.fill()
+        container = CivVContainer(path=None, world=self.world, player=self.player, player_name="Player")
+        for sql_database_updates in (False, True):
+            with self.subTest(sql_database_updates=sql_database_updates), mock.patch.object(
+                    CivVContainer, "sql_database_updates", sql_database_updates
+            ):
+                static_files = dict(container.get_static_files(sql_database_updates))
+                rendered_files = dict(container.render_files())
+                self.assertFalse(static_files.keys() & rendered_files.keys())
+
+                # Besides the manifest, the container holds exactly all static and rendered files once each
+                members = self.write(self.world)
+                self.assertEqual(len(members), len(dict(members)))
+                members = dict(members)
+                self.assertIn("archipelago.json", members)
+                del members["archipelago.json"]
+                self.assertEqual(members, {**static_files, **rendered_files})
+
+    def test_write_concurrent(self) -> None:
+        """Tests that containers of different slots rendered concurrently contain the same members as one by one"""
+        # Create a second slot with another seed, such that both containers differ
+        self.fill()
+        first = self.world
+        self.world_setup()
+        self.fill()
+        worlds = [first, self.world]
+        expected = [self.write(x) for x in worlds]
+        self.assertNotEqual(expected[0], expected[1])
+
+        # Write the containers of both slots interleaved on multiple threads
+        with ThreadPoolExecutor(max_workers=len(worlds) * N_WRITES) as executor:
+            results = list(executor.map(self.write, worlds * N_WRITES))
+        for i, result in enumerate(results):
+            self.assertEqual(result, expected[i % len(worlds)])
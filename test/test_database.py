@@ -0,0 +1,116 @@
+import sqlite3
+import unittest
+from xml.etree import ElementTree
+
+from worlds.civv.container import CivVContainer
+from worlds.civv.database import CivVDatabaseChange, compile_sql, parse_xml
+
+
+def quote(name: str) -> str:
+    """Returns the given identifier quoted for use in SQL"""
+    return '"' + name + '"'
+
+
+def get_value(text: str | None) -> str | int:
+    """Returns the value the Civ V XML parser stores for the given text"""
+    return {"true": 1, "false": 0}.get(text, text if text is not None else "")
+
+
+def get_values(element: ElementTree.Element) -> dict[str, str | int]:
+    """Returns the columns and values given by the attributes and child elements of an element"""
+    return {**{x: get_value(y) for x, y in element.attrib.items()}, **{x.tag: get_value(x.text) for x in element}}
+
+
+def apply_xml(connection: sqlite3.Connection, text: str) -> None:
+    """Applies a Civ V database XML file one element at a time, like Civ V does"""
+    for table in ElementTree.fromstring(text):
+        if table.tag == "Table":
+            columns = [
+                f'"{x.get("name")}" {x.get("type")}' + " PRIMARY KEY" * (x.get("primarykey") == "true")
+                + " AUTOINCREMENT" * (x.get("autoincrement") == "true") + " UNIQUE" * (x.get("unique") == "true")
+                for x in table
+            ]
+            connection.execute(f'CREATE TABLE "{table.get("name")}" ({", ".join(columns)})')
+            continue
+        for element in table:
+            if element.tag == "Row":
+                values = get_values(element)
+                connection.execute(
+                    f'INSERT INTO "{table.tag}" ({", ".join(quote(x) for x in values)}) '
+                    f'VALUES ({", ".join("?" * len(values))})', list(values.values())
+                )
+            elif element.tag == "Update":
+                values, where = get_values(element.find("Set")), get_values(element.find("Where"))
+                connection.execute(
+                    f'UPDATE "{table.tag}" SET {", ".join(f"{quote(x)} = ?" for x in values)} '
+                    f'WHERE {" AND ".join(f"{quote(x)} = ?" for x in where)}', [*values.values(), *where.values()]
+                )
+            elif element.tag == "Delete":
+                where = get_values(element)
+                connection.execute(
+                    f'DELETE FROM "{table.tag}" WHERE {" AND ".join(f"{quote(x)} = ?" for x in where)}',
+                    list(where.values())
+                )
+
+
+class TestDatabase(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        # Render all database template files with substitutions that need quoting in SQL
+        substitutions = {x: f"[COLOR_POSITIVE_TEXT]Player's item[ENDCOLOR] ({x})" for x in
+                         CivVContainer.get_substitution_keys()}
+        substitutions["policy_collective_rule_free_settler"] = (
+            '<Delete PolicyType="POLICY_COLLECTIVE_RULE" UnitClassType="UNITCLASS_SETTLER"/>'
+        )
+        substitutions["handicap_settler_goodies_free_settler"] = (
+            '<Delete HandicapType="HANDICAP_SETTLER" GoodyType="GOODY_SETTLER"/>'
+        )
+        templates = {x[0]: x[2] for x in CivVContainer.get_template_files()}
+        cls.xml_files = [templates[x].render(substitutions) for x in CivVContainer.get_database_files()]
+
+    def create_database(self) -> sqlite3.Connection:
+        """Creates a database with all tables and the rows that are changed by the database files"""
+        connection = sqlite3.connect(":memory:")
+        changes = [x for text in self.xml_files for x in parse_xml(text)]
+        created = {x.table for x in changes if x.type == "create"}
+        columns: dict[str, dict[str, None]] = {}
+        for change in changes:
+            if change.table not in created:
+                names = (x for x, _ in (*change.values, *change.where))
+                columns.setdefault(change.table, {}).update(dict.fromkeys(names))
+        for table, names in columns.items():
+            connection.execute(f'CREATE TABLE "{table}" ({", ".join(quote(x) for x in names)})')
+        for change in changes:
+            if change.where:
+                where = dict(change.where)
+                connection.execute(
+                    f'INSERT INTO "{change.table}" ({", ".join(quote(x) for x in where)}) '
+                    f'VALUES ({", ".join("?" * len(where))})', list(where.values())
+                )
+        return connection
+
+    @staticmethod
+    def dump(connection: sqlite3.Connection) -> dict[str, list[tuple]]:
+        """Returns the sorted rows of all tables in the database"""
+        tables = [x for x, in connection.execute("SELECT name FROM sqlite_master WHERE type = 'table'")]
+        return {x: sorted(connection.execute(f'SELECT * FROM "{x}"').fetchall(), key=repr) for x in tables}
+
+    def test_same_effect(self) -> None:
+        """Tests that the compiled SQL changes the database in the same way as the XML files"""
+        xml_database = self.create_database()
+        for text in self.xml_files:
+            apply_xml(xml_database, text)
+        sql_database = self.create_database()
+        sql_database.executescript(compile_sql(x for text in self.xml_files for x in parse_xml(text)))
+        self.assertEqual(self.dump(sql_database), self.dump(xml_database))
+
+    def test_batched(self) -> None:
+        """Tests that the compiled SQL uses fewer statements than the XML files have changes"""
+        changes = [x for text in self.xml_files for x in parse_xml(text)]
+        self.assertLess(sum(sqlite3.complete_statement(x) for x in compile_sql(changes).split(";\n")),
+                        len(changes) // 5)
+
+    def test_unexpected_change_type(self) -> None:
+        """Tests that changes of an unexpected type are rejected, naming the type"""
+        with self.assertRaisesRegex(ValueError, "'drop'"):
+            compile_sql([CivVDatabaseChange("drop", "Units")])
@@ -0,0 +1,33 @@
+import gc
+import tracemalloc
+import unittest
+
+from BaseClasses import MultiWorld
+from worlds.civv.instrumentation import CivVGenerationReport
+
+
+@unittest.skipIf(tracemalloc.is_tracing(), "memory allocations are already traced")
+class TestGenerationReport(unittest.TestCase):
+    def test_stop_tracing(self) -> None:
+        """Tests that tracing stops once the multiworld of a report that is never written is deleted"""
+        multiworlds = [MultiWorld(1), MultiWorld(1)]
+        for multiworld in multiworlds:
+            CivVGenerationReport.get(multiworld)
+        self.assertTrue(tracemalloc.is_tracing())
+
+        # Tracing continues until the last multiworld with an active report is deleted
+        del multiworld
+        multiworlds.pop()
+        gc.collect()
+        self.assertTrue(tracemalloc.is_tracing())
+        multiworlds.pop()
+        gc.collect()
+        self.assertFalse(tracemalloc.is_tracing())
+
+    def test_discard(self) -> None:
+        """Tests that tracing stops once the last report is discarded"""
+        multiworld = MultiWorld(1)
+        CivVGenerationReport.get(multiworld)
+        self.assertTrue(tracemalloc.is_tracing())
+        CivVGenerationReport.discard(multiworld)
+        self.assertFalse(tracemalloc.is_tracing())
@@ -0,0 +1,93 @@
+import random
+from collections import Counter
+from typing import Any
+
+from BaseClasses import CollectionState
+from test.bases import WorldTestBase
+from worlds.civv.constants import GAME_NAME
+from worlds.civv.enums import CivVLogicIssueType
+from worlds.civv.items import PROGRESSION_ITEMS, PROGRESSIVE_ITEMS
+from worlds.civv.logic import CivVLogicAnalyzer
+
+SEED = 1313
+N_STATES = 40
+
+
+class TestLogicAnalyzer(WorldTestBase):
+    game = GAME_NAME
+
+    def test_analyze(self) -> None:
+        """Tests that no location requires more of an item than the player can collect"""
+        item_counts = Counter(x.name for x in self.multiworld.itempool if x.player == self.player)
+        item_counts.update(x.name for x in self.multiworld.precollected_items[self.player])
+        analyzer = CivVLogicAnalyzer(self.world.options, item_counts)
+        issues = analyzer.analyze(list(self.world.get_locations_data()))
+
+        # Redundant requirements are allowed, as locations list all techs the game requires even if their region
+        # already implies them. These are stripped from the rules
+        self.assertEqual([x for x in issues if x.type != CivVLogicIssueType.redundant], [])
+
+    def test_compile(self) -> None:
+        """Tests that the compiled logic has the same structure and reachability as the rules of the world"""
+        logic = self.world.get_compiled_logic()
+
+        # Check that all regions and locations are compiled with the parents they have in the world
+        regions = self.multiworld.get_regions(self.player)
+        locations = {x.name: x for x in self.multiworld.get_locations(self.player)}
+        victory = locations.pop("Victory")
+        self.assertEqual(
+            {name: data["parent"] for name, data in logic["regions"].items()},
+            {x.name: x.entrances[0].parent_region.name if x.entrances else None for x in regions},
+        )
+        self.assertEqual(
+            {name: data["region"] for name, data in logic["locations"].items()},
+            {name: x.parent_region.name for name, x in locations.items()},
+        )
+        self.assertEqual(logic["victory"]["region"], victory.parent_region.name)
+
+        # Check that exactly the progressive items in the item pool are expanded into their items, in order
+        pool_names = {x.name for x in self.multiworld.itempool if x.player == self.player}
+        self.assertEqual(set(logic["progressive_items"]), {x.name for x in PROGRESSIVE_ITEMS} & pool_names)
+        game_ids = {x.name: x.game_id for x in PROGRESSION_ITEMS}
+        for name, data in logic["progressive_items"].items():
+            if data["items"]:
+                self.assertEqual([game_ids[x] for x in data["items"]], data["game_ids"], name)
+
+        # Check that every region and location is reachable in the compiled logic iff it is by the rules of the world
+        rng = random.Random(SEED)
+        pool = [x for x in self.multiworld.itempool if x.player == self.player and x.advancement]
+        for i in range(N_STATES):
+            state = CollectionState(self.multiworld)
+            for item in rng.sample(pool, len(pool) * i // N_STATES):
+                state.collect(item, prevent_sweep=True)
+            for region in regions:
+                self.assertEqual(self.can_reach(logic, region.name, state), region.can_reach(state), region.name)
+            for name, location in locations.items():
+                self.assertEqual(self.can_reach(logic, name, state, "locations"), location.can_reach(state), name)
+            self.assertEqual(self.can_reach(logic, "victory", state, None), victory.can_reach(state))
+
+    def can_reach(self, logic: dict[str, Any], name: str, state: CollectionState, key: str | None = "regions") -> bool:
+        """Returns whether the region or location with the given `name` is reachable in the compiled `logic`"""
+        data = logic[key][name] if key is not None else logic[name]
+        parent = data["parent"] if key == "regions" else data["region"]
+        return (parent is None or self.can_reach(logic, parent, state)) and any(
+            all(state.count(item, self.player) >= count for item, count in x.items()) for x in data["requirements"]
+        )
+
+
+class TestLogicAnalyzerAllSanities(TestLogicAnalyzer):
+    options = {
+        "building_sanity": True,
+        "national_wonder_sanity": True,
+        "world_wonder_sanity": True,
+        "unit_sanity": True,
+        "settler_sanity": True,
+        "promotion_sanity": True,
+    }
+
+
+class TestLogicAnalyzerNoProgressiveTechs(TestLogicAnalyzerAllSanities):
+    options = {
+        **TestLogicAnalyzerAllSanities.options,
+        "progressive_techs": False,
+    }
@@ -0,0 +1,198 @@
+import os
+import tempfile
+import unittest
+import zipfile
+from pathlib import Path
+from unittest import mock
+
+from worlds.civv.container import CivVContainer
+from worlds.civv.dataclasses import CivVModInstall
+from worlds.civv.mods import CivVModIndex
+
+
+class TestModIndex(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tempdir = tempfile.TemporaryDirectory()
+        self.mods_folder_path = Path(self.tempdir.name) / "mods"
+        self.mods_folder_path.mkdir()
+
+    def tearDown(self) -> None:
+        self.tempdir.cleanup()
+
+    def install(self, name: str, version: int, mod_hash: str) -> None:
+        mod_path = self.mods_folder_path / name
+        mod_path.mkdir()
+        (mod_path / "mod.modinfo").write_text(f'<Mod id="x" version="{version}"><Properties/></Mod>')
+        (mod_path / ".hash").write_text(mod_hash)
+
+    def test_save_load(self) -> None:
+        """Tests that a saved index is loaded again as is"""
+        index = CivVModIndex(self.mods_folder_path)
+        index.add(CivVModInstall(name="apmod - a", version=1, hash="abc", player=2, player_name="A", installed=1.5))
+        index.save()
+        loaded = CivVModIndex.load(self.mods_folder_path, "apmod", ".hash")
+        self.assertEqual(loaded.installs, index.installs)
+        self.assertEqual([x.name for x in self.mods_folder_path.iterdir()], [CivVModIndex.FILE_NAME])
+
+    def test_rebuild(self) -> None:
+        """Tests that a missing or invalid index is rebuilt from the installed mods"""
+        self.install("apmod - a", 1, "abc")
+        self.install("apmod - b", 3, "def")
+        for contents in (None, "{invalid"):
+            if contents is not None:
+                (self.mods_folder_path / CivVModIndex.FILE_NAME).write_text(contents)
+            with self.subTest(contents=contents):
+                index = CivVModIndex.load(self.mods_folder_path, "apmod", ".hash")
+                self.assertEqual({x.name: (x.version, x.hash) for x in index.installs.values()},
+                                 {"apmod - a": (1, "abc"), "apmod - b": (3, "def")})
+                self.assertTrue(index.path.exists())
+
+    def test_rebuild_player(self) -> None:
+        """Tests that the player of a rebuilt install is obtained from its default folder name"""
+        self.install("apmod - ap_123_p4_some_name", 1, "")
+        self.install("apmod - custom", 2, "")
+        index = CivVModIndex.rebuild(self.mods_folder_path, "apmod", ".hash")
+        self.assertEqual({x.name: (x.player, x.player_name) for x in index.installs.values()},
+                         {"apmod - ap_123_p4_some_name": (4, "some_name"), "apmod - custom": (0, "")})
+
+    def test_free_version(self) -> None:
+        """Tests that the lowest version not in use is returned"""
+        index = CivVModIndex(self.mods_folder_path)
+        self.assertEqual(index.get_free_version(), 1)
+        for name, version in (("a", 1), ("b", 2), ("c", 4)):
+            index.add(CivVModInstall(name=name, version=version, hash=""))
+        self.assertEqual(index.get_free_version(), 3)
+
+    def test_prune(self) -> None:
+        """Tests that the least recently used mods that are not protected are removed first"""
+        index = CivVModIndex(self.mods_folder_path)
+        for i, name in enumerate(("apmod - a", "apmod - b", "apmod - c", "apmod - d")):
+            self.install(name, i+1, "")
+            index.add(CivVModInstall(name=name, version=i+1, hash="", last_used=float(i), size=10))
+
+        # Limit the number of mods, protecting the least recently used one
+        removed = index.prune(max_count=2, max_size=0, protected={"apmod - a"})
+        self.assertEqual([x.name for x in removed], ["apmod - b", "apmod - c"])
+        self.assertEqual(sorted(index.installs), ["apmod - a", "apmod - d"])
+        self.assertEqual(sorted(x.name for x in self.mods_folder_path.iterdir()),
+                         [CivVModIndex.FILE_NAME, "apmod - a", "apmod - d"])
+
+        # Limit the total size of the mods
+        removed = index.prune(max_count=0, max_size=10)
+        self.assertEqual([x.name for x in removed], ["apmod - a"])
+
+        # Pruned mods keep their version, which is not given to any other mod
+        self.assertEqual(index.pruned_versions, {"apmod - a": 1, "apmod - b": 2, "apmod - c": 3})
+        self.assertEqual(CivVModIndex.load(self.mods_folder_path, "apmod", ".hash").pruned_versions,
+                         index.pruned_versions)
+        self.assertEqual((index.get_version("apmod - b"), index.get_version("apmod - e")), (2, 5))
+        index.add(CivVModInstall(name="apmod - b", version=2, hash=""))
+        self.assertNotIn("apmod - b", index.pruned_versions)
+
+    def test_prune_failed(self) -> None:
+        """Tests that a mod that cannot be moved out of the mods folder is kept in the index"""
+        index = CivVModIndex(self.mods_folder_path)
+        self.install("apmod - a", 1, "")
+        index.add(CivVModInstall(name="apmod - a", version=1, hash=""))
+        with mock.patch.object(Path, "rename", side_effect=PermissionError):
+            self.assertEqual(index.prune(max_count=1, max_size=0, protected=()), [])
+            self.assertEqual(index.prune(max_count=0, max_size=1, protected=()), [])
+        self.assertEqual((list(index.installs), index.pruned_versions), (["apmod - a"], {}))
+        self.assertTrue((self.mods_folder_path / "apmod - a" / "mod.modinfo").exists())
+
+    def test_remove_folder(self) -> None:
+        """Tests that the modinfo file of a folder that cannot be deleted entirely is deleted"""
+        self.install("apmod - a", 1, "")
+        with mock.patch("shutil.rmtree", side_effect=PermissionError), self.assertLogs(level="WARNING"):
+            self.assertFalse(CivVModIndex.remove_folder(self.mods_folder_path / "apmod - a"))
+        self.assertEqual([x.name for x in (self.mods_folder_path / "apmod - a").iterdir()], [".hash"])
+        self.assertTrue(CivVModIndex.remove_folder(self.mods_folder_path / "apmod - a"))
+        self.assertFalse((self.mods_folder_path / "apmod - a").exists())
+
+    def test_sweep(self) -> None:
+        """Tests that leftover mods in the mods folder and old entries in the temporary folder are deleted on load"""
+        self.install(".apmod - a.0123", 1, "")
+        self.install(".APMod - b.4567", 2, "")
+        index = CivVModIndex(self.mods_folder_path)
+        old_path, new_path = index.create_temp_path("apmod - c"), index.create_temp_path("apmod - d")
+        old_path.mkdir()
+        new_path.mkdir()
+        os.utime(old_path, (0, 0))
+        index = CivVModIndex.load(self.mods_folder_path, "apmod", ".hash")
+        self.assertEqual([x.name for x in self.mods_folder_path.iterdir()], [CivVModIndex.FILE_NAME])
+        self.assertEqual(list(index.temp_folder_path.iterdir()), [new_path])
+
+
+class TestInstallMod(unittest.TestCase):
+    MOD_NAME = f"{CivVContainer.AP_MOD_NAME} - ap_1_p1_a"
+
+    def setUp(self) -> None:
+        self.tempdir = tempfile.TemporaryDirectory()
+        self.mods_folder_path = Path(self.tempdir.name) / "mods"
+        self.mods_folder_path.mkdir()
+        self.container = CivVContainer(path=Path(self.tempdir.name) / "AP_1_P1_A.apcivv", world=None, player=1,
+                                       player_name="A")
+        with zipfile.ZipFile(self.container.path, "w") as zf:
+            zf.writestr(f"{CivVContainer.AP_MOD_NAME}/mod.modinfo",
+                        '<Mod id="x" version="1"><Properties><Teaser/></Properties></Mod>')
+            zf.writestr(f"{CivVContainer.AP_MOD_NAME}/apfunctions.lua", "Init()")
+
+    def tearDown(self) -> None:
+        self.tempdir.cleanup()
+
+    def install_legacy(self, version: int) -> Path:
+        """Installs the mod like clients did before installs were indexed, without a hash file"""
+        mod_path = self.mods_folder_path / self.MOD_NAME
+        mod_path.mkdir()
+        (mod_path / "mod.modinfo").write_text(f'<Mod id="x" version="{version}"><Properties/></Mod>')
+        (mod_path / "apfunctions.lua").write_text("Init()")
+        return mod_path
+
+    def install(self) -> CivVModInstall:
+        """Installs the mod of the container with a freshly loaded index"""
+        mod_index = CivVModIndex.load(self.mods_folder_path, CivVContainer.AP_MOD_NAME,
+                                      CivVContainer.MOD_HASH_FILE_NAME)
+        with zipfile.ZipFile(self.container.path) as zf:
+            return self.container.install_mod(zf, mod_index)
+
+    def test_legacy_install(self) -> None:
+        """Tests that an install without a hash file is kept with its version, and only has its hash stored"""
+        mod_path = self.install_legacy(3)
+        modinfo = (mod_path / "mod.modinfo").read_text()
+        install = self.install()
+        self.assertEqual((install.version, install.player_name), (3, "A"))
+        self.assertEqual((mod_path / "mod.modinfo").read_text(), modinfo)
+        self.assertEqual((mod_path / CivVContainer.MOD_HASH_FILE_NAME).read_text(), install.hash)
+        self.assertEqual(self.install().installed, install.installed)
+
+    def test_reinstall(self) -> None:
+        """Tests that a stale install is replaced by an install with the same version"""
+        mod_path = self.install_legacy(3)
+        (mod_path / CivVContainer.MOD_HASH_FILE_NAME).write_text("stale")
+        (self.mods_folder_path / "apmod - other").mkdir()
+        (self.mods_folder_path / "apmod - other" / "mod.modinfo").write_text('<Mod id="x" version="1"/>')
+        install = self.install()
+        self.assertEqual(install.version, 3)
+        self.assertNotEqual(install.hash, "stale")
+        self.assertIn('version="3"', (mod_path / "mod.modinfo").read_text())
+        self.assertEqual(sorted(x.name for x in self.mods_folder_path.iterdir()),
+                         sorted([CivVModIndex.FILE_NAME, "apmod - other", self.MOD_NAME]))
+
+    def test_reinstall_failed(self) -> None:
+        """Tests that a stale install is restored if the new install cannot be moved into place"""
+        mod_path = self.install_legacy(3)
+        (mod_path / CivVContainer.MOD_HASH_FILE_NAME).write_text("stale")
+        rename = Path.rename
+
+        def fail_install(path: Path, target: Path) -> Path:
+            # Only fail to move the new install into place, not the stale install that is moved back
+            if target == mod_path and (path / CivVContainer.MOD_HASH_FILE_NAME).read_text() != "stale":
+                raise PermissionError
+            return rename(path, target)
+
+        with mock.patch.object(Path, "rename", fail_install), self.assertRaises(PermissionError):
+            self.install()
+        self.assertEqual((mod_path / CivVContainer.MOD_HASH_FILE_NAME).read_text(), "stale")
+        self.assertEqual(sorted(x.name for x in self.mods_folder_path.iterdir()),
+                         [CivVModIndex.FILE_NAME, self.MOD_NAME])
+        self.assertEqual(list((Path(self.tempdir.name) / CivVModIndex.TEMP_FOLDER_NAME).iterdir()), [])
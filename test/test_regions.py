@@ -0,0 +1,89 @@
+import random
+
+from BaseClasses import CollectionState, Item
+from test.bases import WorldTestBase
+from worlds.civv.constants import GAME_NAME
+from worlds.civv.regions import CivVRegion
+from worlds.generic.Rules import set_rule
+
+SEED = 1313
+N_STEPS = 100
+
+
+class TestReachability(WorldTestBase):
+    game = GAME_NAME
+
+    def assert_reachability(self, state: CollectionState, items: list[Item]) -> None:
+        """Asserts that all regions and locations are reachable in `state` iff they are in a fresh sweep of `items`"""
+        # Determine the reachable regions of a new state with the same items using the regular region sweep of AP
+        expected = CollectionState(self.multiworld)
+        for item in items:
+            expected.collect(item, prevent_sweep=True)
+        expected.update_reachable_regions(self.player)
+
+        # Check all regions and locations, first in the state that may be stale
+        for region in self.multiworld.get_regions(self.player):
+            self.assertEqual(region.can_reach(state), region in expected.reachable_regions[self.player], region.name)
+            if region in expected.reachable_regions[self.player]:
+                self.assertEqual(state.path.get(region), expected.path.get(region), region.name)
+        for location in self.multiworld.get_locations(self.player):
+            self.assertEqual(location.can_reach(state), location.can_reach(expected), location.name)
+
+    def test_reachability(self) -> None:
+        """Tests that reachable regions are determined like the regular region sweep after collecting and removing"""
+        # Check that the single step reachability is used at all
+        regions = self.multiworld.get_regions(self.player)
+        self.assertTrue(all(isinstance(x, CivVRegion) and x.reachability is not None for x in regions))
+
+        # Randomly collect or remove some progression items, and check the reachability after every change
+        rng = random.Random(SEED)
+        pool = [x for x in self.multiworld.itempool if x.player == self.player and x.advancement]
+        state = CollectionState(self.multiworld)
+        collected: list[Item] = []
+        for _ in range(N_STEPS):
+            if not collected or (pool and rng.random() < 0.6):
+                for item in rng.sample(pool, min(len(pool), rng.randint(1, 20))):
+                    state.collect(item, prevent_sweep=True)
+                    pool.remove(item)
+                    collected.append(item)
+            else:
+                for item in rng.sample(collected, min(len(collected), rng.randint(1, 10))):
+                    state.remove(item)
+                    collected.remove(item)
+                    pool.append(item)
+            self.assert_reachability(state, collected)
+
+    def test_changed_rule(self) -> None:
+        """Tests that the regular region sweep is used once an entrance rule was changed after creating the regions"""
+        # Block the entrance of a region that is reachable with all items
+        items = [x for x in self.multiworld.itempool if x.player == self.player and x.advancement]
+        state = CollectionState(self.multiworld)
+        for item in items:
+            state.collect(item, prevent_sweep=True)
+        region = next(x for x in self.multiworld.get_regions(self.player) if x.entrances and x.can_reach(state))
+        set_rule(region.entrances[0], lambda _: False)
+
+        # The region is no longer reachable in a new state with the same items
+        state = CollectionState(self.multiworld)
+        for item in items:
+            state.collect(item, prevent_sweep=True)
+        self.assertFalse(region.can_reach(state))
+        self.assert_reachability(state, items)
+
+
+class TestReachabilityAllSanities(TestReachability):
+    options = {
+        "building_sanity": True,
+        "national_wonder_sanity": True,
+        "world_wonder_sanity": True,
+        "unit_sanity": True,
+        "settler_sanity": True,
+        "promotion_sanity": True,
+    }
+
+
+class TestReachabilityNoProgressiveTechs(TestReachabilityAllSanities):
+    options = {
+        **TestReachabilityAllSanities.options,
+        "progressive_techs": False,
+    }
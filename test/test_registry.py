@@ -0,0 +1,35 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+from worlds.civv import registry
+from worlds.civv.helpers import write_registry
+from worlds.civv.items import FILLER_ITEMS, ITEMS_DATA, ITEM_GROUPS, TRAP_ITEMS
+from worlds.civv.locations import LOCATIONS_DATA
+
+
+class TestRegistry(unittest.TestCase):
+    def test_item_ids(self) -> None:
+        """Tests that the static registry contains the same item IDs as the item definitions"""
+        self.assertEqual(registry.ITEM_NAME_TO_ID, {x.name: x.ap_id for x in ITEMS_DATA})
+
+    def test_location_ids(self) -> None:
+        """Tests that the static registry contains the same location IDs as the location definitions"""
+        self.assertEqual(registry.LOCATION_NAME_TO_ID, {x.name: x.ap_id for x in LOCATIONS_DATA})
+
+    def test_item_groups(self) -> None:
+        """Tests that the static registry contains the same item groups as the item definitions"""
+        self.assertEqual(registry.ITEM_GROUPS, {key: tuple(value) for key, value in ITEM_GROUPS.items()})
+
+    def test_weights(self) -> None:
+        """Tests that the static registry contains the same default filler and trap weights"""
+        self.assertEqual(registry.FILLER_ITEM_WEIGHTS, {x.name: x.weight for x in FILLER_ITEMS})
+        self.assertEqual(registry.TRAP_ITEM_WEIGHTS, {x.name: x.weight for x in TRAP_ITEMS})
+
+    def test_up_to_date(self) -> None:
+        """Tests that regenerating the static registry yields the committed module"""
+        with tempfile.TemporaryDirectory() as d:
+            path = Path(d) / "registry.py"
+            write_registry(path)
+            self.assertEqual(path.read_text(encoding="utf-8"), Path(registry.__file__).read_text(encoding="utf-8"),
+                             "registry.py is out of date, regenerate it with helpers.write_registry()")
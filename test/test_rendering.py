@@ -0,0 +1,108 @@
+import functools
+import itertools
+import unittest
+
+from BaseClasses import Item, ItemClassification
+from worlds.civv.container import CivVContainer
+from worlds.civv.database import parse_xml
+from worlds.civv.enums import CivVItemClassificationColors, CivVItemClassificationFlags, CivVItemClassificationNames
+from worlds.civv.exceptions import TemplateException
+from worlds.civv.rendering import XML_CHARS_SUBSTITUTIONS, CivVItemFormatter, CivVTemplate, clean_text
+
+PLAYER_NAMES = {1: "Player", 2: 'The "<Other>" & {Player}'}
+CLASSIFICATIONS = (
+    ItemClassification.filler,
+    ItemClassification.progression,
+    ItemClassification.useful,
+    ItemClassification.trap,
+    ItemClassification.progression | ItemClassification.useful,
+    ItemClassification.progression | ItemClassification.skip_balancing,
+)
+
+
+def format_item(item: Item, player: int, disguise_traps: bool, item_hints: str) -> str:
+    """Formats the given `item` like containers did for every call before the item formatter was compiled"""
+    classification = item.classification
+    if classification == ItemClassification.trap and disguise_traps:
+        classification = ItemClassification.progression
+    color = CivVItemClassificationColors.get_color(classification)
+    match item_hints:
+        case "full":
+            player_name = f"{clean_text(PLAYER_NAMES[item.player])}'s" if item.player != player else "Your"
+            return f"{player_name} [{color}]{clean_text(item.name)}[ENDCOLOR]"
+        case "classification":
+            return f"A [{color}]{CivVItemClassificationNames.get_name(classification)} item[ENDCOLOR]"
+        case "none":
+            return f"An [{CivVItemClassificationColors.default}]item[ENDCOLOR]"
+
+
+def format_flag(item: Item, disguise_traps: bool, item_hints: str) -> str:
+    """Formats the flag of the given `item` like containers did for every call before the item formatter was compiled"""
+    classification = item.classification
+    if classification == ItemClassification.trap and disguise_traps:
+        classification = ItemClassification.progression
+    match item_hints:
+        case "full" | "classification":
+            return f"[{CivVItemClassificationFlags.get_flag(classification)}] "
+        case "none":
+            return f"[{CivVItemClassificationFlags.default}] "
+
+
+class TestRendering(unittest.TestCase):
+    def test_render(self) -> None:
+        """Tests that rendering a template yields the same result as str.format"""
+        text = "<Row>{a}</Row>{{escaped}}{b}{a}"
+        substitutions = {"a": "1", "b": "[COLOR]2[ENDCOLOR]", "c": "unused"}
+        template = CivVTemplate(text)
+        self.assertEqual(template.render(substitutions), text.format(**substitutions))
+        self.assertEqual(template.field_names, {"a", "b"})
+
+    def test_unsupported_placeholder(self) -> None:
+        """Tests that placeholders that are not plain names are rejected"""
+        for text in ("{a.b}", "{a[0]}", "{a!r}", "{a:>3}", "{}"):
+            with self.subTest(text=text), self.assertRaises(TemplateException):
+                CivVTemplate(text)
+
+    def test_template_files(self) -> None:
+        """Tests that the template files use exactly all substitution keys"""
+        CivVContainer.get_template_files()
+
+    def test_clean_text(self) -> None:
+        """Tests that cleaning text substitutes all invalid XML characters in order"""
+        for text in ('A "quoted" <name> & {braces}', "&lt;", "plain"):
+            with self.subTest(text=text):
+                expected = functools.reduce(lambda x, y: x.replace(*y), XML_CHARS_SUBSTITUTIONS.items(), text)
+                self.assertEqual(clean_text(text), expected)
+
+    def test_clean_text_keys(self) -> None:
+        """Tests that the clean text keys table maps exactly all text keys that have a clean version"""
+        substitutions = dict.fromkeys(CivVContainer.get_substitution_keys(), "")
+        changes = [
+            change
+            for _, extension, contents in CivVContainer.get_template_files() if extension == "xml"
+            for change in parse_xml(contents.render(substitutions))
+        ]
+        clean_tags = {
+            dict(x.values)["Tag"] for x in changes if x.table == "Language_en_US" and x.type == "insert"
+            and dict(x.values)["Tag"].endswith("_CLEAN")
+        }
+        clean_text_keys = {dict(x.values)["Tag"]: dict(x.values)["CleanTag"] for x in changes
+                           if x.table == "APCleanTextKeys" and x.type == "insert"}
+        self.assertEqual(clean_text_keys, {x.removesuffix("_CLEAN"): x for x in clean_tags})
+
+    def test_item_formatter(self) -> None:
+        """Tests that the item formatter formats items and flags exactly like formatting them on every call did"""
+        items = [
+            Item(name, classification, None, player)
+            for name, classification, player in itertools.product(
+                ("Item", "A <Special> & {Item}"), CLASSIFICATIONS, PLAYER_NAMES
+            )
+        ]
+        for item_hints, disguise_traps in itertools.product(("full", "classification", "none"), (False, True)):
+            with self.subTest(item_hints=item_hints, disguise_traps=disguise_traps):
+                formatter = CivVItemFormatter(1, PLAYER_NAMES, disguise_traps, item_hints)
+
+                # Format all items twice, such that the second pass uses the memoized strings
+                for item in items * 2:
+                    self.assertEqual(formatter.format_item(item), format_item(item, 1, disguise_traps, item_hints))
+                    self.assertEqual(formatter.format_flag(item), format_flag(item, disguise_traps, item_hints))
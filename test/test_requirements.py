@@ -0,0 +1,60 @@
+import unittest
+from types import SimpleNamespace
+
+from worlds.civv.items import PROGRESSIVE_TECH_ITEMS, TECH_ITEMS, ItemRequirements
+
+GROWTH = PROGRESSIVE_TECH_ITEMS["Growth"]
+GROWTH_TECHS = sorted(
+    (x for x in TECH_ITEMS.values() if x.progressive_parent is GROWTH), key=lambda x: GROWTH.game_ids.index(x.game_id)
+)
+WRITING = TECH_ITEMS["Writing"]
+PROGRESSIVE_OPTIONS = SimpleNamespace(progressive_techs=True)
+NON_PROGRESSIVE_OPTIONS = SimpleNamespace(progressive_techs=False)
+
+
+class TestItemRequirements(unittest.TestCase):
+    def test_resolve(self) -> None:
+        """Tests that progression items are resolved into themselves or into counts of their progressive parent"""
+        requirements = ItemRequirements(progression={GROWTH_TECHS[0], GROWTH_TECHS[-1], WRITING})
+        self.assertEqual(requirements.resolve(NON_PROGRESSIVE_OPTIONS), {
+            GROWTH_TECHS[0].name: 1,
+            GROWTH_TECHS[-1].name: 1,
+            WRITING.name: 1,
+        })
+        self.assertEqual(requirements.resolve(PROGRESSIVE_OPTIONS), {
+            GROWTH.name: len(GROWTH_TECHS),
+            WRITING.progressive_parent.name: WRITING.progressive_parent.game_ids.index(WRITING.game_id) + 1,
+        })
+
+    def test_resolve_progressive(self) -> None:
+        """Tests that progressive requirements are only resolved if their progressive item is in use"""
+        requirements = ItemRequirements(ItemRequirements(progressive={GROWTH: 3}), progressive={GROWTH: 2})
+        self.assertEqual(requirements.resolve(PROGRESSIVE_OPTIONS), {GROWTH.name: 3})
+        self.assertEqual(requirements.resolve(NON_PROGRESSIVE_OPTIONS), {})
+
+    def test_resolve_implied(self) -> None:
+        """Tests that requirements are only stripped if the implied count is at least the required count"""
+        requirements = ItemRequirements(progression={WRITING}, progressive={GROWTH: 3})
+        self.assertEqual(requirements.resolve(PROGRESSIVE_OPTIONS, {GROWTH.name: 3}), {
+            WRITING.progressive_parent.name: WRITING.progressive_parent.game_ids.index(WRITING.game_id) + 1,
+        })
+        self.assertEqual(requirements.resolve(NON_PROGRESSIVE_OPTIONS, {GROWTH.name: 3}), {WRITING.name: 1})
+        self.assertEqual(requirements.resolve(PROGRESSIVE_OPTIONS, {GROWTH.name: 2}).get(GROWTH.name), 3)
+
+    def test_to_dnf(self) -> None:
+        """Tests that unions are resolved into all combinations of their alternatives"""
+        a, b, c = (ItemRequirements(progression={x}) for x in (GROWTH_TECHS[0], GROWTH_TECHS[1], WRITING))
+        self.assertEqual(((a | b) & c).to_dnf(NON_PROGRESSIVE_OPTIONS), [
+            {GROWTH_TECHS[0].name: 1, WRITING.name: 1},
+            {GROWTH_TECHS[1].name: 1, WRITING.name: 1},
+        ])
+
+        # Alternatives of the same progressive item are merged into the highest count per combination
+        self.assertEqual(((a | b) & a).to_dnf(PROGRESSIVE_OPTIONS), [{GROWTH.name: 1}, {GROWTH.name: 2}])
+
+    def test_to_dnf_implied(self) -> None:
+        """Tests that a union is always satisfied if any alternative is stripped entirely by the implied items"""
+        a, b = (ItemRequirements(progression={x}) for x in (GROWTH_TECHS[0], WRITING))
+        self.assertEqual((a | b).to_dnf(NON_PROGRESSIVE_OPTIONS, {WRITING.name: 1}), [{}])
+        self.assertEqual((a & b).to_dnf(NON_PROGRESSIVE_OPTIONS, {WRITING.name: 1}), [{GROWTH_TECHS[0].name: 1}])
+        self.assertTrue((a | b).create_access_rule(1, NON_PROGRESSIVE_OPTIONS, {WRITING.name: 1})(None))